@@ -2,11 +2,15 @@
 Pytest configuration and common fixtures for wellbin tests.
 
 Fixture Scope Strategy:
-- module: Immutable data (env configs, static content) - created once per module
+- session: Static literals, fixture file content, the Click runner and the shared Chrome process - created once per run
+- module: Derived paths - resolved once per module
 - function: Mutable objects or test state - fresh instance per test
 """
 
+from unittest.mock import patch
+
 import pytest
+from click.testing import CliRunner
 
 from .fixtures.medical_fixtures import (
     get_fixture_content,
@@ -14,15 +18,15 @@ from .fixtures.medical_fixtures import (
 )
 
 # ============================================================================
-# Module-scoped fixtures for immutable data (performance optimization)
+# Session/module-scoped fixtures for immutable data (performance optimization)
 # ============================================================================
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_env_config():
     """Sample environment configuration for testing.
 
-    Module-scoped because this is immutable static data.
+    Session-scoped because this is immutable static data.
     """
     return {
         "WELLBIN_EMAIL": "test@example.com",
@@ -35,11 +39,11 @@ def sample_env_config():
     }
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def invalid_env_config():
     """Invalid environment configuration for testing validation.
 
-    Module-scoped because this is immutable static data.
+    Session-scoped because this is immutable static data.
     """
     return {
         "WELLBIN_EMAIL": "your-email@example.com",  # Default invalid value
@@ -47,20 +51,57 @@ def invalid_env_config():
     }
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_pdf_content():
     """Sample PDF content for converter tests.
 
-    Module-scoped because this is immutable static data.
+    Session-scoped because this is immutable static data.
     """
     return b"%PDF-1.4 fake pdf content for testing"
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture
+def fake_pdf_factory(tmp_path, sample_pdf_content):
+    """Factory writing placeholder PDFs under tmp_path.
+
+    Function-scoped because files land in the test's own tmp_path; the bytes
+    come from the session-scoped sample_pdf_content.
+    """
+
+    def _make(relative_path: str):
+        pdf_path = tmp_path / relative_path
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        pdf_path.write_bytes(sample_pdf_content)
+        return pdf_path
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Click test runner shared by the CLI tests.
+
+    Session-scoped because CliRunner keeps no state between invoke() calls.
+    """
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_pymupdf_open():
+    """Patch the converter's PDF opener so placeholder PDF bytes can be "opened".
+
+    Function-scoped because each test gets a fresh mock document.
+    """
+    with patch("wellbin.core.converter._open_pdf") as mock_open:
+        mock_open.return_value.page_count = 1
+        yield mock_open
+
+
+@pytest.fixture(scope="session")
 def mock_study_links():
     """Sample study links for scraper tests.
 
-    Module-scoped because this is immutable static data.
+    Session-scoped because this is immutable static data.
     """
     return [
         "https://wellbin.co/study/123?type=FhirStudy",
@@ -69,70 +110,100 @@ def mock_study_links():
     ]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def medical_fixtures_dir():
     """Path to the medical test fixtures directory.
 
-    Module-scoped because the path doesn't change.
+    Session-scoped because the path doesn't change.
     """
     return get_medical_data_directory()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_lab_report_recent():
     """Recent lab report fixture content.
 
-    Module-scoped because file content is immutable during tests.
+    Session-scoped because file content is immutable during tests.
     """
     return get_fixture_content("lab", "recent")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_lab_report_older():
     """Older lab report fixture content.
 
-    Module-scoped because file content is immutable during tests.
+    Session-scoped because file content is immutable during tests.
     """
     return get_fixture_content("lab", "older")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_imaging_report_recent():
     """Recent imaging report fixture content.
 
-    Module-scoped because file content is immutable during tests.
+    Session-scoped because file content is immutable during tests.
     """
     return get_fixture_content("imaging", "recent")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def sample_imaging_report_older():
     """Older imaging report fixture content.
 
-    Module-scoped because file content is immutable during tests.
+    Session-scoped because file content is immutable during tests.
     """
     return get_fixture_content("imaging", "older")
 
 
-@pytest.fixture(scope="module")
-def all_fixture_reports():
+@pytest.fixture(scope="session")
+def all_fixture_reports(
+    sample_lab_report_recent, sample_lab_report_older, sample_imaging_report_recent, sample_imaging_report_older
+):
     """All test fixture reports as a dictionary.
 
-    Module-scoped because file content is immutable during tests.
+    Session-scoped because file content is immutable during tests; built from
+    the per-report fixtures so each file is read once per session.
     """
     return {
-        "lab_recent": get_fixture_content("lab", "recent"),
-        "lab_older": get_fixture_content("lab", "older"),
-        "imaging_recent": get_fixture_content("imaging", "recent"),
-        "imaging_older": get_fixture_content("imaging", "older"),
+        "lab_recent": sample_lab_report_recent,
+        "lab_older": sample_lab_report_older,
+        "imaging_recent": sample_imaging_report_recent,
+        "imaging_older": sample_imaging_report_older,
     }
 
 
+@pytest.fixture(scope="session")
+def shared_driver():
+    """Headless Chrome configured like the scraper's own driver.
+
+    Session-scoped because starting Chrome costs 1-2 seconds; use the
+    function-scoped ``driver`` fixture to get it with clean state.
+    """
+    from wellbin.core.scraper import WellbinMedicalDownloader
+
+    downloader = WellbinMedicalDownloader(email="test@example.com", password="testpassword", headless=True)
+    downloader.setup_driver()
+    yield downloader.driver
+    downloader.driver.quit()
+
+
 # ============================================================================
 # Function-scoped fixtures for mutable/per-test state
 # ============================================================================
 
 
+@pytest.fixture
+def driver(shared_driver):
+    """The shared Chrome driver, reset to a blank page with no cookies.
+
+    Function-scoped so every test starts from clean browser state without
+    paying for a new Chrome process.
+    """
+    shared_driver.delete_all_cookies()
+    shared_driver.get("about:blank")
+    return shared_driver
+
+
 @pytest.fixture
 def mock_study_info():
     """Sample study information for scraper tests.
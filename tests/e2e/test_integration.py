@@ -6,6 +6,7 @@ based on real data but with anonymized personal information to ensure the conver
 works correctly with medical terminology and structure.
 """
 
+import re
 from pathlib import Path
 from unittest.mock import patch
 
@@ -21,6 +22,22 @@ from wellbin.core.converter import (
     convert_structured_directories,
 )
 
+# Fixture filename patterns: YYYYMMDD-<type>-N.md
+LAB_FILENAME_RE = re.compile(r"^\d{8}-lab-\d+\.md$")
+IMAGING_FILENAME_RE = re.compile(r"^\d{8}-imaging-\d+\.md$")
+
+# Sections, units and parameters every lab report fixture should contain
+LAB_REQUIRED_TERMS = (
+    "HEMOGRAMA COMPLETO",
+    "SERIE ERITROCITARIA",
+    "SERIE LEUCOCITARIA",
+    "g/dl",
+    "mg/dl",
+    "%",
+    "Hemoglobina",
+    "GLUCOSA",
+)
+
 
 @pytest.mark.integration
 class TestMedicalDataIntegration:
@@ -57,23 +74,9 @@ class TestMedicalDataIntegration:
 
     def test_lab_report_content_structure(self, sample_lab_report_recent):
         """Test that lab reports contain expected medical terminology and structure."""
-        content = sample_lab_report_recent
-
-        # Check for lab-specific patterns
-        EXPECTED_PATTERNS["lab"]
-
-        # Should contain key lab report sections
-        assert "HEMOGRAMA COMPLETO" in content, "Should have complete blood count section"
-        assert "SERIE ERITROCITARIA" in content, "Should have red blood cell series"
-        assert "SERIE LEUCOCITARIA" in content, "Should have white blood cell series"
-
-        # Should contain measurements with units
-        for unit in ["g/dl", "mg/dl", "%"]:
-            assert unit in content, f"Should contain unit: {unit}"
+        missing = [term for term in LAB_REQUIRED_TERMS if term not in sample_lab_report_recent]
 
-        # Should contain medical parameters
-        assert "Hemoglobina" in content, "Should contain hemoglobin measurement"
-        assert "GLUCOSA" in content, "Should contain glucose measurement"
+        assert not missing, f"Lab report is missing expected terms: {missing}"
 
     def test_imaging_report_content_structure(self, sample_imaging_report_recent):
         """Test that imaging reports contain expected medical terminology and structure."""
@@ -91,60 +94,47 @@ class TestMedicalDataIntegration:
         assert "HALLAZGOS" in content or "CONCLUSION" in content, "Should contain findings or conclusion section"
 
         # Should contain anatomical references
-        anatomical_terms_found = sum(1 for term in imaging_patterns["anatomical_terms"] if term in content)
-        assert anatomical_terms_found > 0, "Should contain anatomical terminology"
+        assert any(term in content for term in imaging_patterns["anatomical_terms"]), (
+            "Should contain anatomical terminology"
+        )
 
-    def test_medical_header_detection_with_real_data(self):
+    def test_medical_header_detection_with_real_data(self, tmp_path):
         """Test header detection with patterns from real medical data."""
-        temp_dir = Path("temp_test")
-        temp_dir.mkdir(exist_ok=True)
-        output_dir = temp_dir / "output"
-
-        try:
-            converter = PDFToMarkdownConverter(str(temp_dir), str(output_dir))
-
-            # Test real patterns found in the medical data
-
-            # From lab reports - main sections
-            hemograma_span = {
-                "text": "HEMOGRAMA COMPLETO",
-                "size": 12,
-                "font": "Arial-Bold",
-            }
-            assert converter.medical_header_detector(hemograma_span) == "## "
-
-            # From imaging reports - main sections
-            resonancia_span = {
-                "text": "RESONANCIA MAGNETICA",
-                "size": 14,
-                "font": "Arial-Bold",
-            }
-            assert converter.medical_header_detector(resonancia_span) == "## "
-
-            # Subsections from lab data
-            serie_span = {"text": "SERIE ERITROCITARIA", "size": 11, "font": "Arial"}
-            # This won't match as subsection because it's not in the predefined list
-            # but it should not be a main section either
-            result = converter.medical_header_detector(serie_span)
-            assert result in ["", "### ", "#### "], f"Unexpected result: {result}"
-
-            # Parameters with colons
-            recuento_span = {
-                "text": "Recuento de Glóbulos Rojos:",
-                "size": 10,
-                "font": "Arial",
-            }
-            # This should be H4 (parameter) since it ends with : and size >= 9
-            assert converter.medical_header_detector(recuento_span) == "#### "
-
-        finally:
-            # Cleanup
-            if output_dir.exists():
-                for file in output_dir.iterdir():
-                    file.unlink()
-                output_dir.rmdir()
-            if temp_dir.exists():
-                temp_dir.rmdir()
+        converter = PDFToMarkdownConverter(tmp_path, tmp_path / "output")
+
+        # Test real patterns found in the medical data
+
+        # From lab reports - main sections
+        hemograma_span = {
+            "text": "HEMOGRAMA COMPLETO",
+            "size": 12,
+            "font": "Arial-Bold",
+        }
+        assert converter.medical_header_detector(hemograma_span) == "## "
+
+        # From imaging reports - main sections
+        resonancia_span = {
+            "text": "RESONANCIA MAGNETICA",
+            "size": 14,
+            "font": "Arial-Bold",
+        }
+        assert converter.medical_header_detector(resonancia_span) == "## "
+
+        # Subsections from lab data
+        serie_span = {"text": "SERIE ERITROCITARIA", "size": 11, "font": "Arial"}
+        # This won't match as subsection because it's not in the predefined list
+        # but it should not be a main section either
+        result = converter.medical_header_detector(serie_span)
+        assert result in ["", "### ", "#### "], f"Unexpected result: {result}"
+
+        # Parameters with colons
+        recuento_span = {
+            "text": "Recuento de Glóbulos Rojos:",
+            "size": 10,
+            "font": "Arial",
+        }
+        # This should be H4 (parameter) since it ends with : and size >= 9
+        assert converter.medical_header_detector(recuento_span) == "#### "
 
     def test_filename_pattern_validation(self):
         """Test that fixture filenames match expected patterns."""
@@ -153,14 +143,10 @@ class TestMedicalDataIntegration:
         lab_older_path = get_fixture_path("lab", "older")
 
         # Check filename patterns
-        import re
-
-        date_pattern = re.compile(r"^\d{8}-lab-\d+\.md$")
-
-        assert date_pattern.match(lab_recent_path.name), (
+        assert LAB_FILENAME_RE.match(lab_recent_path.name), (
             f"Lab recent filename should match pattern: {lab_recent_path.name}"
         )
-        assert date_pattern.match(lab_older_path.name), (
+        assert LAB_FILENAME_RE.match(lab_older_path.name), (
             f"Lab older filename should match pattern: {lab_older_path.name}"
         )
 
@@ -168,16 +154,14 @@ class TestMedicalDataIntegration:
         imaging_recent_path = get_fixture_path("imaging", "recent")
         imaging_older_path = get_fixture_path("imaging", "older")
 
-        imaging_pattern = re.compile(r"^\d{8}-imaging-\d+\.md$")
-
-        assert imaging_pattern.match(imaging_recent_path.name), (
+        assert IMAGING_FILENAME_RE.match(imaging_recent_path.name), (
             f"Imaging recent filename should match pattern: {imaging_recent_path.name}"
         )
-        assert imaging_pattern.match(imaging_older_path.name), (
+        assert IMAGING_FILENAME_RE.match(imaging_older_path.name), (
             f"Imaging older filename should match pattern: {imaging_older_path.name}"
         )
 
-    def test_converter_with_fixture_content(self, tmp_path, sample_lab_report_recent):
+    def test_converter_with_fixture_content(self, tmp_path, sample_lab_report_recent, mock_pymupdf_open):
         """Test the converter using fixture content to simulate PDF conversion."""
         # Create test input directory with a mock PDF file
         input_dir = tmp_path / "input"
@@ -192,7 +176,7 @@ class TestMedicalDataIntegration:
         converter = PDFToMarkdownConverter(str(input_dir), str(output_dir), enhanced_mode=False)
 
         # Mock pymupdf4llm to return our fixture content
-        with patch("wellbin.core.converter.pymupdf4llm.to_markdown") as mock_to_md:
+        with patch("wellbin.core.converter._to_markdown") as mock_to_md:
             # Return content similar to our fixtures but without the header (since that's added by the converter)
             fixture_lines = sample_lab_report_recent.split("\n")[7:]  # Skip the header part
             mock_content = "\n".join(fixture_lines)
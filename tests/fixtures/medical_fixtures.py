@@ -8,6 +8,8 @@ The fixtures maintain the medical structure and terminology to ensure
 realistic testing of the PDF conversion and analysis functionality.
 """
 
+import re
+from functools import cache
 from pathlib import Path
 
 # Get the directory containing this file
@@ -35,6 +37,14 @@ ALL_TEST_FILES = {
     "imaging": TEST_IMAGING_REPORTS,
 }
 
+# Fixture paths resolved once, keyed by (report_type, age)
+_REPORT_DIRS = {"lab": LAB_REPORTS_DIR, "imaging": IMAGING_REPORTS_DIR}
+_RESOLVED_PATHS = {
+    (report_type, age): _REPORT_DIRS[report_type] / filename
+    for report_type, files in ALL_TEST_FILES.items()
+    for age, filename in files.items()
+}
+
 
 def get_fixture_path(report_type: str, age: str) -> Path:
     """
@@ -50,26 +60,35 @@ def get_fixture_path(report_type: str, age: str) -> Path:
     Raises:
         ValueError: If report_type or age is invalid
     """
-    if report_type not in ALL_TEST_FILES:
-        raise ValueError(f"Invalid report_type: {report_type}. Must be one of: {list(ALL_TEST_FILES.keys())}")
-
-    if age not in ALL_TEST_FILES[report_type]:
+    try:
+        return _RESOLVED_PATHS[(report_type, age)]
+    except KeyError:
+        if report_type not in ALL_TEST_FILES:
+            raise ValueError(
+                f"Invalid report_type: {report_type}. Must be one of: {list(ALL_TEST_FILES.keys())}"
+            ) from None
         raise ValueError(
             f"Invalid age for {report_type}: {age}. Must be one of: {list(ALL_TEST_FILES[report_type].keys())}"
-        )
+        ) from None
 
-    filename = ALL_TEST_FILES[report_type][age]
 
-    if report_type == "lab":
-        return LAB_REPORTS_DIR / filename
-    else:
-        return IMAGING_REPORTS_DIR / filename
+@cache
+def _read_fixture(fixture_path: Path) -> str:
+    """
+    Read a fixture file, caching its content for the rest of the test run.
+
+    Fixtures are read-only during tests; call ``_read_fixture.cache_clear()``
+    after changing one on disk.
+    """
+    return fixture_path.read_text(encoding="utf-8")
 
 
 def get_fixture_content(report_type: str, age: str) -> str:
     """
     Get the content of a specific test fixture file.
 
+    Each fixture file is read from disk once per test run.
+
     Args:
         report_type: Either "lab" or "imaging"
         age: Either "recent" or "older"
@@ -77,8 +96,7 @@ def get_fixture_content(report_type: str, age: str) -> str:
     Returns:
         Content of the fixture file as string
     """
-    fixture_path = get_fixture_path(report_type, age)
-    return fixture_path.read_text(encoding="utf-8")
+    return _read_fixture(get_fixture_path(report_type, age))
 
 
 def list_all_fixtures() -> dict[str, list[str]]:
@@ -107,35 +125,42 @@ def get_medical_data_directory() -> Path:
 # Expected content patterns for validation
 EXPECTED_PATTERNS = {
     "lab": {
-        "headers": [
+        "headers": (
             "HEMOGRAMA COMPLETO",
             "SERIE ERITROCITARIA",
             "SERIE LEUCOCITARIA",
             "SERIE TROMBOCITARIA",
             "QUIMICA CLINICA",
-        ],
-        "measurements": ["Hemoglobina", "Hematocrito", "Glucosa", "Colesterol"],
-        "units": ["g/dl", "mg/dl", "%", "10e9/L", "10e12/L"],
+        ),
+        "measurements": ("Hemoglobina", "Hematocrito", "Glucosa", "Colesterol"),
+        "units": ("g/dl", "mg/dl", "%", "10e9/L", "10e12/L"),
     },
     "imaging": {
-        "headers": [
+        "headers": (
             "RESONANCIA MAGNETICA",
             "TOMOGRAFIA COMPUTADA",
             "HALLAZGOS",
             "CONCLUSION",
-        ],
-        "anatomical_terms": [
+        ),
+        "anatomical_terms": (
             "Menisco",
             "Ligamento",
             "Cartílago",
             "Parénquima pulmonar",
             "Mediastino",
-        ],
-        "findings": ["Sin alteraciones", "Conservado", "Normal"],
+        ),
+        "findings": ("Sin alteraciones", "Conservado", "Normal"),
     },
 }
 
 
+# One alternation per report type, so all headers are searched in a single pass
+_HEADER_PATTERNS = {
+    report_type: re.compile("|".join(map(re.escape, patterns["headers"])))
+    for report_type, patterns in EXPECTED_PATTERNS.items()
+}
+
+
 def validate_fixture_content(report_type: str, content: str) -> bool:
     """
     Validate that fixture content contains expected medical patterns.
@@ -147,14 +172,11 @@ def validate_fixture_content(report_type: str, content: str) -> bool:
     Returns:
         True if content appears to be valid medical report
     """
-    if report_type not in EXPECTED_PATTERNS:
+    if report_type not in _HEADER_PATTERNS:
         return False
 
-    patterns = EXPECTED_PATTERNS[report_type]
-
-    # Check for at least some expected headers
-    headers_found = sum(1 for header in patterns["headers"] if header in content)
-    if headers_found == 0:
+    # Check for at least one expected header
+    if not _HEADER_PATTERNS[report_type].search(content):
         return False
 
     # Check for medical report structure
@@ -12,6 +12,40 @@ from wellbin.core.converter import (
     convert_structured_directories,
 )
 
+# Two-page pymupdf4llm page_chunks payload; the second page carries a table and one word.
+# Tests only read it - pass list(PAGE_CHUNKS) where a mutable list is needed.
+PAGE_CHUNKS = (
+    {"text": "Page 1 content", "tables": [], "words": []},
+    {
+        "text": "Page 2 content",
+        "tables": [{"table": "data"}],
+        "words": [[72.0, 100.5, 96.0, 110.0, "test", 0, 0, 0]],
+    },
+)
+
+
+@pytest.fixture(scope="module")
+def shared_converter(tmp_path_factory):
+    """Standard-mode converter for tests that do not depend on its directories.
+
+    Module-scoped so the constructor (and its output mkdir) runs once.
+    """
+    conv_dir = tmp_path_factory.mktemp("conv")
+    return PDFToMarkdownConverter(conv_dir, conv_dir / "output", enhanced_mode=False)
+
+
+@pytest.fixture(scope="module")
+def structured_input_dir(tmp_path_factory):
+    """Input tree with empty lab_reports/ and imaging_reports/ subdirectories.
+
+    Module-scoped and read-only: the tests using it mock convert_all_pdfs and
+    only write under their own tmp_path.
+    """
+    input_dir = tmp_path_factory.mktemp("structured_input")
+    (input_dir / "lab_reports").mkdir()
+    (input_dir / "imaging_reports").mkdir()
+    return input_dir
+
 
 @pytest.mark.integration
 class TestPDFToMarkdownConverter:
@@ -20,37 +54,39 @@ class TestPDFToMarkdownConverter:
     def test_converter_initialization_standard_mode(self, tmp_path):
         """Test converter initialization in standard mode."""
         converter = PDFToMarkdownConverter(
-            pdf_dir=str(tmp_path),
-            output_dir=str(tmp_path / "output"),
+            pdf_dir=tmp_path,
+            output_dir=tmp_path / "output",
             enhanced_mode=False,
         )
 
         assert converter.pdf_dir == Path(tmp_path)
         assert converter.output_dir == Path(tmp_path / "output")
         assert converter.enhanced_mode is False
+        assert converter._extract == converter._extract_standard_mode
 
     def test_converter_initialization_enhanced_mode(self, tmp_path):
         """Test converter initialization in enhanced mode."""
         converter = PDFToMarkdownConverter(
-            pdf_dir=str(tmp_path),
-            output_dir=str(tmp_path / "output"),
+            pdf_dir=tmp_path,
+            output_dir=tmp_path / "output",
             enhanced_mode=True,
         )
 
         assert converter.enhanced_mode is True
+        assert converter._extract == converter._extract_enhanced_mode
 
     def test_output_directory_creation(self, tmp_path):
         """Test that output directory is created during initialization."""
         output_dir = tmp_path / "output"
         assert not output_dir.exists()
 
-        PDFToMarkdownConverter(pdf_dir=str(tmp_path), output_dir=str(output_dir), enhanced_mode=False)
+        PDFToMarkdownConverter(pdf_dir=tmp_path, output_dir=output_dir, enhanced_mode=False)
 
         assert output_dir.exists()
 
-    def test_medical_header_detector(self, tmp_path):
+    def test_medical_header_detector(self, shared_converter):
         """Test medical header detection logic."""
-        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+        converter = shared_converter
 
         # Test main sections (H2)
         main_section_span = {
@@ -77,63 +113,66 @@ class TestPDFToMarkdownConverter:
         normal_span = {"text": "Normal text", "size": 10, "font": "Arial"}
         assert converter.medical_header_detector(normal_span) == ""
 
-    @patch("wellbin.core.converter.pymupdf4llm.to_markdown")
-    def test_extract_enhanced_markdown_standard_mode(self, mock_to_markdown, tmp_path):
+    @patch("wellbin.core.converter._to_markdown")
+    def test_extract_enhanced_markdown_standard_mode(
+        self, mock_to_markdown, shared_converter, fake_pdf_factory, mock_pymupdf_open
+    ):
         """Test markdown extraction in standard mode."""
         mock_to_markdown.return_value = "# Test Markdown Content"
 
-        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), enhanced_mode=False)
-        pdf_path = tmp_path / "test.pdf"
-        pdf_path.write_bytes(b"fake pdf content")
+        converter = shared_converter
+        pdf_path = fake_pdf_factory("test.pdf")
 
         result = converter.extract_enhanced_markdown(pdf_path)
 
         assert result == "# Test Markdown Content"
         mock_to_markdown.assert_called_once()
+        mock_pymupdf_open.assert_called_once_with(pdf_path)
+        mock_pymupdf_open.return_value.close.assert_called_once()
 
-    @patch("wellbin.core.converter.pymupdf4llm.to_markdown")
-    def test_extract_enhanced_markdown_enhanced_mode(self, mock_to_markdown, tmp_path):
+    @patch("wellbin.core.converter._to_markdown")
+    def test_extract_enhanced_markdown_enhanced_mode(
+        self, mock_to_markdown, tmp_path, fake_pdf_factory, mock_pymupdf_open
+    ):
         """Test markdown extraction in enhanced mode."""
-        mock_chunks = [
-            {"text": "Page 1 content", "tables": [], "words": []},
-            {"text": "Page 2 content", "tables": [], "words": []},
-        ]
+        mock_chunks = list(PAGE_CHUNKS)
         mock_to_markdown.return_value = mock_chunks
 
-        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), enhanced_mode=True)
-        pdf_path = tmp_path / "test.pdf"
-        pdf_path.write_bytes(b"fake pdf content")
+        converter = PDFToMarkdownConverter(tmp_path, tmp_path / "output", enhanced_mode=True)
+        pdf_path = fake_pdf_factory("test.pdf")
 
         result = converter.extract_enhanced_markdown(pdf_path)
 
         assert result == mock_chunks
         mock_to_markdown.assert_called_once_with(
-            str(pdf_path),
+            mock_pymupdf_open.return_value,
             page_chunks=True,
             extract_words=True,
             ignore_images=True,
             table_strategy="lines",
             hdr_info=converter.medical_header_detector,
             margins=10,
-            show_progress=True,
+            show_progress=False,
         )
 
-    @patch("wellbin.core.converter.pymupdf4llm.to_markdown")
-    def test_extract_enhanced_markdown_exception(self, mock_to_markdown, tmp_path):
+    @patch("wellbin.core.converter._to_markdown")
+    def test_extract_enhanced_markdown_exception(
+        self, mock_to_markdown, shared_converter, fake_pdf_factory, mock_pymupdf_open
+    ):
         """Test handling of exceptions during markdown extraction."""
         mock_to_markdown.side_effect = Exception("PDF processing failed")
 
-        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
-        pdf_path = tmp_path / "test.pdf"
-        pdf_path.write_bytes(b"fake pdf content")
+        converter = shared_converter
+        pdf_path = fake_pdf_factory("test.pdf")
 
         result = converter.extract_enhanced_markdown(pdf_path)
 
         assert result is None
+        mock_pymupdf_open.return_value.close.assert_called_once()
 
     def test_save_enhanced_chunks_standard_mode(self, tmp_path):
         """Test saving chunks in standard mode."""
-        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+        converter = PDFToMarkdownConverter(tmp_path, tmp_path / "output")
         pdf_path = tmp_path / "test.pdf"
         markdown_content = "# Test Content\n\nSample markdown"
 
@@ -149,23 +188,15 @@ class TestPDFToMarkdownConverter:
 
     def test_save_enhanced_chunks_enhanced_mode(self, tmp_path):
         """Test saving chunks in enhanced mode."""
-        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+        converter = PDFToMarkdownConverter(tmp_path, tmp_path / "output")
         pdf_path = tmp_path / "test.pdf"
 
-        chunks = [
-            {"text": "Page 1 content", "tables": [], "words": []},
-            {
-                "text": "Page 2 content",
-                "tables": [{"table": "data"}],
-                "words": [{"word": "test"}],
-            },
-        ]
+        result = converter.save_enhanced_chunks(list(PAGE_CHUNKS), pdf_path)
 
-        result = converter.save_enhanced_chunks(chunks, pdf_path)
-
-        assert len(result) == 1
+        assert len(result) == 2  # Markdown plus word position sidecar
         assert result[0].name == "test.md"
-        assert result[0].exists()
+        assert result[1].name == "test.words.jsonl"
+        assert all(path.exists() for path in result)
 
         content = result[0].read_text()
         assert "# Medical Report: test" in content
@@ -176,7 +207,7 @@ class TestPDFToMarkdownConverter:
 
     def test_convert_all_pdfs_no_files(self, tmp_path):
         """Test convert_all_pdfs with no PDF files."""
-        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+        converter = PDFToMarkdownConverter(tmp_path, tmp_path / "output")
 
         result = converter.convert_all_pdfs()
 
@@ -185,20 +216,18 @@ class TestPDFToMarkdownConverter:
     def test_convert_all_pdfs_missing_directory(self, tmp_path):
         """Test convert_all_pdfs with missing input directory."""
         nonexistent_dir = tmp_path / "nonexistent"
-        converter = PDFToMarkdownConverter(str(nonexistent_dir), str(tmp_path / "output"))
+        converter = PDFToMarkdownConverter(nonexistent_dir, tmp_path / "output")
 
         result = converter.convert_all_pdfs()
 
         assert result == []
 
-    @patch.object(PDFToMarkdownConverter, "convert_pdf_to_markdown")
-    def test_convert_all_pdfs_with_files(self, mock_convert, tmp_path):
+    @patch.object(PDFToMarkdownConverter, "_convert_pdf")
+    def test_convert_all_pdfs_with_files(self, mock_convert, tmp_path, fake_pdf_factory):
         """Test convert_all_pdfs with PDF files."""
         # Create sample PDF files
-        pdf1 = tmp_path / "test1.pdf"
-        pdf2 = tmp_path / "test2.pdf"
-        pdf1.write_bytes(b"fake pdf 1")
-        pdf2.write_bytes(b"fake pdf 2")
+        fake_pdf_factory("test1.pdf")
+        fake_pdf_factory("test2.pdf")
 
         # Create output directory and mock markdown files
         output_dir = tmp_path / "output"
@@ -216,7 +245,8 @@ class TestPDFToMarkdownConverter:
 
         mock_convert.side_effect = mock_conversion_side_effect
 
-        converter = PDFToMarkdownConverter(str(tmp_path), str(output_dir))
+        # Serial path so the class-level mock records the calls in this process
+        converter = PDFToMarkdownConverter(tmp_path, output_dir, max_workers=1)
         result = converter.convert_all_pdfs()
 
         assert len(result) == 2  # Two successful conversions
@@ -227,18 +257,12 @@ class TestPDFToMarkdownConverter:
 class TestConvertStructuredDirectories:
     """Tests for convert_structured_directories function."""
 
-    def test_convert_structured_directories_all_types(self, tmp_path):
+    def test_convert_structured_directories_all_types(self, tmp_path, fake_pdf_factory):
         """Test converting all file types from structured directories."""
-        # Create input structure
+        # Create input structure with sample PDFs
         input_dir = tmp_path / "input"
-        lab_dir = input_dir / "lab_reports"
-        imaging_dir = input_dir / "imaging_reports"
-        lab_dir.mkdir(parents=True)
-        imaging_dir.mkdir(parents=True)
-
-        # Create sample PDFs
-        (lab_dir / "test_lab.pdf").write_bytes(b"fake lab pdf")
-        (imaging_dir / "test_imaging.pdf").write_bytes(b"fake imaging pdf")
+        fake_pdf_factory("input/lab_reports/test_lab.pdf")
+        fake_pdf_factory("input/imaging_reports/test_imaging.pdf")
 
         output_dir = tmp_path / "output"
 
@@ -246,20 +270,14 @@ class TestConvertStructuredDirectories:
         with patch.object(PDFToMarkdownConverter, "convert_all_pdfs") as mock_convert:
             mock_convert.return_value = [Path("test.md")]
 
-            result = convert_structured_directories(str(input_dir), str(output_dir), "all", enhanced_mode=True)
+            result = convert_structured_directories(input_dir, output_dir, "all", enhanced_mode=True)
 
             assert len(result) == 2  # Both directories processed
             assert mock_convert.call_count == 2
 
-    def test_convert_structured_directories_filtered(self, tmp_path):
+    def test_convert_structured_directories_filtered(self, tmp_path, structured_input_dir):
         """Test converting with file type filter."""
-        # Create input structure
-        input_dir = tmp_path / "input"
-        lab_dir = input_dir / "lab_reports"
-        imaging_dir = input_dir / "imaging_reports"
-        lab_dir.mkdir(parents=True)
-        imaging_dir.mkdir(parents=True)
-
+        input_dir = structured_input_dir
         output_dir = tmp_path / "output"
 
         # Mock the converter
@@ -267,8 +285,8 @@ class TestConvertStructuredDirectories:
             mock_convert.return_value = [Path("test.md")]
 
             result = convert_structured_directories(
-                str(input_dir),
-                str(output_dir),
+                input_dir,
+                output_dir,
                 "lab",  # Only lab reports
                 enhanced_mode=False,
             )
@@ -277,12 +295,27 @@ class TestConvertStructuredDirectories:
             assert len(result) == 1
             assert mock_convert.call_count == 1
 
+    def test_convert_structured_directories_runs_sequentially(self, tmp_path, structured_input_dir):
+        """Test each subdirectory is converted in turn with the full worker budget."""
+        input_dir = structured_input_dir
+        seen_workers = []
+
+        def record_workers(converter):
+            seen_workers.append(converter.max_workers)
+            return [converter.output_dir / "report.md"]
+
+        with patch.object(PDFToMarkdownConverter, "convert_all_pdfs", autospec=True, side_effect=record_workers):
+            result = convert_structured_directories(input_dir, tmp_path / "output", "all", max_workers=4)
+
+        assert seen_workers == [4, 4]
+        assert len(result) == 2
+
     def test_convert_structured_directories_no_subdirs(self, tmp_path):
         """Test converting with no matching subdirectories."""
         input_dir = tmp_path / "input"
         input_dir.mkdir()
         output_dir = tmp_path / "output"
 
-        result = convert_structured_directories(str(input_dir), str(output_dir), "all", enhanced_mode=False)
+        result = convert_structured_directories(input_dir, output_dir, "all", enhanced_mode=False)
 
         assert result == []
@@ -2,12 +2,16 @@
 Tests for wellbin.core.scraper module.
 """
 
+import os
 from collections import defaultdict
+from dataclasses import replace
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 import requests
 from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
 
 from wellbin.core.date_parser import (
     extract_date_from_study_id,
@@ -74,6 +78,13 @@ class TestWellbinMedicalDownloader:
         # Check that headless option was added
         options_call = mock_chrome.call_args[1]["options"]
         assert any("--headless" in str(arg) for arg in options_call.arguments)
+        # Explicit waits only; an implicit wait would stack on top of them
+        mock_driver.implicitly_wait.assert_not_called()
+
+        # Headless runs return from get() at DOMContentLoaded and skip images
+        assert options_call.page_load_strategy == "eager"
+        assert "--blink-settings=imagesEnabled=false" in options_call.arguments
+        assert options_call.experimental_options["prefs"] == downloader.HEADLESS_CHROME_PREFS
 
     @patch("wellbin.core.scraper.webdriver.Chrome")
     def test_setup_driver_visible(self, mock_chrome, tmp_path):
@@ -94,6 +105,7 @@ class TestWellbinMedicalDownloader:
         # Should not have headless argument
         options_call = mock_chrome.call_args[1]["options"]
         assert not any("--headless" in str(arg) for arg in options_call.arguments)
+        assert "--blink-settings=imagesEnabled=false" not in options_call.arguments
 
     def test_parse_date_from_text(self, downloader):
         """Test date parsing from various text formats using module-level function."""
@@ -180,6 +192,40 @@ class TestWellbinMedicalDownloader:
         assert pdf_path.exists()
         assert pdf_path.read_bytes() == b"fake pdf content"
 
+    @patch("wellbin.core.scraper.requests.Session.get")
+    def test_download_pdf_small_body_single_read(self, mock_get, downloader, mock_study_info):
+        """Test a small body with a known Content-Length is read and written in one call."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": "16"}
+        mock_response.raw.read.return_value = b"fake pdf content"
+        mock_get.return_value = mock_response
+
+        result = downloader.download_pdf(mock_study_info)
+
+        assert Path(result).read_bytes() == b"fake pdf content"
+        mock_response.raw.read.assert_called_once_with(decode_content=True)
+        mock_response.iter_content.assert_not_called()
+
+    @patch("wellbin.core.scraper.requests.Session.get")
+    def test_download_pdf_interrupted_leaves_no_part_file(self, mock_get, downloader, mock_study_info, tmp_path):
+        """Test a body that fails mid-stream leaves neither the PDF nor its .part file."""
+
+        def broken_body(chunk_size):
+            yield b"partial"
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.iter_content.side_effect = broken_body
+        mock_get.return_value = mock_response
+
+        result = downloader.download_pdf(mock_study_info)
+
+        assert result is None
+        assert not [p for p in tmp_path.rglob("*") if p.is_file() and p.suffix in {".pdf", ".part"}]
+
     @patch("wellbin.core.scraper.requests.Session.get")
     def test_download_pdf_http_error(self, mock_get, downloader, mock_study_info):
         """Test PDF download with HTTP error."""
@@ -201,6 +247,88 @@ class TestWellbinMedicalDownloader:
 
         assert result is None
 
+    @patch("wellbin.core.scraper.requests.Session.get")
+    def test_download_pdf_not_modified(self, mock_get, downloader, mock_study_info, tmp_path):
+        """Test a 304 reply keeps the previously downloaded file without rewriting it."""
+        existing = tmp_path / "lab_reports" / "20240604-lab-0.pdf"
+        existing.parent.mkdir()
+        existing.write_bytes(b"previous content")
+        downloader.manifest[mock_study_info.study_url] = {
+            "path": str(existing),
+            "sha256": "abc",
+            "etag": '"v1"',
+            "last_modified": "",
+        }
+        mock_response = Mock()
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        result = downloader.download_pdf(mock_study_info)
+
+        assert result == str(existing)
+        assert existing.read_bytes() == b"previous content"
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()  # Connection goes back to the pool
+
+    @patch("wellbin.core.scraper.requests.Session.get")
+    def test_download_pdf_http_error_releases_connection(self, mock_get, downloader, mock_study_info):
+        """Test a failed streamed response is closed rather than left to the garbage collector."""
+        mock_response = Mock()
+        mock_response.status_code = 404
+        mock_response.raise_for_status.side_effect = requests.HTTPError("404", response=mock_response)
+        mock_get.return_value = mock_response
+
+        result = downloader.download_pdf(mock_study_info)
+
+        assert result is None
+        mock_response.close.assert_called_once()
+
+    @patch("wellbin.core.scraper.requests.Session.get")
+    def test_download_pdf_unchanged_content_keeps_mtime(self, mock_get, downloader, mock_study_info):
+        """Test re-downloading identical bytes leaves the existing file untouched."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"fake pdf content"]
+        mock_response.headers = {"ETag": '"v1"'}
+        mock_get.return_value = mock_response
+
+        downloader._load_manifest()
+        first = downloader.download_pdf(mock_study_info, filename="20240604-lab-0.pdf")
+        os.utime(first, (0, 0))
+        second = downloader.download_pdf(mock_study_info, filename="20240604-lab-0.pdf")
+        downloader._save_manifest()
+
+        assert first == second
+        assert os.stat(second).st_mtime == 0
+        assert not os.path.exists(f"{second}.part")
+        assert (Path(downloader.output_dir) / downloader.MANIFEST_FILENAME).exists()
+
+    @patch("wellbin.core.scraper.requests.Session.get")
+    def test_download_all_pdfs_concurrently(self, mock_get, downloader, mock_study_info, capsys):
+        """Test concurrent downloads keep filenames and output in submission order."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"fake pdf content"]
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+        downloader.date_counters = defaultdict(int)
+        downloader.max_downloads = 3
+        pdf_links = [replace(mock_study_info, study_url=f"https://wellbin.co/study/{i}") for i in range(3)]
+
+        with patch("wellbin.core.scraper.time.sleep") as mock_sleep:
+            results = downloader._download_all_pdfs(pdf_links)
+
+        assert mock_sleep.call_count == 3  # Every worker download is still rate limited
+
+        assert [Path(result.local_path).name for result in results] == [
+            "20240604-lab-0.pdf",
+            "20240604-lab-1.pdf",
+            "20240604-lab-2.pdf",
+        ]
+        stdout = capsys.readouterr().out
+        assert stdout.index("[1/3]") < stdout.index("[2/3]") < stdout.index("[3/3]")
+
     @patch.object(WellbinMedicalDownloader, "login")
     @patch.object(WellbinMedicalDownloader, "get_study_links")
     @patch.object(WellbinMedicalDownloader, "get_pdf_from_study")
@@ -242,6 +370,32 @@ class TestWellbinMedicalDownloader:
         assert mock_get_pdf.call_count == len(mock_study_links)
         assert mock_download.call_count == len(mock_study_links)
 
+    @patch.object(WellbinMedicalDownloader, "login", return_value=True)
+    @patch.object(WellbinMedicalDownloader, "get_study_links", return_value=["https://wellbin.co/study/1"])
+    @patch.object(WellbinMedicalDownloader, "get_pdf_from_study")
+    def test_scrape_studies_closes_browser_before_downloads(
+        self, mock_get_pdf, mock_get_links, mock_login, downloader, mock_study_info
+    ):
+        """Test the browser is released and its cookies handed over before downloading."""
+        mock_driver = Mock()
+        mock_driver.get_cookies.return_value = [
+            {"name": "session", "value": "abc", "domain": "wellbin.co", "path": "/"},
+        ]
+        downloader.driver = mock_driver
+        mock_get_pdf.return_value = [mock_study_info]
+
+        def check_browser_closed(pdf_info, *args):
+            mock_driver.quit.assert_called_once()
+            assert downloader.driver is None
+            return "/path/to/downloaded.pdf"
+
+        with patch.object(downloader, "download_pdf", side_effect=check_browser_closed):
+            result = downloader.scrape_studies()
+
+        assert len(result) == 1
+        assert downloader.session.cookies.get("session", domain="wellbin.co") == "abc"
+        mock_driver.quit.assert_called_once()  # Not quit again during cleanup
+
     @patch.object(WellbinMedicalDownloader, "login")
     def test_scrape_studies_login_failure(self, mock_login, downloader):
         """Test scraping with login failure."""
@@ -295,28 +449,6 @@ class TestWellbinMedicalDownloader:
         assert is_valid_date(2099, 6, 4) is True  # Year within range
         assert is_valid_date(2100, 6, 4) is False  # Year too new (limit is 2099)
 
-    def test_sanitize_xpath_string(self, downloader):
-        """Test XPath string sanitization."""
-        # Test single quotes - should wrap in double quotes
-        result = downloader._sanitize_xpath_string("test'value")
-        assert result == '"test\'value"'
-
-        # Test double quotes - should wrap in single quotes
-        result = downloader._sanitize_xpath_string('test"value')
-        assert result == "'test\"value'"
-
-        # Test no quotes - should wrap in single quotes
-        result = downloader._sanitize_xpath_string("testvalue")
-        assert result == "'testvalue'"
-
-        # Test both single and double quotes - should use concat()
-        result = downloader._sanitize_xpath_string("test'value\"mixed")
-        assert "concat" in result
-
-        # Test special characters (should be preserved)
-        result = downloader._sanitize_xpath_string("test/value?param=1")
-        assert "test/value?param=1" in result
-
     def test_parse_date_invalid_dates_rejected(self, downloader):
         """Test that invalid dates are rejected even if pattern matches."""
         # Feb 30 should be rejected
@@ -465,6 +597,20 @@ class TestWellbinMedicalDownloader:
 
         assert result is False
 
+    @patch("wellbin.core.scraper.webdriver.Chrome")
+    def test_login_failure_error_banner(self, mock_chrome, downloader):
+        """Test login stops waiting as soon as an error banner appears."""
+        mock_driver = Mock()
+        mock_chrome.return_value = mock_driver
+        mock_driver.find_element.side_effect = [Mock(), Mock(), Mock()]
+        mock_driver.find_elements.return_value = [Mock()]  # Error banner present
+        mock_driver.current_url = "https://wellbin.co/login"
+
+        result = downloader.login()
+
+        assert result is False
+        mock_driver.find_elements.assert_called_with(By.CSS_SELECTOR, downloader.LOGIN_ERROR_SELECTOR)
+
     @patch("wellbin.core.scraper.webdriver.Chrome")
     def test_login_failure_missing_element(self, mock_chrome, downloader):
         """Test login failure when form elements cannot be found."""
@@ -485,15 +631,12 @@ class TestWellbinMedicalDownloader:
         mock_chrome.return_value = mock_driver
         downloader.setup_driver()
 
-        # Create mock links with different study types
-        fhir_link = Mock()
-        fhir_link.get_attribute.return_value = "https://wellbin.co/study/123?type=FhirStudy"
-
-        dicom_link = Mock()
-        dicom_link.get_attribute.return_value = "https://wellbin.co/study/456?type=DicomStudy"
+        # Hrefs with different study types, as returned by the in-browser link query
+        fhir_link = "https://wellbin.co/study/123?type=FhirStudy"
+        dicom_link = "https://wellbin.co/study/456?type=DicomStudy"
 
-        # Mock finding links
-        mock_driver.find_elements.return_value = [fhir_link, dicom_link]
+        # Mock the single link query (plus a non-study link that must be ignored)
+        mock_driver.execute_script.return_value = [fhir_link, dicom_link, "https://wellbin.co/profile"]
 
         # Test with FhirStudy filter
         downloader.study_types = ["FhirStudy"]
@@ -502,6 +645,7 @@ class TestWellbinMedicalDownloader:
         # Should only get FhirStudy
         assert len(links) == 1
         assert "type=FhirStudy" in links[0]
+        mock_driver.execute_script.assert_called_once_with(downloader.LINK_HREFS_SCRIPT)
 
     @patch("wellbin.core.scraper.webdriver.Chrome")
     def test_get_study_links_filtering_all_types(self, mock_chrome, downloader):
@@ -510,14 +654,11 @@ class TestWellbinMedicalDownloader:
         mock_chrome.return_value = mock_driver
         downloader.setup_driver()
 
-        # Create mock links with different study types
-        fhir_link = Mock()
-        fhir_link.get_attribute.return_value = "https://wellbin.co/study/123?type=FhirStudy"
+        # Hrefs with different study types, as returned by the in-browser link query
+        fhir_link = "https://wellbin.co/study/123?type=FhirStudy"
+        dicom_link = "https://wellbin.co/study/456?type=DicomStudy"
 
-        dicom_link = Mock()
-        dicom_link.get_attribute.return_value = "https://wellbin.co/study/456?type=DicomStudy"
-
-        mock_driver.find_elements.return_value = [fhir_link, dicom_link]
+        mock_driver.execute_script.return_value = [fhir_link, dicom_link]
 
         # Test with 'all' filter
         downloader.study_types = ["all"]
@@ -533,14 +674,8 @@ class TestWellbinMedicalDownloader:
         mock_chrome.return_value = mock_driver
         downloader.setup_driver()
 
-        # Create 10 mock links
-        mock_links = []
-        for i in range(10):
-            link = Mock()
-            link.get_attribute.return_value = f"https://wellbin.co/study/{i}?type=FhirStudy"
-            mock_links.append(link)
-
-        mock_driver.find_elements.return_value = mock_links
+        # Create 10 study hrefs
+        mock_driver.execute_script.return_value = [f"https://wellbin.co/study/{i}?type=FhirStudy" for i in range(10)]
 
         # Set limit to 5
         downloader.limit_studies = 5
@@ -549,6 +684,38 @@ class TestWellbinMedicalDownloader:
         # Should only get 5
         assert len(links) == 5
 
+    def test_extract_dates_for_studies_single_snapshot(self, downloader):
+        """Test study dates are parsed from one snapshot of the explorer page."""
+        downloader.driver = Mock()
+        downloader.driver.execute_script.return_value = [
+            ["https://wellbin.co/study/1?type=FhirStudy", "Hemograma 15/06/2023"],
+            ["https://wellbin.co/study/2?type=FhirStudy", "No date here"],
+        ]
+
+        downloader.extract_dates_for_studies(
+            ["https://wellbin.co/study/1?type=FhirStudy", "https://wellbin.co/study/2?type=FhirStudy"]
+        )
+
+        assert downloader.study_dates["https://wellbin.co/study/1?type=FhirStudy"] == "20230615"
+        assert downloader.study_dates["https://wellbin.co/study/2?type=FhirStudy"] == "20240101"  # Fallback
+        downloader.driver.execute_script.assert_called_once()
+        downloader.driver.find_elements.assert_not_called()
+
+    def test_find_pdf_download_links_single_query(self, downloader):
+        """Test the S3 download link is read with one in-browser query."""
+        downloader.driver = Mock()
+        downloader.driver.execute_script.return_value = [
+            ["Descargar estudio", "https://wellbin-uploads.s3.amazonaws.com/report.pdf?sig=abc"],
+        ]
+
+        pdfs = downloader._find_pdf_download_links("https://wellbin.co/study/1?type=FhirStudy", "FhirStudy", "20240101")
+
+        assert len(pdfs) == 1
+        assert pdfs[0].text == "Descargar estudio"
+        assert pdfs[0].url.startswith("https://wellbin-uploads.s3")
+        downloader.driver.execute_script.assert_called_once_with(downloader.S3_LINKS_SCRIPT)
+        downloader.driver.find_elements.assert_not_called()
+
     @patch("wellbin.core.scraper.requests.Session.get")
     def test_download_pdf_http_400_error(self, mock_get, downloader, mock_study_info):
         """Test PDF download with 400 Bad Request error."""
@@ -207,3 +207,51 @@ class TestResolveConvertConfig:
         assert config.preserve_structure is True  # From env
         assert config.enhanced_mode is True  # From CLI
         assert config.enhanced_source == "CLI"
+
+    @patch("wellbin.commands.convert.get_env_or_default")
+    def test_no_cache_cli_flag(self, mock_get_env) -> None:
+        """Test --no-cache disables the extraction cache regardless of env."""
+        mock_get_env.return_value = True
+
+        config = resolve_config(
+            input_dir=None,
+            output_dir=None,
+            preserve_structure=False,
+            file_type=None,
+            enhanced_mode=False,
+            use_cache=False,
+        )
+
+        assert config.use_cache is False
+        assert config.cache_source == "CLI"
+
+    @patch.dict("os.environ", {}, clear=True)
+    def test_cache_off_by_default(self) -> None:
+        """Test the extraction cache is opt-in."""
+        config = resolve_config(
+            input_dir=None,
+            output_dir=None,
+            preserve_structure=False,
+            file_type=None,
+            enhanced_mode=False,
+        )
+
+        assert config.use_cache is False
+        assert config.cache_source == "ENV/Default"
+
+    @patch("wellbin.commands.convert.get_env_or_default")
+    def test_force_cli_flag(self, mock_get_env) -> None:
+        """Test --force is taken from the CLI when given."""
+        mock_get_env.return_value = False
+
+        config = resolve_config(
+            input_dir=None,
+            output_dir=None,
+            preserve_structure=False,
+            file_type=None,
+            enhanced_mode=False,
+            force=True,
+        )
+
+        assert config.force is True
+        assert config.force_source == "CLI"
@@ -3,15 +3,22 @@
 Focus on error handling paths and edge cases to improve coverage.
 """
 
+import json
+import os
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from wellbin.core import converter as converter_module
 from wellbin.core.converter import (
     ConversionStats,
     PageChunk,
     PDFToMarkdownConverter,
+    WordColumns,
+    prune_cache,
 )
 from wellbin.core.exceptions import (
     FileWriteError,
@@ -101,6 +108,20 @@ class TestConverterPDFSizeCheck:
         # Should not raise
         converter._check_pdf_size(nonexistent)
 
+    def test_enhanced_mode_warns_for_many_pages(self, tmp_path: Path, mock_pymupdf_open: Mock) -> None:
+        """Test enhanced extraction warns when the opened document exceeds the page limit."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_pages_enhanced=5)
+        mock_pymupdf_open.return_value.page_count = 6
+
+        with (
+            patch("wellbin.core.converter._to_markdown", return_value=[]),
+            patch.object(converter.out, "warning") as mock_warning,
+        ):
+            converter._extract_enhanced_mode(tmp_path / "long.pdf")
+
+        mock_warning.assert_called_once()
+        assert "6 pages" in mock_warning.call_args[0][0]
+
 
 @pytest.mark.unit
 class TestConverterWriteMarkdown:
@@ -139,6 +160,90 @@ class TestConverterWriteMarkdown:
 
             assert "Failed to write" in str(exc_info.value)
 
+    def test_write_markdown_parts(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test _write_markdown_file writes iterable parts in order."""
+        output_path = tmp_path / "output" / "test.md"
+
+        converter._write_markdown_file(output_path, ["# Title\n", "body", "\nend"])
+
+        assert output_path.read_text(encoding="utf-8") == "# Title\nbody\nend"
+
+    def test_write_markdown_counts_bytes(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test the returned size matches the encoded file size."""
+        output_path = tmp_path / "output" / "test.md"
+
+        size = converter._write_markdown_file(output_path, "Hemoglobina 📄")
+
+        assert size == output_path.stat().st_size
+        assert converter.bytes_written == size
+
+    def test_write_markdown_leaves_no_temp_file(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test the output is renamed into place without a leftover temp file."""
+        output_dir = tmp_path / "output"  # Created by the converter fixture
+        (output_dir / "test.md").write_text("old", encoding="utf-8")
+
+        converter._write_markdown_file(output_dir / "test.md", "new")
+
+        assert [p.name for p in output_dir.iterdir()] == ["test.md"]
+        assert (output_dir / "test.md").read_text(encoding="utf-8") == "new"
+
+    def test_failed_write_keeps_previous_output(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test an interrupted write leaves the previous file intact."""
+        output_dir = tmp_path / "output"  # Created by the converter fixture
+        (output_dir / "test.md").write_text("old", encoding="utf-8")
+
+        def parts() -> Iterator[str]:
+            yield "partial"
+            raise OSError("Disk full")
+
+        with pytest.raises(FileWriteError):
+            converter._write_markdown_file(output_dir / "test.md", parts())
+
+        assert [p.name for p in output_dir.iterdir()] == ["test.md"]
+        assert (output_dir / "test.md").read_text(encoding="utf-8") == "old"
+
+    def test_word_positions_go_to_sidecar(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test word positions are written as JSONL next to the markdown."""
+        words = [[1.0, 2.0, 3.0, 4.0, "HDL", 0, 0, 0], [5.0, 2.0, 9.0, 4.0, "LDL", 0, 0, 1]]
+        chunks: list[PageChunk] = [{"text": "Page", "tables": [], "words": words}]
+
+        md_path, words_path = converter.save_enhanced_chunks(chunks, tmp_path / "report.pdf")
+
+        assert words_path.name == "report.words.jsonl"
+        assert words_path.read_text(encoding="utf-8").splitlines() == [
+            '[1.0,2.0,3.0,4.0,"HDL",0,0,0]',
+            '[5.0,2.0,9.0,4.0,"LDL",0,0,1]',
+        ]
+        content = md_path.read_text(encoding="utf-8")
+        assert "File: report.words.jsonl" in content
+        assert "HDL" not in content
+
+    def test_page_sections_are_separated(self, converter: PDFToMarkdownConverter) -> None:
+        """Test page parts place a separator between, but not around, pages."""
+        chunks: list[PageChunk] = [
+            {"text": "One", "tables": [], "words": []},
+            {"text": "Two", "tables": [], "words": []},
+        ]
+
+        parts, _ = converter._build_enhanced_document(chunks, "report")
+
+        assert parts.count(converter_module.PAGE_SEPARATOR) == 1
+        assert parts[2] == "One" and parts[-1] == "Two"
+
+    def test_enhanced_header_totals(self, converter: PDFToMarkdownConverter) -> None:
+        """Test header totals are gathered in the same pass as the pages."""
+        chunks: list[PageChunk] = [
+            {"text": "One", "tables": [{"rows": 2}], "words": [[0.0, 0.0, 1.0, 1.0, "a", 0, 0, 0]]},
+            {"text": "Two", "tables": [{"rows": 1}, {"rows": 3}], "words": []},
+        ]
+
+        parts, all_words = converter._build_enhanced_document(chunks, "report")
+
+        assert "**Total Pages:** 2" in parts[0]
+        assert "**Tables Found:** 3 tables detected" in parts[0]
+        assert "**Words Extracted:** 1 words" in parts[0]
+        assert len(all_words) == 1
+
 
 @pytest.mark.unit
 class TestConverterPDFConversion:
@@ -220,6 +325,410 @@ class TestConverterPDFConversion:
             assert result is None
 
 
+@pytest.mark.unit
+class TestConverterIncrementalSkip:
+    """Tests for skipping PDFs whose markdown is already up to date."""
+
+    @pytest.fixture
+    def pdf_and_output(self, tmp_path: Path) -> tuple[Path, Path]:
+        """Create a PDF and a standard-mode output file that is newer than it."""
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"fake pdf content")
+        output_path = tmp_path / "output" / "report.md"
+        output_path.parent.mkdir()
+        output_path.write_text("# Report")
+        converter = PDFToMarkdownConverter(tmp_path, output_path.parent)
+        converter.manifest["report"] = converter._output_settings()
+        converter._save_manifest()
+        os.utime(pdf_path, (1_000, 1_000))
+        os.utime(output_path, (2_000, 2_000))
+        return pdf_path, output_path
+
+    def test_up_to_date_output_is_skipped(self, tmp_path: Path, pdf_and_output: tuple[Path, Path]) -> None:
+        """Test a PDF older than its markdown is not re-extracted."""
+        pdf_path, output_path = pdf_and_output
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+
+        with patch.object(converter, "extract_enhanced_markdown") as mock_extract:
+            result = converter.convert_pdf_to_markdown(pdf_path)
+
+        assert result == [output_path]
+        assert converter._up_to_date_outputs(pdf_path) == ([output_path], len("# Report"))
+        mock_extract.assert_not_called()
+
+    def test_modified_pdf_is_converted(self, tmp_path: Path, pdf_and_output: tuple[Path, Path]) -> None:
+        """Test a PDF newer than its markdown is converted again."""
+        pdf_path, _ = pdf_and_output
+        os.utime(pdf_path, (3_000, 3_000))
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+
+        with patch.object(converter, "extract_enhanced_markdown", return_value=None) as mock_extract:
+            converter.convert_pdf_to_markdown(pdf_path)
+
+        mock_extract.assert_called_once_with(pdf_path)
+
+    def test_empty_output_is_converted(self, tmp_path: Path, pdf_and_output: tuple[Path, Path]) -> None:
+        """Test an empty markdown file does not count as up to date."""
+        pdf_path, output_path = pdf_and_output
+        output_path.write_bytes(b"")
+        os.utime(output_path, (2_000, 2_000))
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+
+        with patch.object(converter, "extract_enhanced_markdown", return_value=None) as mock_extract:
+            converter.convert_pdf_to_markdown(pdf_path)
+
+        mock_extract.assert_called_once_with(pdf_path)
+
+    def test_mode_change_is_converted(self, tmp_path: Path, pdf_and_output: tuple[Path, Path]) -> None:
+        """Test markdown from standard mode is not reused for an enhanced run."""
+        pdf_path, _ = pdf_and_output
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), enhanced_mode=True)
+
+        with patch.object(converter, "extract_enhanced_markdown", return_value=None) as mock_extract:
+            converter.convert_pdf_to_markdown(pdf_path)
+
+        mock_extract.assert_called_once_with(pdf_path)
+
+    def test_output_missing_from_manifest_is_converted(self, tmp_path: Path, pdf_and_output: tuple[Path, Path]) -> None:
+        """Test markdown the manifest does not account for is converted again."""
+        pdf_path, _ = pdf_and_output
+        (tmp_path / "output" / ".convert-manifest.json").unlink()
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+
+        with patch.object(converter, "extract_enhanced_markdown", return_value=None) as mock_extract:
+            converter.convert_pdf_to_markdown(pdf_path)
+
+        mock_extract.assert_called_once_with(pdf_path)
+
+    def test_batch_records_settings_and_drops_stale_words(self, tmp_path: Path) -> None:
+        """Test a standard batch records its outputs in one manifest and removes an old words sidecar."""
+        (tmp_path / "report.pdf").write_bytes(b"fake pdf content")
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=1)
+        stale_words = tmp_path / "output" / "report.words.jsonl"
+        stale_words.write_text("[]\n")
+
+        with patch.object(converter, "extract_enhanced_markdown", return_value="# Report"):
+            converter.convert_all_pdfs()
+
+        assert not stale_words.exists()
+        manifest = json.loads((tmp_path / "output" / ".convert-manifest.json").read_text())
+        assert manifest == {"report": converter._output_settings()}
+        assert sorted(p.name for p in (tmp_path / "output").iterdir()) == [".convert-manifest.json", "report.md"]
+
+    def test_unchanged_rerun_leaves_manifest_alone(self, tmp_path: Path, pdf_and_output: tuple[Path, Path]) -> None:
+        """Test a batch that only skips PDFs does not rewrite the manifest."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=1)
+
+        with patch.object(converter, "_save_manifest") as mock_save:
+            converter.convert_all_pdfs()
+
+        mock_save.assert_not_called()
+
+    def test_force_converts_up_to_date_pdf(self, tmp_path: Path, pdf_and_output: tuple[Path, Path]) -> None:
+        """Test force=True ignores the up-to-date check."""
+        pdf_path, _ = pdf_and_output
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), force=True)
+
+        with patch.object(converter, "extract_enhanced_markdown", return_value=None) as mock_extract:
+            converter.convert_pdf_to_markdown(pdf_path)
+
+        mock_extract.assert_called_once_with(pdf_path)
+
+
+@pytest.mark.unit
+class TestConverterBatchWorkers:
+    """Tests for process pool fan-out in batch conversion."""
+
+    def test_max_workers_defaults_to_cpu_count(self, tmp_path: Path) -> None:
+        """Test max_workers falls back to the CPU count when not given."""
+        with patch("wellbin.core.converter.os.cpu_count", return_value=6):
+            converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+
+        assert converter.max_workers == 6
+
+    def test_single_worker_converts_in_process(self, tmp_path: Path) -> None:
+        """Test max_workers=1 never starts a process pool."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=1)
+        pdfs = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+
+        with (
+            patch("wellbin.core.converter.ProcessPoolExecutor") as mock_pool,
+            patch.object(converter, "_convert_pdf", return_value=None) as mock_convert,
+        ):
+            results = list(converter._convert_batch(pdfs))
+
+        mock_pool.assert_not_called()
+        assert mock_convert.call_count == 2
+        assert results == [(None, 0, False), (None, 0, False)]
+
+    def test_multiple_workers_use_process_pool(self, tmp_path: Path) -> None:
+        """Test batches are mapped over a pool capped at the number of files."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=8)
+        pdfs = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+        expected = [([tmp_path / "a.md"], 120), (None, 0)]
+
+        with patch("wellbin.core.converter.ProcessPoolExecutor") as mock_pool:
+            executor = mock_pool.return_value.__enter__.return_value
+            executor.submit.side_effect = [Mock(**{"result.return_value": (*r, "")}) for r in expected]
+            results = list(converter._convert_batch(pdfs))
+
+        assert mock_pool.call_args.kwargs["max_workers"] == 2
+        assert executor.submit.call_count == 2
+        executor.submit.assert_any_call(converter_module._convert_one, pdfs[0])
+        assert results == [(*r, False) for r in expected]
+
+    def test_up_to_date_pdfs_do_not_start_pool(self, tmp_path: Path) -> None:
+        """Test a batch with at most one stale PDF converts in-process."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=8)
+        pdfs = [tmp_path / "a.pdf", tmp_path / "b.pdf", tmp_path / "c.pdf"]
+        outputs = {pdfs[0]: ([tmp_path / "output" / "a.md"], 5), pdfs[1]: ([tmp_path / "output" / "b.md"], 7)}
+
+        with (
+            patch("wellbin.core.converter.ProcessPoolExecutor") as mock_pool,
+            patch.object(converter, "_up_to_date_outputs", side_effect=outputs.get),
+            patch.object(converter, "_convert_pdf", return_value=None) as mock_convert,
+        ):
+            results = list(converter._convert_batch(pdfs))
+
+        mock_pool.assert_not_called()
+        mock_convert.assert_called_once_with(pdfs[2])  # Up-to-date PDFs are not checked twice
+        assert results == [(*outputs[pdfs[0]], True), (*outputs[pdfs[1]], True), (None, 0, False)]
+
+    def test_up_to_date_pdfs_skip_the_pool(self, tmp_path: Path) -> None:
+        """Test only stale PDFs are submitted to the pool and results stay in order."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=8)
+        pdfs = [tmp_path / "a.pdf", tmp_path / "b.pdf", tmp_path / "c.pdf"]
+        fresh = [tmp_path / "output" / "b.md"]
+
+        with (
+            patch("wellbin.core.converter.ProcessPoolExecutor") as mock_pool,
+            patch.object(converter, "_up_to_date_outputs", side_effect={pdfs[1]: (fresh, 9)}.get),
+            patch.object(converter, "_convert_pdf") as mock_convert,
+        ):
+            executor = mock_pool.return_value.__enter__.return_value
+            executor.submit.side_effect = lambda fn, path: Mock(**{"result.return_value": ([path], 1, "")})
+            results = list(converter._convert_batch(pdfs))
+
+        assert mock_pool.call_args.kwargs["max_workers"] == 2
+        assert [call.args[1] for call in executor.submit.call_args_list] == [pdfs[0], pdfs[2]]
+        assert results == [([pdfs[0]], 1, False), (fresh, 9, True), ([pdfs[2]], 1, False)]
+        mock_convert.assert_not_called()  # The up-to-date PDF reuses the outputs found by the check
+
+    def test_pool_submission_is_bounded(self, tmp_path: Path) -> None:
+        """Test no more than the per-worker window is submitted before results are consumed."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=2)
+        pdfs = [tmp_path / f"{i}.pdf" for i in range(10)]
+        window = 2 * converter_module.PENDING_CONVERSIONS_PER_WORKER
+
+        with patch("wellbin.core.converter.ProcessPoolExecutor") as mock_pool:
+            executor = mock_pool.return_value.__enter__.return_value
+            executor.submit.side_effect = lambda fn, path: Mock(**{"result.return_value": ([path], 1, "")})
+            batch = converter._convert_batch(pdfs)
+            first = next(batch)
+            submitted_before_first = executor.submit.call_count
+            rest = list(batch)
+
+        assert first == ([pdfs[0]], 1, False)
+        assert submitted_before_first == window
+        assert [first, *rest] == [([p], 1, False) for p in pdfs]
+
+    def test_batch_reports_step_per_file(self, tmp_path: Path) -> None:
+        """Test each completed PDF emits one outer progress step."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=1)
+        pdfs = [tmp_path / "a.pdf", tmp_path / "b.pdf"]
+
+        with (
+            patch.object(
+                converter, "_convert_batch", return_value=iter([([tmp_path / "a.md"], 10, False), (None, 0, False)])
+            ),
+            patch.object(converter.out, "step") as mock_step,
+        ):
+            result = converter._process_all_pdfs(pdfs)
+
+        assert result.successful == 1 and result.failed == 1
+        assert result.total_bytes == 10
+        assert [c.args[:2] for c in mock_step.call_args_list] == [(1, 2), (2, 2)]
+
+    def test_summary_counts_skipped_pdfs_separately(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test up-to-date PDFs are reported as skipped and their existing outputs count towards the size."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"), max_workers=1)
+        pdfs = [tmp_path / "a.pdf", tmp_path / "b.pdf", tmp_path / "c.pdf"]
+        outcomes = [([tmp_path / "a.md"], 100, True), ([tmp_path / "b.md"], 20, False), ([tmp_path / "c.md"], 3, True)]
+
+        with patch.object(converter, "_convert_batch", return_value=iter(outcomes)):
+            result = converter._process_all_pdfs(pdfs)
+        converter._print_batch_summary(result)
+
+        assert (result.successful, result.skipped, result.failed) == (1, 2, 0)
+        assert result.total_bytes == 123
+        out = capsys.readouterr().out
+        assert "Successfully converted: 1 PDFs" in out
+        assert "Skipped (already up to date): 2 PDFs" in out
+        assert "Total output files: 3" in out
+        assert "Total size: 123 bytes" in out
+
+    def test_convert_one_uses_worker_converter(self, tmp_path: Path) -> None:
+        """Test _convert_one delegates to the converter installed by _init_worker."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+        pdf_path = tmp_path / "a.pdf"
+
+        def fake_convert(path: Path) -> list[Path]:
+            print(f"Converting {path.name}")
+            return [tmp_path / "a.md"]
+
+        with patch.object(converter, "_convert_pdf", side_effect=fake_convert) as mock_convert:
+            converter_module._init_worker(converter)
+            try:
+                result = converter_module._convert_one(pdf_path)
+            finally:
+                converter_module._worker_converter = None
+
+        assert result == ([tmp_path / "a.md"], 0, "Converting a.pdf\n")
+        mock_convert.assert_called_once_with(pdf_path)
+
+    def test_worker_output_is_printed_in_one_write(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test buffered worker output is replayed by the parent."""
+        result = converter_module._flush_worker_output((None, 0, "line one\nline two\n"))
+
+        assert result == (None, 0)
+        assert capsys.readouterr().out == "line one\nline two\n"
+
+
+@pytest.mark.unit
+class TestConverterExtractionCache:
+    """Tests for the content-hash extraction cache."""
+
+    @pytest.fixture
+    def converter(self, tmp_path: Path) -> PDFToMarkdownConverter:
+        """Create converter with a cache directory."""
+        return PDFToMarkdownConverter(
+            pdf_dir=str(tmp_path),
+            output_dir=str(tmp_path / "output"),
+            cache_dir=tmp_path / "cache",
+        )
+
+    @pytest.mark.usefixtures("mock_pymupdf_open")
+    def test_second_extraction_uses_cache(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test an unchanged PDF is only parsed once."""
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"fake pdf content")
+
+        with patch("wellbin.core.converter._to_markdown", return_value="# Report") as mock_to_md:
+            first = converter.extract_enhanced_markdown(pdf_path)
+            second = converter.extract_enhanced_markdown(pdf_path)
+
+        assert first == second == "# Report"
+        mock_to_md.assert_called_once()
+
+    def test_cache_miss_parses_the_hashed_bytes(
+        self, converter: PDFToMarkdownConverter, tmp_path: Path, mock_pymupdf_open: Mock
+    ) -> None:
+        """Test the PDF is read once: the bytes hashed for the cache key are the ones parsed."""
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"fake pdf content")
+
+        with patch("wellbin.core.converter._to_markdown", return_value="# Report"):
+            converter.extract_enhanced_markdown(pdf_path)
+
+        mock_pymupdf_open.assert_called_once_with(b"fake pdf content")
+
+    @pytest.mark.usefixtures("mock_pymupdf_open")
+    def test_changed_content_misses_cache(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test the cache key follows file content, not file name."""
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"version 1")
+
+        with patch("wellbin.core.converter._to_markdown", side_effect=["# v1", "# v2"]) as mock_to_md:
+            converter.extract_enhanced_markdown(pdf_path)
+            pdf_path.write_bytes(b"version 2")
+            result = converter.extract_enhanced_markdown(pdf_path)
+
+        assert result == "# v2"
+        assert mock_to_md.call_count == 2
+
+    def test_cache_key_includes_mode(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test standard and enhanced results are cached separately."""
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"fake pdf content")
+
+        standard = converter._cache_path(pdf_path)
+        converter.enhanced_mode = True
+        enhanced = converter._cache_path(pdf_path)
+
+        assert standard is not None and enhanced is not None
+        assert standard != enhanced
+
+    def test_cache_key_includes_extractor_version(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test upgrading pymupdf4llm does not reuse results from the old version."""
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"fake pdf content")
+
+        with patch("wellbin.core.converter._extractor_version", return_value="0.0.20"):
+            old = converter._cache_path(pdf_path)
+        with patch("wellbin.core.converter._extractor_version", return_value="0.0.21"):
+            new = converter._cache_path(pdf_path)
+
+        assert old != new
+
+    def test_cached_chunks_round_trip(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test structured chunks survive the compressed cache unchanged."""
+        chunks: list[PageChunk] = [{"text": "## HEMOGRAMA", "tables": [], "words": [[1.0, 2.0, 3.0, 4.0, "Hb"]]}]
+        cache_path = tmp_path / "cache" / "entry.json.z"
+
+        converter._store_cached(cache_path, chunks)
+
+        assert converter._load_cached(cache_path) == chunks
+        assert [p.name for p in cache_path.parent.iterdir()] == ["entry.json.z"]
+
+    def test_corrupt_cache_entry_is_a_miss(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test an unreadable cache entry is ignored rather than raised."""
+        cache_path = tmp_path / "entry.json.z"
+        cache_path.write_bytes(b'{"not": "compressed"}')
+
+        assert converter._load_cached(cache_path) is None
+
+    def test_cache_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test converters without cache_dir never touch a cache."""
+        converter = PDFToMarkdownConverter(str(tmp_path), str(tmp_path / "output"))
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"fake pdf content")
+
+        assert converter._cache_path(pdf_path) is None
+
+    def test_prune_cache_drops_stale_entries(self, tmp_path: Path) -> None:
+        """Test entries unused for longer than the age limit are removed."""
+        stale = tmp_path / "stale.json.z"
+        fresh = tmp_path / "fresh.json.z"
+        stale.write_bytes(b"x")
+        fresh.write_bytes(b"x")
+        old = time.time() - 31 * 86400
+        os.utime(stale, (old, old))
+
+        assert prune_cache(tmp_path, max_age_days=30) == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["fresh.json.z"]
+
+    def test_prune_cache_enforces_size_limit(self, tmp_path: Path) -> None:
+        """Test the least recently used entries go first once the cache is over its size limit."""
+        now = time.time()
+        for age, name in enumerate(["newest", "middle", "oldest"]):
+            entry = tmp_path / f"{name}.json.z"
+            entry.write_bytes(b"x" * 100)
+            os.utime(entry, (now - age, now - age))
+
+        assert prune_cache(tmp_path, max_bytes=200) == 1
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["middle.json.z", "newest.json.z"]
+
+    def test_cache_hit_refreshes_entry_age(self, converter: PDFToMarkdownConverter, tmp_path: Path) -> None:
+        """Test loading an entry marks it as recently used so pruning keeps it."""
+        cache_path = tmp_path / "cache" / "entry.json.z"
+        converter._store_cached(cache_path, "# Report")
+        old = time.time() - 31 * 86400
+        os.utime(cache_path, (old, old))
+
+        assert converter._load_cached(cache_path) == "# Report"
+        assert prune_cache(cache_path.parent) == 0
+
+
 @pytest.mark.unit
 class TestConverterFeatureStats:
     """Tests for feature statistics calculation."""
@@ -305,6 +814,8 @@ class TestConverterMedicalHeaderDetector:
             ("CLINICAL FINDINGS", 14, "## "),
             ("HEMATOLOGY", 12, "## "),  # HEMATOLOGY is in MAIN_SECTIONS
             ("CHEMISTRY", 12, "### "),  # CHEMISTRY is in SUBSECTIONS
+            ("Serie Eritrocitaria - Valores", 11, "### "),  # Keyword inside longer text
+            ("CHEMISTRY", 9, ""),  # Keyword but below subsection size
             ("Weight:", 10, "#### "),
             ("Blood Pressure:", 10, "#### "),
             ("Normal text", 10, ""),
@@ -316,6 +827,8 @@ class TestConverterMedicalHeaderDetector:
             "clinical",
             "hematology-main",
             "chemistry-sub",
+            "embedded-sub",
+            "small-sub",
             "weight-param",
             "bp-param",
             "normal-text",
@@ -344,6 +857,39 @@ class TestConverterMedicalHeaderDetector:
         assert converter.medical_header_detector(span_upper) == "## "
         assert converter.medical_header_detector(span_mixed) == "## "
 
+    def test_incomplete_span_is_not_a_header(self, converter: PDFToMarkdownConverter) -> None:
+        """Test spans missing expected keys are treated as body text."""
+        assert converter.medical_header_detector({"text": "DIAGNOSIS"}) == ""
+
+    def test_small_bold_main_section(self, converter: PDFToMarkdownConverter) -> None:
+        """Test bold text below the size threshold is still a main section."""
+        span = {"text": "Diagnosis", "size": 8, "font": "Helvetica-Bold"}
+
+        assert converter.medical_header_detector(span) == "## "
+
+    def test_repeated_span_is_classified_once(self, converter: PDFToMarkdownConverter) -> None:
+        """Test a span recurring on later pages is served from the classification cache."""
+        span = {"text": "Recurring label:", "size": 10, "font": "Arial"}
+        PDFToMarkdownConverter._classify_span.cache_clear()
+        check = PDFToMarkdownConverter._is_parameter_header
+
+        with patch.object(PDFToMarkdownConverter, "_is_parameter_header", wraps=check) as mock_check:
+            first = converter.medical_header_detector(span)
+            second = converter.medical_header_detector(dict(span))
+
+        assert first == second == "#### "
+        mock_check.assert_called_once()
+
+    def test_small_regular_text_skips_classification(self, converter: PDFToMarkdownConverter) -> None:
+        """Test text in a font too small and light for any header is not classified."""
+        span = {"text": "Footnote:", "size": 7, "font": "Arial"}
+
+        with patch.object(PDFToMarkdownConverter, "_classify_span") as mock_classify:
+            result = converter.medical_header_detector(span)
+
+        assert result == ""
+        mock_classify.assert_not_called()
+
 
 @pytest.mark.unit
 class TestConversionStats:
@@ -372,3 +918,20 @@ class TestConversionStats:
         assert stats.words_extracted == 1000
         assert stats.files_created == 2
         assert stats.total_bytes == 50000
+
+
+@pytest.mark.unit
+class TestWordColumns:
+    """Tests for the columnar word position store."""
+
+    def test_extend_transposes_rows(self) -> None:
+        """Test rows from several pages land in the matching columns."""
+        columns = WordColumns()
+        columns.extend([[1.0, 2.0, 3.0, 4.0, "HDL", 0, 0, 0]])
+        columns.extend([])
+        columns.extend([[5.0, 6.0, 7.0, 8.0, "LDL", 1, 2, 3]])
+
+        assert len(columns) == 2
+        assert columns.x0.tolist() == [1.0, 5.0]
+        assert columns.text == ["HDL", "LDL"]
+        assert columns.word.tolist() == [0, 3]
@@ -58,6 +58,36 @@ class TestPDFDownloadInfo:
         info.study_index = 10
         assert info.study_index == 10
 
+    def test_pdf_download_info_has_no_instance_dict(self):
+        """Test instances use slots, so unknown attributes are rejected."""
+        info = PDFDownloadInfo(
+            url="https://example.com/test.pdf",
+            text="Test PDF",
+            study_url="https://wellbin.co/study/123",
+            study_type="FhirStudy",
+            study_date="20240604",
+        )
+
+        assert not hasattr(info, "__dict__")
+        with pytest.raises(AttributeError):
+            info.study_id = "123"
+
+    def test_pdf_download_info_interns_study_fields(self):
+        """Test equal study types and dates share one string object."""
+        infos = [
+            PDFDownloadInfo(
+                url=f"https://example.com/{i}.pdf",
+                text="Test PDF",
+                study_url="https://wellbin.co/study/123",
+                study_type="".join(["Fhir", "Study"]),
+                study_date="".join(["2024", "0604"]),
+            )
+            for i in range(2)
+        ]
+
+        assert infos[0].study_type is infos[1].study_type
+        assert infos[0].study_date is infos[1].study_date
+
 
 @pytest.mark.unit
 class TestDownloadResult:
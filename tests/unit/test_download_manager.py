@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from wellbin.core.exceptions import ConnectionTimeoutError, DownloadError, S3UrlExpiredError
 
@@ -52,6 +53,24 @@ class TestPDFDownloadManager:
         assert manager.output_dir == tmp_path
         assert manager.max_retries == 3  # default
         assert manager.chunk_size == 8192  # default
+        assert isinstance(manager.session, requests.Session)
+
+    def test_download_pdf_reuses_session(self, tmp_path: Path) -> None:
+        """Test downloads go through the shared session so connections are reused."""
+        from wellbin.core.download_manager import PDFDownloadManager
+
+        session = Mock()
+        mock_response = session.get.return_value
+        mock_response.status_code = 200
+        mock_response.iter_content = Mock(return_value=[b"fake pdf content"])
+        mock_response.__enter__ = Mock(return_value=mock_response)
+        mock_response.__exit__ = Mock(return_value=False)
+        manager = PDFDownloadManager(output_dir=tmp_path, output=Mock(), session=session)
+
+        for counter in range(2):
+            manager.download_pdf(url="https://example.com/file.pdf", file_path=tmp_path / f"report-{counter}.pdf")
+
+        assert session.get.call_count == 2
 
     def test_generate_filename_basic(self, manager: PDFDownloadManager) -> None:
         """Test filename generation with basic inputs."""
@@ -80,7 +99,7 @@ class TestPDFDownloadManager:
         )
         assert result == "unknown-lab-0.pdf"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_pdf_success(self, mock_get: Mock, manager: PDFDownloadManager, tmp_path: Path) -> None:
         """Test successful PDF download."""
         # Setup mock response
@@ -101,7 +120,7 @@ class TestPDFDownloadManager:
         assert result is True
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_pdf_http_error(self, mock_get: Mock, manager: PDFDownloadManager, tmp_path: Path) -> None:
         """Test PDF download with HTTP error."""
         mock_response = Mock()
@@ -119,7 +138,7 @@ class TestPDFDownloadManager:
                 file_path=file_path,
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_pdf_s3_expired(self, mock_get: Mock, manager: PDFDownloadManager, tmp_path: Path) -> None:
         """Test PDF download with expired S3 URL (403 Forbidden)."""
         mock_response = Mock()
@@ -137,7 +156,7 @@ class TestPDFDownloadManager:
                 file_path=file_path,
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_pdf_connection_timeout(self, mock_get: Mock, manager: PDFDownloadManager, tmp_path: Path) -> None:
         """Test PDF download with connection timeout."""
         import requests
@@ -152,7 +171,7 @@ class TestPDFDownloadManager:
                 file_path=file_path,
             )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_pdf_creates_directory(self, mock_get: Mock, manager: PDFDownloadManager, tmp_path: Path) -> None:
         """Test that download creates parent directory if needed."""
         mock_response = Mock()
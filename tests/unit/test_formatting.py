@@ -2,9 +2,6 @@
 Tests for wellbin.core.formatting module.
 """
 
-from io import StringIO
-from unittest.mock import patch
-
 import pytest
 
 from wellbin.core.formatting import (
@@ -96,35 +93,31 @@ class TestDomainEmojis:
 class TestEmit:
     """Tests for emit function."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_info_message(self, mock_stdout):
+    def test_emit_info_message(self, capsys):
         """Test emitting an info message."""
         emit("Test message", OutputLevel.INFO)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Test message" in output
         assert EMOJI_PREFIXES[OutputLevel.INFO] in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_success_message(self, mock_stdout):
+    def test_emit_success_message(self, capsys):
         """Test emitting a success message."""
         emit("Operation successful", OutputLevel.SUCCESS)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Operation successful" in output
         assert EMOJI_PREFIXES[OutputLevel.SUCCESS] in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_error_message(self, mock_stdout):
+    def test_emit_error_message(self, capsys):
         """Test emitting an error message."""
         emit("Something failed", OutputLevel.ERROR)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Something failed" in output
         assert EMOJI_PREFIXES[OutputLevel.ERROR] in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_with_indent(self, mock_stdout):
+    def test_emit_with_indent(self, capsys):
         """Test emitting with indentation."""
         emit("Indented message", OutputLevel.INFO, indent=4)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "    " in output  # 4 spaces
         assert "Indented message" in output
 
@@ -133,27 +126,24 @@ class TestEmit:
 class TestEmitWithEmoji:
     """Tests for emit_with_emoji function."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_with_valid_emoji_key(self, mock_stdout):
+    def test_emit_with_valid_emoji_key(self, capsys):
         """Test emitting with a valid emoji key."""
         emit_with_emoji("Downloading file", "download")
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Downloading file" in output
         assert DOMAIN_EMOJIS["download"] in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_with_unknown_emoji_key(self, mock_stdout):
+    def test_emit_with_unknown_emoji_key(self, capsys):
         """Test emitting with unknown emoji key falls back to bullet."""
         emit_with_emoji("Unknown domain", "nonexistent_key")
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Unknown domain" in output
         assert "•" in output  # fallback bullet
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_with_emoji_and_indent(self, mock_stdout):
+    def test_emit_with_emoji_and_indent(self, capsys):
         """Test emit_with_emoji with indentation."""
         emit_with_emoji("Processing data", "processing", indent=2)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "  " in output  # 2 spaces indent
         assert "Processing data" in output
 
@@ -162,27 +152,24 @@ class TestEmitWithEmoji:
 class TestEmitHeader:
     """Tests for emit_header function."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_header_default(self, mock_stdout):
+    def test_emit_header_default(self, capsys):
         """Test emitting a header with default settings."""
         emit_header("Section Title")
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Section Title" in output
         assert "=" * 60 in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_header_custom_char(self, mock_stdout):
+    def test_emit_header_custom_char(self, capsys):
         """Test emitting a header with custom character."""
         emit_header("Custom Header", char="-")
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Custom Header" in output
         assert "-" * 60 in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_header_custom_width(self, mock_stdout):
+    def test_emit_header_custom_width(self, capsys):
         """Test emitting a header with custom width."""
         emit_header("Narrow Header", char="=", width=40)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "Narrow Header" in output
         assert "=" * 40 in output
 
@@ -191,18 +178,16 @@ class TestEmitHeader:
 class TestEmitSeparator:
     """Tests for emit_separator function."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_separator_default(self, mock_stdout):
+    def test_emit_separator_default(self, capsys):
         """Test emitting a separator with default settings."""
         emit_separator()
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "=" * 60 in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_separator_custom(self, mock_stdout):
+    def test_emit_separator_custom(self, capsys):
         """Test emitting a custom separator."""
         emit_separator(char="-", width=40)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "-" * 40 in output
 
 
@@ -210,37 +195,33 @@ class TestEmitSeparator:
 class TestEmitList:
     """Tests for emit_list function."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_list_unnumbered(self, mock_stdout):
+    def test_emit_list_unnumbered(self, capsys):
         """Test emitting an unnumbered list."""
         emit_list(["item1", "item2", "item3"])
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "item1" in output
         assert "item2" in output
         assert "item3" in output
         assert "•" in output  # bullet points
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_list_numbered(self, mock_stdout):
+    def test_emit_list_numbered(self, capsys):
         """Test emitting a numbered list."""
         emit_list(["first", "second", "third"], numbered=True)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "1." in output
         assert "2." in output
         assert "3." in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_list_with_indent(self, mock_stdout):
+    def test_emit_list_with_indent(self, capsys):
         """Test emitting a list with indentation."""
         emit_list(["indented"], indent=4)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "    " in output  # 4 spaces
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_list_empty(self, mock_stdout):
+    def test_emit_list_empty(self, capsys):
         """Test emitting an empty list."""
         emit_list([])
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert output == ""
 
 
@@ -248,26 +229,23 @@ class TestEmitList:
 class TestEmitKeyValue:
     """Tests for emit_key_value function."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_key_value_basic(self, mock_stdout):
+    def test_emit_key_value_basic(self, capsys):
         """Test emitting key-value pairs."""
         emit_key_value({"name": "test", "value": 42})
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "name: test" in output
         assert "value: 42" in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_key_value_with_indent(self, mock_stdout):
+    def test_emit_key_value_with_indent(self, capsys):
         """Test emitting key-value pairs with indentation."""
         emit_key_value({"key": "value"}, indent=2)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "  key: value" in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_key_value_empty(self, mock_stdout):
+    def test_emit_key_value_empty(self, capsys):
         """Test emitting empty dictionary."""
         emit_key_value({})
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert output == ""
 
 
@@ -275,158 +253,124 @@ class TestEmitKeyValue:
 class TestConvenienceFunctions:
     """Tests for convenience output functions."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_info(self, mock_stdout):
-        """Test info convenience function."""
-        info("Info message")
-        assert "Info message" in mock_stdout.getvalue()
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_success(self, mock_stdout):
-        """Test success convenience function."""
-        success("Success message")
-        assert "Success message" in mock_stdout.getvalue()
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_warning(self, mock_stdout):
-        """Test warning convenience function."""
-        warning("Warning message")
-        assert "Warning message" in mock_stdout.getvalue()
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_error(self, mock_stdout):
-        """Test error convenience function."""
-        error("Error message")
-        assert "Error message" in mock_stdout.getvalue()
-
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_debug(self, mock_stdout):
-        """Test debug convenience function."""
-        debug("Debug message")
-        assert "Debug message" in mock_stdout.getvalue()
+    @pytest.mark.parametrize(
+        ("func", "level"),
+        [
+            (info, OutputLevel.INFO),
+            (success, OutputLevel.SUCCESS),
+            (warning, OutputLevel.WARNING),
+            (error, OutputLevel.ERROR),
+            (debug, OutputLevel.DEBUG),
+        ],
+    )
+    def test_level_convenience_function(self, capsys, func, level):
+        """Test each convenience function emits its message with its level's prefix."""
+        func("Test message")
+        assert f"{EMOJI_PREFIXES[level]} Test message" in capsys.readouterr().out
 
 
 @pytest.mark.unit
 class TestDomainConvenienceFunctions:
     """Tests for domain-specific convenience functions."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_processing(self, mock_stdout):
+    def test_processing(self, capsys):
         """Test processing convenience function."""
         processing("Processing data...")
-        assert "Processing data..." in mock_stdout.getvalue()
+        assert "Processing data..." in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_complete(self, mock_stdout):
+    def test_complete(self, capsys):
         """Test complete convenience function."""
         complete()
-        assert "Complete!" in mock_stdout.getvalue()
+        assert "Complete!" in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_complete_custom_message(self, mock_stdout):
+    def test_complete_custom_message(self, capsys):
         """Test complete with custom message."""
         complete("All done!")
-        assert "All done!" in mock_stdout.getvalue()
+        assert "All done!" in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_downloading(self, mock_stdout):
+    def test_downloading(self, capsys):
         """Test downloading convenience function."""
         downloading("Downloading file.pdf")
-        assert "Downloading file.pdf" in mock_stdout.getvalue()
+        assert "Downloading file.pdf" in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_converting(self, mock_stdout):
+    def test_converting(self, capsys):
         """Test converting convenience function."""
         converting("Converting PDF to markdown")
-        assert "Converting PDF to markdown" in mock_stdout.getvalue()
+        assert "Converting PDF to markdown" in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_date_info(self, mock_stdout):
+    def test_date_info(self, capsys):
         """Test date_info convenience function."""
         date_info("Study date: 2024-06-04")
-        assert "Study date: 2024-06-04" in mock_stdout.getvalue()
+        assert "Study date: 2024-06-04" in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_url_info(self, mock_stdout):
+    def test_url_info(self, capsys):
         """Test url_info convenience function."""
         url_info("https://example.com")
-        assert "https://example.com" in mock_stdout.getvalue()
+        assert "https://example.com" in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_file_info(self, mock_stdout):
+    def test_file_info(self, capsys):
         """Test file_info convenience function."""
         file_info("report.pdf")
-        assert "report.pdf" in mock_stdout.getvalue()
+        assert "report.pdf" in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_folder_info(self, mock_stdout):
+    def test_folder_info(self, capsys):
         """Test folder_info convenience function."""
         folder_info("medical_data/")
-        assert "medical_data/" in mock_stdout.getvalue()
+        assert "medical_data/" in capsys.readouterr().out
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_size_info(self, mock_stdout):
+    def test_size_info(self, capsys):
         """Test size_info convenience function."""
         size_info("1.5 MB")
-        assert "1.5 MB" in mock_stdout.getvalue()
+        assert "1.5 MB" in capsys.readouterr().out
 
 
 @pytest.mark.unit
 class TestFormatBytes:
     """Tests for format_bytes function."""
 
-    def test_format_bytes_bytes(self):
-        """Test formatting small byte values."""
-        assert format_bytes(0) == "0.0 B"
-        assert format_bytes(512) == "512.0 B"
-        assert format_bytes(1023) == "1023.0 B"
-
-    def test_format_bytes_kilobytes(self):
-        """Test formatting kilobyte values."""
-        assert format_bytes(1024) == "1.0 KB"
-        assert format_bytes(1536) == "1.5 KB"
-        assert format_bytes(10240) == "10.0 KB"
-
-    def test_format_bytes_megabytes(self):
-        """Test formatting megabyte values."""
-        assert format_bytes(1048576) == "1.0 MB"
-        assert format_bytes(1572864) == "1.5 MB"
-        assert format_bytes(10485760) == "10.0 MB"
-
-    def test_format_bytes_gigabytes(self):
-        """Test formatting gigabyte values."""
-        assert format_bytes(1073741824) == "1.0 GB"
-        assert format_bytes(1610612736) == "1.5 GB"
-
-    def test_format_bytes_terabytes(self):
-        """Test formatting terabyte values."""
-        assert format_bytes(1099511627776) == "1.0 TB"
-        assert format_bytes(1649267441664) == "1.5 TB"
+    @pytest.mark.parametrize(
+        ("size", "expected"),
+        [
+            (0, "0.0 B"),
+            (512, "512.0 B"),
+            (1023, "1023.0 B"),
+            (1024, "1.0 KB"),
+            (1536, "1.5 KB"),
+            (10240, "10.0 KB"),
+            (1048576, "1.0 MB"),
+            (1572864, "1.5 MB"),
+            (10485760, "10.0 MB"),
+            (1073741824, "1.0 GB"),
+            (1610612736, "1.5 GB"),
+            (1099511627776, "1.0 TB"),
+            (1649267441664, "1.5 TB"),
+        ],
+    )
+    def test_format_bytes(self, size, expected):
+        """Test sizes are shown in the largest unit that fits."""
+        assert format_bytes(size) == expected
 
 
 @pytest.mark.unit
 class TestEmitFileSaved:
     """Tests for emit_file_saved function."""
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_file_saved_basic(self, mock_stdout):
+    def test_emit_file_saved_basic(self, capsys):
         """Test emitting file saved message."""
         emit_file_saved("/path/to/file.pdf", 1048576)  # 1 MB
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "/path/to/file.pdf" in output
         assert "1.0 MB" in output
         assert "Saved:" in output
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_file_saved_with_indent(self, mock_stdout):
+    def test_emit_file_saved_with_indent(self, capsys):
         """Test emitting file saved with indentation."""
         emit_file_saved("file.pdf", 512, indent=2)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "  " in output  # 2 space indent
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_emit_file_saved_small_file(self, mock_stdout):
+    def test_emit_file_saved_small_file(self, capsys):
         """Test emitting small file saved message."""
         emit_file_saved("small.txt", 256)
-        output = mock_stdout.getvalue()
+        output = capsys.readouterr().out
         assert "256.0 B" in output
@@ -4,7 +4,7 @@ Tests for wellbin.core.logging module.
 
 import logging
 from io import StringIO
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -92,6 +92,20 @@ class TestOutputInit:
         assert out.config.use_emoji is False
         assert out.config.line_width == 80
 
+    def test_stream_init(self):
+        """Test Output writes to an explicit stream instead of stdout."""
+        stream = StringIO()
+        out = Output(stream=stream)
+        out.success("Done")
+        assert stream.getvalue() == "\u2705 Done\n"
+
+    def test_header_is_written_in_one_call(self):
+        """Test a multi-line header reaches the stream as a single write."""
+        stream = Mock()
+        out = Output(OutputConfig(line_width=3), stream=stream)
+        out.header("Title")
+        stream.write.assert_called_once_with("\n===\nTitle\n===\n")
+
 
 @pytest.mark.unit
 class TestOutputMessage:
@@ -398,6 +412,13 @@ class TestOutputConvenienceMethods:
         out.debug("Debug message")
         assert "Debug message" in mock_stdout.getvalue()
 
+    @patch("sys.stdout", new_callable=StringIO)
+    def test_debug_suppressed(self, mock_stdout):
+        """Test debug messages are dropped when show_debug is disabled."""
+        out = Output(OutputConfig(show_debug=False))
+        out.debug("Debug message")
+        assert mock_stdout.getvalue() == ""
+
     @patch("sys.stdout", new_callable=StringIO)
     def test_progress(self, mock_stdout):
         """Test progress convenience method."""
@@ -480,6 +501,15 @@ class TestOutputLogging:
         out.separator()
         assert "=" * 60 in mock_stdout.getvalue()
 
+    def test_disabled_level_skips_logger(self):
+        """Test messages below the logger's level never reach Logger.log."""
+        out = Output(stream=StringIO())
+        out.configure_logging("test_disabled_level", logging.WARNING)
+        with patch.object(out._logger, "log") as mock_log:
+            out.info("not logged")
+            out.error("logged")
+        mock_log.assert_called_once_with(logging.ERROR, "\u274c logged")
+
 
 @pytest.mark.unit
 class TestGetOutput:
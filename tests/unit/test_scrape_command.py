@@ -114,6 +114,32 @@ class TestResolveConfig:
         assert config.headless is False
         assert config.headless_source == "CLI"
 
+    @patch("wellbin.commands.scrape.get_env_or_default")
+    def test_download_workers_cli_and_env(self, mock_get_env) -> None:
+        """Test concurrent download count resolves from CLI, then env."""
+        mock_get_env.side_effect = lambda key, default, *args: 2 if key == "WELLBIN_DOWNLOAD_WORKERS" else default
+
+        from_env = resolve_config(None, None, None, None, None, None)
+        from_cli = resolve_config(None, None, None, None, None, None, download_workers=8)
+
+        assert from_env.download_workers == 2
+        assert from_env.download_workers_source == "ENV/Default"
+        assert from_cli.download_workers == 8
+        assert from_cli.download_workers_source == "CLI"
+
+    @patch("wellbin.commands.scrape.get_env_or_default")
+    def test_verbose_cli_and_env(self, mock_get_env) -> None:
+        """Test verbose output resolves from the CLI flag, then WELLBIN_DEBUG."""
+        mock_get_env.side_effect = lambda key, default, *args: True if key == "WELLBIN_DEBUG" else default
+
+        from_env = resolve_config(None, None, None, None, None, None)
+        from_cli = resolve_config(None, None, None, None, None, None, verbose=True)
+
+        assert from_env.verbose is True
+        assert from_env.verbose_source == "ENV/Default"
+        assert from_cli.verbose is True
+        assert from_cli.verbose_source == "CLI"
+
     @patch("wellbin.commands.scrape.get_env_or_default")
     def test_uses_env_when_cli_not_provided(self, mock_get_env) -> None:
         """Test that environment variables are used when CLI args not provided."""
@@ -8,7 +8,7 @@ from pathlib import Path
 import click
 from dotenv import load_dotenv
 
-from ..core.converter import PDFToMarkdownConverter, convert_structured_directories
+from ..core.converter import DEFAULT_CACHE_DIR, PDFToMarkdownConverter, convert_structured_directories, prune_cache
 from ..core.utils import get_env_or_default
 
 # Load environment variables
@@ -24,6 +24,9 @@ class ConvertConfig:
     preserve_structure: bool = True
     file_type: str = "all"
     enhanced_mode: bool = False
+    workers: int = 0
+    use_cache: bool = False
+    force: bool = False
 
     # Source tracking for display
     input_source: str = "ENV/Default"
@@ -31,6 +34,9 @@ class ConvertConfig:
     file_type_source: str = "ENV/Default"
     preserve_source: str = "ENV/Default"
     enhanced_source: str = "ENV/Default"
+    workers_source: str = "ENV/Default"
+    cache_source: str = "ENV/Default"
+    force_source: str = "ENV/Default"
 
 
 def resolve_config(
@@ -39,6 +45,9 @@ def resolve_config(
     preserve_structure: bool,
     file_type: str | None,
     enhanced_mode: bool,
+    workers: int | None = None,
+    use_cache: bool | None = None,
+    force: bool = False,
 ) -> ConvertConfig:
     """Resolve configuration from CLI args and environment variables.
 
@@ -48,6 +57,9 @@ def resolve_config(
         preserve_structure: CLI preserve structure flag
         file_type: CLI file type argument
         enhanced_mode: CLI enhanced mode flag
+        workers: CLI worker process count argument
+        use_cache: CLI --cache/--no-cache choice (None if not given)
+        force: CLI flag to re-convert PDFs whose markdown is up to date
 
     Returns:
         Resolved ConvertConfig
@@ -89,6 +101,27 @@ def resolve_config(
     else:
         config.enhanced_mode = get_env_or_default("WELLBIN_ENHANCED_MODE", "false", bool)
 
+    # Resolve worker processes (0 = one per CPU core)
+    if workers is not None:
+        config.workers = workers
+        config.workers_source = "CLI"
+    else:
+        config.workers = get_env_or_default("WELLBIN_CONVERT_WORKERS", "0", int)
+
+    # Resolve extraction cache
+    if use_cache is not None:
+        config.use_cache = use_cache
+        config.cache_source = "CLI"
+    else:
+        config.use_cache = get_env_or_default("WELLBIN_CONVERT_CACHE", "false", bool)
+
+    # Resolve forced re-conversion
+    if force:
+        config.force = True
+        config.force_source = "CLI"
+    else:
+        config.force = get_env_or_default("WELLBIN_CONVERT_FORCE", "false", bool)
+
     return config
 
 
@@ -105,12 +138,16 @@ def display_config(config: ConvertConfig) -> None:
     click.echo(f"📂 Input directory: {config.input_dir}")
     click.echo(f"📁 Output directory: {config.output_dir}")
     click.echo(f"🎯 File type filter: {config.file_type}")
+    click.echo(f"⚙️ Worker processes: {config.workers or 'auto (one per CPU core)'}")
     click.echo("🧠 Processing: LLM-optimized markdown extraction")
+    click.echo(f"🗄️ Extraction cache: {DEFAULT_CACHE_DIR if config.use_cache else 'disabled'}")
 
     if config.preserve_structure:
         click.echo("📁 Preserving subdirectory structure")
     if config.enhanced_mode:
         click.echo("🎯 Enhanced mode: embedded page chunks + tables + word positions (no images)")
+    if config.force:
+        click.echo("🔁 Force: re-converting PDFs even if their markdown is up to date")
 
     click.echo("\n🔧 Argument Sources:")
     click.echo(f"   Input dir: {config.input_source}")
@@ -118,6 +155,9 @@ def display_config(config: ConvertConfig) -> None:
     click.echo(f"   File type: {config.file_type_source}")
     click.echo(f"   Preserve structure: {config.preserve_source}")
     click.echo(f"   Enhanced mode: {config.enhanced_source}")
+    click.echo(f"   Workers: {config.workers_source}")
+    click.echo(f"   Cache: {config.cache_source}")
+    click.echo(f"   Force: {config.force_source}")
     click.echo()
 
 
@@ -130,12 +170,19 @@ def run_conversion(config: ConvertConfig) -> list[Path]:
     Returns:
         List of converted file paths
     """
+    cache_dir = DEFAULT_CACHE_DIR if config.use_cache else None
+    if cache_dir is not None:
+        prune_cache(cache_dir)
+
     if config.preserve_structure and Path(config.input_dir).exists():
         return convert_structured_directories(
             config.input_dir,
             config.output_dir,
             config.file_type,
             config.enhanced_mode,
+            max_workers=config.workers,
+            cache_dir=cache_dir,
+            force=config.force,
         )
 
     # Create converter and run conversion on flat directory
@@ -143,6 +190,9 @@ def run_conversion(config: ConvertConfig) -> list[Path]:
         config.input_dir,
         config.output_dir,
         config.enhanced_mode,
+        max_workers=config.workers,
+        cache_dir=cache_dir,
+        force=config.force,
     )
     return converter.convert_all_pdfs()
 
@@ -165,7 +215,7 @@ def display_success_info(output_dir: str, enhanced_mode: bool) -> None:
     if enhanced_mode:
         click.echo("\n🎯 Enhanced Mode Features:")
         click.echo("   📑 Page chunks: Embedded as sections in single markdown files")
-        click.echo("   📊 Word positions: Embedded in hidden footer sections")
+        click.echo("   📊 Word positions: Sidecar <report>.words.jsonl files (one word per line)")
         click.echo("   📋 Table detection: Built-in with position data")
         click.echo("   🧠 Medical headers: Optimized for lab/imaging reports")
         click.echo("   🚫 Images: Disabled (text-only processing)")
@@ -204,12 +254,34 @@ def display_failure_info() -> None:
     is_flag=True,
     help="Enable enhanced mode with page chunks, tables, and word positions (overrides WELLBIN_ENHANCED_MODE env var)",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=0),
+    help="Worker processes for PDF conversion, 0 = one per CPU core (overrides WELLBIN_CONVERT_WORKERS env var)",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=None,
+    help=(
+        "Reuse extracted text for unchanged PDFs from $XDG_CACHE_HOME/wellbin; the cache holds report "
+        "contents and is pruned by age and size (overrides WELLBIN_CONVERT_CACHE env var, default off)"
+    ),
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Re-convert PDFs even if their markdown is newer than the PDF (overrides WELLBIN_CONVERT_FORCE env var)",
+)
 def convert(
     input_dir: str | None,
     output_dir: str | None,
     preserve_structure: bool,
     file_type: str | None,
     enhanced_mode: bool,
+    workers: int | None,
+    cache: bool | None,
+    force: bool,
 ) -> None:
     """
     Convert medical PDFs to markdown format optimized for LLM consumption.
@@ -236,8 +308,17 @@ def convert(
 
         # Convert only lab reports with enhanced features
         uv run wellbin convert --file-type lab --enhanced-mode
+
+        # Limit conversion to two worker processes
+        uv run wellbin convert --workers 2
+
+        # Reuse cached extraction results for PDFs that have not changed
+        uv run wellbin convert --cache
+
+        # Re-convert everything, even PDFs whose markdown is up to date
+        uv run wellbin convert --force
     """
-    config = resolve_config(input_dir, output_dir, preserve_structure, file_type, enhanced_mode)
+    config = resolve_config(input_dir, output_dir, preserve_structure, file_type, enhanced_mode, workers, cache, force)
     display_config(config)
 
     converted_files = run_conversion(config)
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 import click
 from dotenv import load_dotenv
 
+from ..core.logging import OutputConfig, configure_output
 from ..core.scraper import DownloadResult, WellbinMedicalDownloader
 from ..core.utils import get_env_or_default, validate_credentials
 
@@ -24,6 +25,8 @@ class ScrapeConfig:
     study_types: list[str] = field(default_factory=lambda: ["FhirStudy"])
     output_dir: str = "medical_data"
     headless: bool = True
+    download_workers: int = 1
+    verbose: bool = False
 
     # Source tracking for display
     email_source: str = "ENV/Default"
@@ -32,6 +35,8 @@ class ScrapeConfig:
     types_source: str = "ENV/Default"
     output_source: str = "ENV/Default"
     headless_source: str = "ENV/Default"
+    download_workers_source: str = "ENV/Default"
+    verbose_source: str = "ENV/Default"
 
 
 def resolve_config(
@@ -41,6 +46,8 @@ def resolve_config(
     types: str | None,
     output: str | None,
     headless: bool | None,
+    download_workers: int | None = None,
+    verbose: bool = False,
 ) -> ScrapeConfig:
     """Resolve configuration from CLI args and environment variables.
 
@@ -51,6 +58,8 @@ def resolve_config(
         types: CLI types argument
         output: CLI output argument
         headless: CLI headless argument
+        download_workers: CLI concurrent download count argument
+        verbose: CLI flag to show debug output
 
     Returns:
         Resolved ScrapeConfig
@@ -101,6 +110,20 @@ def resolve_config(
     else:
         config.headless = get_env_or_default("WELLBIN_HEADLESS", "true", bool)
 
+    # Resolve concurrent downloads (1 = sequential)
+    if download_workers is not None:
+        config.download_workers = download_workers
+        config.download_workers_source = "CLI"
+    else:
+        config.download_workers = get_env_or_default("WELLBIN_DOWNLOAD_WORKERS", "1", int)
+
+    # Resolve debug output
+    if verbose:
+        config.verbose = True
+        config.verbose_source = "CLI"
+    else:
+        config.verbose = get_env_or_default("WELLBIN_DEBUG", "false", bool)
+
     return config
 
 
@@ -132,6 +155,9 @@ def display_config(config: ScrapeConfig, dry_run: bool) -> None:
     click.echo(f"🎯 Study types: {', '.join(config.study_types)}")
     click.echo(f"📁 Output directory: {config.output_dir}")
     click.echo(f"🤖 Headless mode: {config.headless}")
+    click.echo(f"⚡ Concurrent downloads: {config.download_workers}")
+    if config.verbose:
+        click.echo("🔍 Verbose: showing debug output")
 
     if dry_run:
         click.echo("🔍 DRY RUN MODE: Will not download files")
@@ -143,6 +169,8 @@ def display_config(config: ScrapeConfig, dry_run: bool) -> None:
     click.echo(f"   Types: {config.types_source}")
     click.echo(f"   Output: {config.output_source}")
     click.echo(f"   Headless: {config.headless_source}")
+    click.echo(f"   Download workers: {config.download_workers_source}")
+    click.echo(f"   Verbose: {config.verbose_source}")
     click.echo("=" * 50)
 
 
@@ -252,6 +280,18 @@ def _display_next_steps(output_dir: str) -> None:
     default=None,
     help="Run browser in headless mode (overrides WELLBIN_HEADLESS env var)",
 )
+@click.option(
+    "--download-workers",
+    "-w",
+    type=click.IntRange(min=1),
+    help="PDFs to download concurrently (default: 1, sequential; overrides WELLBIN_DOWNLOAD_WORKERS env var)",
+)
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Show debug output, including page link listings (overrides WELLBIN_DEBUG env var)",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -264,6 +304,8 @@ def scrape(
     types: str | None,
     output: str | None,
     headless: bool | None,
+    download_workers: int | None,
+    verbose: bool,
     dry_run: bool,
 ) -> None:
     """
@@ -292,8 +334,11 @@ def scrape(
 
         # Dry run to see what would be downloaded
         uv run wellbin scrape --dry-run --types DicomStudy
+
+        # Download two PDFs at a time
+        uv run wellbin scrape --download-workers 2
     """
-    config = resolve_config(email, password, limit, types, output, headless)
+    config = resolve_config(email, password, limit, types, output, headless, download_workers, verbose)
 
     # Validate credentials
     is_valid, message = validate_credentials(config.email, config.password)
@@ -310,6 +355,7 @@ def scrape(
         return
 
     # Create and run downloader
+    configure_output(OutputConfig(show_debug=config.verbose))
     downloader = WellbinMedicalDownloader(
         email=config.email,
         password=config.password,
@@ -317,6 +363,7 @@ def scrape(
         limit_studies=config.limit,
         study_types=config.study_types,
         output_dir=config.output_dir,
+        max_downloads=config.download_workers,
     )
 
     downloaded_files = downloader.scrape_studies()
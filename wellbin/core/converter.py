@@ -5,14 +5,25 @@ Contains the PDFToMarkdownConverter class for converting medical PDFs
 to markdown format optimized for LLM consumption.
 """
 
+import hashlib
+import importlib.metadata
+import io
 import json
+import os
+import re
+import time
+import zlib
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import redirect_stdout
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, TypedDict, cast
 
-import pymupdf4llm
-
 from .exceptions import (
     FileWriteError,
     InvalidConfigurationError,
@@ -32,10 +43,79 @@ MAX_PAGES_ENHANCED_MODE = 50  # Limit for enhanced mode to prevent memory issues
 MAIN_SECTION_MIN_SIZE = 12.0
 SUBSECTION_MIN_SIZE = 10.0
 PARAMETER_MIN_SIZE = 9.0
+SECTION_MIN_SIZE = min(MAIN_SECTION_MIN_SIZE, SUBSECTION_MIN_SIZE)
 
 # Processing options
 DEFAULT_TABLE_STRATEGY = "lines"
 DEFAULT_MARGINS = 10
+PAGE_SEPARATOR = "\n\n---\n\n"
+OUTPUT_FORMAT_VERSION = 1  # Bump when the markdown or sidecar layout changes
+WRITE_BUFFER_SIZE = 1 << 20  # Multi-MB enhanced outputs take a few large write() calls
+
+# Batch conversion: PDFs queued ahead per worker process (bounds in-flight work)
+PENDING_CONVERSIONS_PER_WORKER = 2
+
+# ============================================================================
+# Output Templates
+# ============================================================================
+
+STANDARD_HEADER_TEMPLATE = """# Medical Report: {base_name}
+
+**Source File:** `{base_name}.pdf`
+**Extracted:** {extracted}
+**Processor:** PyMuPDF4LLM Standard Mode
+
+---
+
+"""
+
+ENHANCED_HEADER_TEMPLATE = """# Medical Report: {base_name}
+
+**Source File:** `{base_name}.pdf`
+**Extracted:** {extracted}
+**Processor:** PyMuPDF4LLM Enhanced Mode
+**Optimized:** LLM medical data consumption
+**Total Pages:** {total_pages}
+**Tables Found:** {total_tables} tables detected
+**Words Extracted:** {word_count} words with positions
+
+---
+
+"""
+
+PAGE_HEADER_TEMPLATE = """
+## 📄 Page {page_num}
+
+**Page Number:** {page_num} of {total_pages}
+**Tables on Page:** {table_count}
+**Words on Page:** {word_count}
+
+"""
+
+WORD_FOOTER_TEMPLATE = """
+
+<!--
+========================================
+WORD POSITION DATA (HIDDEN SECTION)
+========================================
+Word-level position data for programmatic analysis is stored alongside this file.
+File: {words_file}
+Format: one JSON array per line: [x0, y0, x1, y1, "word_text", block_num, line_num, word_num]
+Coordinates are in PDF coordinate system.
+Total words: {word_count}
+-->
+"""
+
+# Shared compact encoder: json.dumps() with non-default arguments builds a new
+# encoder per call, and json.dump() streams through the pure-Python encoder
+COMPACT_JSON = json.JSONEncoder(separators=(",", ":"))
+
+# Extraction cache (opt-in), keyed by PDF content hash and mode. Entries hold the
+# extracted report text, so the cache is pruned by age and size before each run.
+DEFAULT_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "wellbin"
+CACHE_COMPRESSION_LEVEL = 1  # Extracted JSON shrinks several-fold even at the fastest level
+CACHE_MAX_AGE_DAYS = 30  # Drop entries not used for this many days
+CACHE_MAX_BYTES = 512 * 1024 * 1024  # Then drop least recently used entries above this total
 
 
 class PageChunk(TypedDict, total=False):
@@ -53,6 +133,52 @@ class PageChunk(TypedDict, total=False):
 
 
 @dataclass
+class WordColumns:
+    """Word positions stored column-wise (struct of arrays).
+
+    pymupdf4llm yields one 8-tuple per word; keeping coordinates and indices in
+    typed arrays avoids a boxed Python object per field.
+    """
+
+    x0: array[float] = field(default_factory=lambda: array("d"))
+    y0: array[float] = field(default_factory=lambda: array("d"))
+    x1: array[float] = field(default_factory=lambda: array("d"))
+    y1: array[float] = field(default_factory=lambda: array("d"))
+    text: list[str] = field(default_factory=list)
+    block: array[int] = field(default_factory=lambda: array("i"))
+    line: array[int] = field(default_factory=lambda: array("i"))
+    word: array[int] = field(default_factory=lambda: array("i"))
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def extend(self, words: list[list[Any]]) -> None:
+        """Append words given as ``[x0, y0, x1, y1, text, block, line, word]`` rows.
+
+        Rows are transposed with ``zip(*words)`` so each column is extended in
+        one C-level call rather than eight appends per word.
+        """
+        if not words:
+            return
+        x0, y0, x1, y1, text, block, line, word = zip(*words, strict=True)
+        self.x0.extend(x0)
+        self.y0.extend(y0)
+        self.x1.extend(x1)
+        self.y1.extend(y1)
+        self.text.extend(text)
+        self.block.extend(block)
+        self.line.extend(line)
+        self.word.extend(word)
+
+    def iter_jsonl(self) -> Iterator[str]:
+        """Yield one compact JSON row per word, newline-terminated."""
+        columns = (self.x0, self.y0, self.x1, self.y1, self.text, self.block, self.line, self.word)
+        encode = COMPACT_JSON.encode
+        for row in zip(*columns, strict=True):
+            yield encode(row) + "\n"
+
+
+@dataclass(slots=True)
 class ConversionStats:
     """Statistics about a PDF conversion."""
 
@@ -63,11 +189,12 @@ class ConversionStats:
     total_bytes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversionResult:
     """Result of a batch conversion operation."""
 
     successful: int = 0
+    skipped: int = 0  # Already up to date; their outputs still count towards files and bytes
     failed: int = 0
     total_files: int = 0
     total_bytes: int = 0
@@ -84,11 +211,15 @@ class PDFToMarkdownConverter:
 
     def __init__(
         self,
-        pdf_dir: str = "medical_data",
-        output_dir: str = "markdown_reports",
+        pdf_dir: str | Path = "medical_data",
+        output_dir: str | Path = "markdown_reports",
         enhanced_mode: bool = False,
         max_pdf_size_mb: float = MAX_PDF_SIZE_MB,
         max_pages_enhanced: int = MAX_PAGES_ENHANCED_MODE,
+        max_workers: int | None = None,
+        cache_dir: str | Path | None = None,
+        show_progress: bool = False,
+        force: bool = False,
     ) -> None:
         """
         Initialize PDF to Markdown converter with enhanced PyMuPDF4LLM features
@@ -99,6 +230,10 @@ class PDFToMarkdownConverter:
             enhanced_mode: Enable advanced features (page chunks, word positions, etc.)
             max_pdf_size_mb: Maximum PDF size before warning (MB)
             max_pages_enhanced: Maximum pages for enhanced mode before warning
+            max_workers: Worker processes for batch conversion (None or 0 = one per CPU core)
+            cache_dir: Directory for cached extraction results (None disables caching)
+            show_progress: Show pymupdf4llm's per-page progress bar in enhanced mode
+            force: Re-convert PDFs even when their markdown is newer than the PDF
 
         Raises:
             InvalidConfigurationError: If directories cannot be created or accessed
@@ -108,10 +243,22 @@ class PDFToMarkdownConverter:
         self.enhanced_mode = enhanced_mode
         self.max_pdf_size_mb = max_pdf_size_mb
         self.max_pages_enhanced = max_pages_enhanced
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.show_progress = show_progress
+        self.force = force
+        self.bytes_written = 0  # Running total of output bytes, so summaries need no stat()
+        self.manifest: dict[str, dict[str, str | int]] = {}  # Output stem -> settings it was produced with
+
+        # Bind the mode-specific extractor once instead of branching per PDF
+        self._extract: Callable[[Path | bytes], str | list[PageChunk]] = (
+            self._extract_enhanced_mode if enhanced_mode else self._extract_standard_mode
+        )
         self.out: Output = get_output()
 
         # Validate and create output directory
         self._validate_and_create_output_dir()
+        self._load_manifest()
 
     # Class constants for medical header detection
     MAIN_SECTIONS: tuple[str, ...] = (
@@ -170,6 +317,16 @@ class PDFToMarkdownConverter:
         "CONCENTRACION",
     )
 
+    # Keyword sets compiled once so each span is scanned in a single regex pass
+    _MAIN_SECTION_RE: re.Pattern[str] = re.compile("|".join(map(re.escape, MAIN_SECTIONS)))
+    _SUBSECTION_RE: re.Pattern[str] = re.compile("|".join(map(re.escape, SUBSECTIONS)))
+
+    # Preset zlib dictionary for cache entries: chunk keys and section names
+    # recur in every report, so even small entries compress well
+    MANIFEST_FILENAME: str = ".convert-manifest.json"
+
+    _CACHE_ZDICT: bytes = ('{"text":"tables":[],"words":[]}' + " ".join(MAIN_SECTIONS + SUBSECTIONS)).encode()
+
     def medical_header_detector(self, span: dict[str, Any], page: Any | None = None) -> str:
         """Custom header detection optimized for medical documents.
 
@@ -182,36 +339,68 @@ class PDFToMarkdownConverter:
         Returns:
             Markdown header prefix ('## ', '### ', '#### ', or '')
         """
-        text = span.get("text", "").strip()
-        size = span.get("size", 0)
-        font = span.get("font", "").lower()
-        text_upper = text.upper()
+        # pymupdf4llm always supplies these keys; index directly on the hot path
+        try:
+            size, font = span["size"], span["font"]
+            if not self._font_can_be_header(size, font):
+                return ""
+            return self._classify_span(span["text"], size, font)
+        except KeyError:
+            return ""
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _font_can_be_header(size: float, font: str) -> bool:
+        """Check whether any text in this size and font could be a header.
+
+        A document uses only a few size/font pairs, so this decision is made
+        once per pair. Small regular body text then skips text classification
+        and does not crowd recurring headers out of its cache.
+        """
+        return size >= min(SECTION_MIN_SIZE, PARAMETER_MIN_SIZE) or "bold" in font.lower()
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _classify_span(cls, text: str, size: float, font: str) -> str:
+        """Map a span's raw text, size and font to a header prefix.
+
+        Cached because section titles, labels and fonts recur on every page of
+        a report, so most spans are repeats of one already classified.
+        """
+        text = text.strip()
+        font = font.lower()
 
-        # Check for main sections (H2)
-        if self._is_main_section(text_upper, size, font):
-            return "## "
+        # Case-fold once, and only for spans large or bold enough to be a section
+        if size >= SECTION_MIN_SIZE or "bold" in font:
+            text_upper = text.upper()
 
-        # Check for subsections (H3)
-        if self._is_subsection(text_upper, size):
-            return "### "
+            # Check for main sections (H2)
+            if cls._is_main_section(text_upper, size, font):
+                return "## "
+
+            # Check for subsections (H3)
+            if cls._is_subsection(text_upper, size):
+                return "### "
 
         # Parameter headers (H4)
-        if self._is_parameter_header(text, size):
+        if cls._is_parameter_header(text, size):
             return "#### "
 
         return ""
 
-    def _is_main_section(self, text_upper: str, size: float, font: str) -> bool:
+    @classmethod
+    def _is_main_section(cls, text_upper: str, size: float, font: str) -> bool:
         """Check if text is a main medical section header."""
-        if not any(section in text_upper for section in self.MAIN_SECTIONS):
+        if size < MAIN_SECTION_MIN_SIZE and "bold" not in font:
             return False
-        return size >= MAIN_SECTION_MIN_SIZE or "bold" in font
+        return cls._MAIN_SECTION_RE.search(text_upper) is not None
 
-    def _is_subsection(self, text_upper: str, size: float) -> bool:
+    @classmethod
+    def _is_subsection(cls, text_upper: str, size: float) -> bool:
         """Check if text is a subsection header."""
-        if not any(section in text_upper for section in self.SUBSECTIONS):
+        if size < SUBSECTION_MIN_SIZE:
             return False
-        return size >= SUBSECTION_MIN_SIZE
+        return cls._SUBSECTION_RE.search(text_upper) is not None
 
     @staticmethod
     def _is_parameter_header(text: str, size: float) -> bool:
@@ -261,16 +450,81 @@ class PDFToMarkdownConverter:
         """
         self._check_pdf_size(pdf_path)
 
-        try:
-            if self.enhanced_mode:
-                return self._extract_enhanced_mode(pdf_path)
-            else:
-                return self._extract_standard_mode(pdf_path)
+        # With caching on, the PDF is read once: the same bytes are hashed and parsed
+        pdf_bytes = self._read_pdf_bytes(pdf_path) if self.cache_dir is not None else None
+        cache_path = self._cache_path(pdf_path, pdf_bytes)
+        if cache_path is not None:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return cached
 
+        try:
+            result = self._extract(pdf_path if pdf_bytes is None else pdf_bytes)
         except Exception as e:
             self.out.error(f"Error extracting markdown from {pdf_path}: {e}")
             return None
 
+        if cache_path is not None and result:
+            self._store_cached(cache_path, result)
+        return result
+
+    @staticmethod
+    def _read_pdf_bytes(pdf_path: Path) -> bytes | None:
+        """Read a PDF into memory, or None if it is unreadable (extraction reports it)."""
+        try:
+            return pdf_path.read_bytes()
+        except OSError:
+            return None
+
+    def _cache_path(self, pdf_path: Path, pdf_bytes: bytes | None = None) -> Path | None:
+        """Return the cache file for a PDF, keyed by content hash and mode.
+
+        Args:
+            pdf_path: Path to the PDF file
+            pdf_bytes: PDF content already in memory (read from pdf_path if None)
+
+        Returns:
+            Cache file path, or None if caching is disabled or the PDF is unreadable
+        """
+        if self.cache_dir is None:
+            return None
+        if pdf_bytes is None:
+            pdf_bytes = self._read_pdf_bytes(pdf_path)
+            if pdf_bytes is None:
+                return None  # Let extraction report the problem
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        mode = "enh" if self.enhanced_mode else "std"
+        return self.cache_dir / f"{digest}-{mode}-{_extractor_version()}.json.z"
+
+    def _load_cached(self, cache_path: Path) -> str | list[PageChunk] | None:
+        """Load a cached extraction result, ignoring missing or unreadable entries."""
+        try:
+            with open(cache_path, "rb") as f:
+                data = zlib.decompressobj(zdict=self._CACHE_ZDICT).decompress(f.read())
+            os.utime(cache_path)  # Mark as recently used for prune_cache()
+            return cast(str | list[PageChunk], json.loads(data))
+        except (OSError, ValueError, zlib.error):
+            return None
+
+    def _store_cached(self, cache_path: Path, result: str | list[PageChunk]) -> None:
+        """Store an extraction result in the cache.
+
+        The entry is zlib-compressed against a preset dictionary, written to
+        a temporary file and renamed into place so concurrent workers never
+        observe a partial entry. Failures are ignored since the cache is only
+        an optimization.
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            compressor = zlib.compressobj(CACHE_COMPRESSION_LEVEL, zdict=self._CACHE_ZDICT)
+            data = compressor.compress(COMPACT_JSON.encode(result).encode("utf-8")) + compressor.flush()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+
     def _check_pdf_size(self, pdf_path: Path) -> None:
         """Check PDF file size and warn if it exceeds thresholds.
 
@@ -286,46 +540,58 @@ class PDFToMarkdownConverter:
         except OSError:
             pass  # File doesn't exist or is inaccessible, let extraction fail naturally
 
-    def _extract_enhanced_mode(self, pdf_path: Path) -> list[PageChunk]:
+    def _extract_enhanced_mode(self, pdf_source: Path | bytes) -> list[PageChunk]:
         """Extract PDF in enhanced mode with page chunks and rich metadata.
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf_source: Path to the PDF file, or its content already in memory
 
         Returns:
             List of PageChunk dictionaries with page-by-page data
         """
-        return cast(
-            list[PageChunk],
-            pymupdf4llm.to_markdown(
-                str(pdf_path),
-                page_chunks=True,  # Rich page-by-page data
-                extract_words=True,  # Word-level extraction
-                ignore_images=True,  # Skip image processing entirely
-                table_strategy=DEFAULT_TABLE_STRATEGY,
-                hdr_info=self.medical_header_detector,
-                margins=DEFAULT_MARGINS,
-                show_progress=True,
-            ),
-        )
-
-    def _extract_standard_mode(self, pdf_path: Path) -> str:
+        doc = _open_pdf(pdf_source)
+        try:
+            if doc.page_count > self.max_pages_enhanced:
+                self.out.warning(
+                    f"Large document ({doc.page_count} pages). Consider using standard mode for better memory usage."
+                )
+            return cast(
+                list[PageChunk],
+                _to_markdown(
+                    doc,
+                    page_chunks=True,  # Rich page-by-page data
+                    extract_words=True,  # Word-level extraction
+                    ignore_images=True,  # Skip image processing entirely
+                    table_strategy=DEFAULT_TABLE_STRATEGY,
+                    hdr_info=self.medical_header_detector,
+                    margins=DEFAULT_MARGINS,
+                    show_progress=self.show_progress,
+                ),
+            )
+        finally:
+            doc.close()
+
+    def _extract_standard_mode(self, pdf_source: Path | bytes) -> str:
         """Extract PDF in standard mode (simple markdown).
 
         Args:
-            pdf_path: Path to the PDF file
+            pdf_source: Path to the PDF file, or its content already in memory
 
         Returns:
             Markdown string with document content
         """
-        return cast(
-            str,
-            pymupdf4llm.to_markdown(str(pdf_path), hdr_info=self.medical_header_detector),
-        )
+        doc = _open_pdf(pdf_source)
+        try:
+            return cast(str, _to_markdown(doc, hdr_info=self.medical_header_detector))
+        finally:
+            doc.close()
 
     def save_enhanced_chunks(self, chunks: str | list[PageChunk], pdf_path: Path) -> list[Path]:
         """Save enhanced page chunks embedded in a single markdown file.
 
+        Word positions, when present, go to a ``<name>.words.jsonl`` sidecar
+        (one JSON row per word) so the markdown stays small for LLM ingestion.
+
         Args:
             chunks: Either markdown string (standard) or list of PageChunk dicts (enhanced)
             pdf_path: Original PDF path for naming
@@ -335,45 +601,72 @@ class PDFToMarkdownConverter:
         """
         base_name = pdf_path.stem
         output_path = self.output_dir / f"{base_name}.md"
+        created_files = [output_path]
 
+        words_path = self.output_dir / f"{base_name}.words.jsonl"
+        all_words = None
         if isinstance(chunks, list):
-            content = self._build_enhanced_document(chunks, base_name)
+            content, all_words = self._build_enhanced_document(chunks, base_name)
+            if all_words:
+                self._write_markdown_file(words_path, all_words.iter_jsonl())
+                created_files.append(words_path)
         else:
             content = self._build_standard_document(chunks, base_name)
+        if not all_words:
+            words_path.unlink(missing_ok=True)  # Drop a sidecar left by an earlier enhanced run
 
         self._write_markdown_file(output_path, content)
-        return [output_path]
+        return created_files
 
-    def _build_enhanced_document(self, chunks: list[PageChunk], base_name: str) -> str:
+    def _build_enhanced_document(self, chunks: list[PageChunk], base_name: str) -> tuple[list[str], WordColumns]:
         """Build complete enhanced markdown document from page chunks.
 
+        Page sections, word data and table totals are gathered in a single
+        pass over the chunks; the header slot is filled once totals are known.
+        Headers, page text and separators stay separate parts so nothing is
+        concatenated before writing.
+
         Args:
             chunks: List of PageChunk dictionaries
             base_name: Base filename for the document
 
         Returns:
-            Complete markdown document string
+            Document parts in order, and word data collected from every page
         """
-        # Collect metadata and word data
-        all_words = self._collect_all_words(chunks)
-        total_tables = sum(len(chunk.get("tables", [])) for chunk in chunks)
-
-        # Build document header
-        header = self._build_enhanced_header(base_name, len(chunks), total_tables, len(all_words))
+        all_words = WordColumns()
+        total_pages = len(chunks)
+        total_tables = 0
+        parts = [""]  # Header slot
 
-        # Build page sections
-        page_sections = self._build_page_sections(chunks, len(chunks))
+        for i, chunk in enumerate(chunks):
+            page_tables = chunk.get("tables", [])
+            page_words = chunk.get("words", [])
+            total_tables += len(page_tables)
+            all_words.extend(page_words)
+
+            if i:
+                parts.append(PAGE_SEPARATOR)
+            parts.append(
+                PAGE_HEADER_TEMPLATE.format_map(
+                    {
+                        "page_num": i + 1,
+                        "total_pages": total_pages,
+                        "table_count": len(page_tables),
+                        "word_count": len(page_words),
+                    }
+                )
+            )
+            parts.append(chunk["text"])
 
-        # Combine content
-        full_content = header + "\n\n---\n\n".join(page_sections)
+        parts[0] = self._build_enhanced_header(base_name, total_pages, total_tables, len(all_words))
 
-        # Add word position footer if available
+        # Point to the word position sidecar if available
         if all_words:
-            full_content += self._build_word_footer(all_words)
+            parts.append(self._build_word_footer(all_words, f"{base_name}.words.jsonl"))
 
-        return full_content
+        return parts, all_words
 
-    def _build_standard_document(self, markdown: str, base_name: str) -> str:
+    def _build_standard_document(self, markdown: str, base_name: str) -> list[str]:
         """Build standard markdown document with header.
 
         Args:
@@ -381,33 +674,10 @@ class PDFToMarkdownConverter:
             base_name: Base filename for the document
 
         Returns:
-            Complete markdown document string
-        """
-        header = f"""# Medical Report: {base_name}
-
-**Source File:** `{base_name}.pdf`
-**Extracted:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-**Processor:** PyMuPDF4LLM Standard Mode
-
----
-
-"""
-        return header + markdown
-
-    def _collect_all_words(self, chunks: list[PageChunk]) -> list[Any]:
-        """Collect all word data from page chunks.
-
-        Args:
-            chunks: List of PageChunk dictionaries
-
-        Returns:
-            Combined list of all word data
+            Document parts (header and markdown body)
         """
-        all_words: list[Any] = []
-        for chunk in chunks:
-            if "words" in chunk:
-                all_words.extend(chunk["words"])
-        return all_words
+        header = STANDARD_HEADER_TEMPLATE.format_map({"base_name": base_name, "extracted": _timestamp()})
+        return [header, markdown]
 
     def _build_enhanced_header(self, base_name: str, total_pages: int, total_tables: int, word_count: int) -> str:
         """Build enhanced document header with metadata.
@@ -421,94 +691,59 @@ class PDFToMarkdownConverter:
         Returns:
             Header markdown string
         """
-        return f"""# Medical Report: {base_name}
-
-**Source File:** `{base_name}.pdf`
-**Extracted:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-**Processor:** PyMuPDF4LLM Enhanced Mode
-**Optimized:** LLM medical data consumption
-**Total Pages:** {total_pages}
-**Tables Found:** {total_tables} tables detected
-**Words Extracted:** {word_count} words with positions
-
----
-
-"""
-
-    def _build_page_sections(self, chunks: list[PageChunk], total_pages: int) -> list[str]:
-        """Build individual page section content.
-
-        Args:
-            chunks: List of PageChunk dictionaries
-            total_pages: Total number of pages
-
-        Returns:
-            List of page section markdown strings
-        """
-        sections: list[str] = []
-        for i, chunk in enumerate(chunks):
-            page_num = i + 1
-            page_tables = chunk.get("tables", [])
-            page_words = chunk.get("words", [])
-
-            page_header = f"""
-## 📄 Page {page_num}
-
-**Page Number:** {page_num} of {total_pages}
-**Tables on Page:** {len(page_tables)}
-**Words on Page:** {len(page_words)}
-
-"""
-            sections.append(page_header + chunk["text"])
-
-        return sections
+        return ENHANCED_HEADER_TEMPLATE.format_map(
+            {
+                "base_name": base_name,
+                "extracted": _timestamp(),
+                "total_pages": total_pages,
+                "total_tables": total_tables,
+                "word_count": word_count,
+            }
+        )
 
-    def _build_word_footer(self, all_words: list[Any]) -> str:
-        """Build hidden footer with word position data.
+    def _build_word_footer(self, all_words: WordColumns, words_file: str) -> str:
+        """Build hidden footer pointing to the word position sidecar file.
 
         Args:
-            all_words: List of word position data
+            all_words: Word position data in columnar form
+            words_file: Name of the sidecar file holding the word rows
 
         Returns:
             Footer markdown string
         """
-        return f"""
-
-<!--
-========================================
-WORD POSITION DATA (HIDDEN SECTION)
-========================================
-This section contains word-level position data for programmatic analysis.
-Format: [x0, y0, x1, y1, "word_text", block_num, line_num, word_num]
-Coordinates are in PDF coordinate system.
-Total words: {len(all_words)}
--->
-
-<details>
-<summary>📊 Word Position Data (Click to expand)</summary>
+        return WORD_FOOTER_TEMPLATE.format_map({"words_file": words_file, "word_count": len(all_words)})
 
-```json
-{json.dumps(all_words, indent=2)}
-```
-
-</details>
-
-<!-- End of word position data -->
-"""
-
-    def _write_markdown_file(self, output_path: Path, content: str) -> None:
+    def _write_markdown_file(self, output_path: Path, content: str | Iterable[str]) -> int:
         """Write markdown content to file with error handling.
 
+        Content is encoded here rather than by a text-mode file so the byte
+        count is known without stat-ing the file afterwards. Parts go through
+        a 1 MiB buffer into a temporary sibling that is renamed over
+        ``output_path`` once complete, so an interrupted write never leaves a
+        truncated file that the up-to-date check would later skip.
+
         Args:
             output_path: Path to write the file
-            content: Markdown content to write
+            content: Markdown content, or an iterable of parts written in order
+
+        Returns:
+            Number of bytes written (also added to ``bytes_written``)
 
         Raises:
             FileWriteError: If file cannot be written
         """
+        parts = (content,) if isinstance(content, str) else content
+        tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+        size = 0
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            try:
+                with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                    for part in parts:
+                        size += f.write(part.encode("utf-8"))
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
         except PermissionError as e:
             raise FileWriteError(
                 f"Permission denied writing to {output_path}",
@@ -519,6 +754,8 @@ Total words: {len(all_words)}
                 f"Failed to write file {output_path}",
                 details=str(e),
             ) from e
+        self.bytes_written += size
+        return size
 
     def convert_pdf_to_markdown(self, pdf_path: Path) -> list[Path] | None:
         """Convert a single PDF to markdown using enhanced PyMuPDF4LLM features.
@@ -533,6 +770,21 @@ Total words: {len(all_words)}
             Custom exceptions (PDFProcessingError, FileWriteError) are caught and
             logged, returning None to allow batch processing to continue.
         """
+        up_to_date = self._up_to_date_outputs(pdf_path)
+        if up_to_date is not None:
+            self._print_skip(pdf_path)
+            return up_to_date[0]
+        return self._convert_pdf(pdf_path)
+
+    def _convert_pdf(self, pdf_path: Path) -> list[Path] | None:
+        """Extract and save a PDF without checking whether its output is up to date.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            List of created file paths, or None on failure
+        """
         try:
             self._print_conversion_start(pdf_path)
 
@@ -540,8 +792,9 @@ Total words: {len(all_words)}
             if not result:
                 return None
 
+            bytes_before = self.bytes_written
             converted_files = self.save_enhanced_chunks(result, pdf_path)
-            self._print_conversion_summary(converted_files)
+            self._print_conversion_summary(converted_files, self.bytes_written - bytes_before)
 
             if self.enhanced_mode and isinstance(result, list):
                 self._print_feature_stats(result)
@@ -562,15 +815,88 @@ Total words: {len(all_words)}
             self.out.error(f"  Unexpected error converting {pdf_path.name}: {e}")
             return None
 
+    def _up_to_date_outputs(self, pdf_path: Path) -> tuple[list[Path], int] | None:
+        """Return existing outputs if they are newer than the PDF (make-style check).
+
+        Outputs only count as up to date when the manifest shows they were
+        produced with the current mode, output format and extractor version.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Existing output paths and their total size in bytes, or None if
+            the PDF needs converting
+        """
+        if self.force or self.manifest.get(pdf_path.stem) != self._output_settings():
+            return None
+        output_path = self.output_dir / f"{pdf_path.stem}.md"
+        try:
+            output_stat = output_path.stat()
+            # Integer nanoseconds avoid float rounding on equal timestamps; an
+            # empty markdown file is never a finished conversion.
+            if output_stat.st_size == 0 or output_stat.st_mtime_ns < pdf_path.stat().st_mtime_ns:
+                return None
+        except OSError:
+            return None  # Missing output (or PDF): convert and let errors surface there
+
+        outputs = [output_path]
+        size = output_stat.st_size
+        if self.enhanced_mode:
+            words_path = self.output_dir / f"{pdf_path.stem}.words.jsonl"
+            try:
+                size += words_path.stat().st_size
+                outputs.append(words_path)
+            except OSError:
+                pass  # Documents without words have no sidecar
+        return outputs, size
+
+    def _output_settings(self) -> dict[str, str | int]:
+        """Describe the settings that produce this converter's output."""
+        return {
+            "mode": "enhanced" if self.enhanced_mode else "standard",
+            "format": OUTPUT_FORMAT_VERSION,
+            "pymupdf4llm": _extractor_version(),
+        }
+
+    def _manifest_path(self) -> Path:
+        """Path of the conversion manifest inside the output directory."""
+        return self.output_dir / self.MANIFEST_FILENAME
+
+    def _load_manifest(self) -> None:
+        """Load the settings of previous conversions, ignoring a missing or corrupt manifest."""
+        try:
+            with open(self._manifest_path(), encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {}
+
+    def _save_manifest(self) -> None:
+        """Atomically write the conversion manifest.
+
+        An unwritable manifest only means its PDFs are converted again.
+        """
+        path = self._manifest_path()
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.out.warning(f"Could not save conversion manifest: {e}")
+
+    def _print_skip(self, pdf_path: Path) -> None:
+        """Print the message for a PDF whose output is already up to date."""
+        self.out.log("\u23ed\ufe0f", f" Skipping {pdf_path.name} (output is up to date)")
+
     def _print_conversion_start(self, pdf_path: Path) -> None:
         """Print conversion start message."""
         self.out.log("\U0001f4c4", f"Converting {pdf_path.name}...")
         if self.enhanced_mode:
             self.out.action("  Enhanced mode: embedded page chunks + tables + word positions (no images)")
 
-    def _print_conversion_summary(self, converted_files: list[Path]) -> None:
+    def _print_conversion_summary(self, converted_files: list[Path], total_size: int) -> None:
         """Print summary of converted files."""
-        total_size = sum(f.stat().st_size for f in converted_files)
         self.out.success(f"  Saved {len(converted_files)} files ({total_size:,} bytes)")
 
     def _print_feature_stats(self, result: list[PageChunk]) -> None:
@@ -624,11 +950,14 @@ Total words: {len(all_words)}
         Returns:
             List of PDF paths, None if directory doesn't exist or is empty
         """
-        if not self.pdf_dir.exists():
+        # scandir entries carry the file type from the directory read, avoiding a stat per entry;
+        # a missing directory surfaces from the scan itself rather than a separate exists() check
+        try:
+            with os.scandir(self.pdf_dir) as entries:
+                pdf_files = [Path(e.path) for e in entries if e.name.endswith(".pdf") and e.is_file()]
+        except (FileNotFoundError, NotADirectoryError):
             self.out.error(f"PDF directory {self.pdf_dir} not found")
             return None
-
-        pdf_files = list(self.pdf_dir.glob("*.pdf"))
         if not pdf_files:
             self.out.error(f"No PDF files found in {self.pdf_dir}")
             return None
@@ -654,20 +983,112 @@ Total words: {len(all_words)}
         """
         result = ConversionResult(total_files=len(pdf_files))
         successful_files: list[Path] = []
+        sorted_files = sorted(pdf_files)
 
-        for pdf_path in sorted(pdf_files):
-            converted = self.convert_pdf_to_markdown(pdf_path)
-            if converted:
-                successful_files.extend(converted)
-                result.successful += 1
-            else:
-                result.failed += 1
-                result.failed_files.append(pdf_path)
+        settings = self._output_settings()
+        manifest_changed = False
+
+        batch = zip(sorted_files, self._convert_batch(sorted_files), strict=True)
+        try:
+            for index, (pdf_path, (converted, size, skipped)) in enumerate(batch, 1):
+                if converted and skipped:
+                    successful_files.extend(converted)
+                    result.skipped += 1
+                    result.total_bytes += size
+                    self.out.step(index, result.total_files, "\u23ed\ufe0f", f"Up to date {pdf_path.name}")
+                elif converted:
+                    successful_files.extend(converted)
+                    result.successful += 1
+                    result.total_bytes += size
+                    # Recorded here, not in the worker, so pool conversions reach the manifest too
+                    if self.manifest.get(pdf_path.stem) != settings:
+                        self.manifest[pdf_path.stem] = settings
+                        manifest_changed = True
+                    self.out.step(index, result.total_files, "\u2705", f"Completed {pdf_path.name}")
+                else:
+                    result.failed += 1
+                    result.failed_files.append(pdf_path)
+                    self.out.step(index, result.total_files, "\u274c", f"Failed {pdf_path.name}")
+        finally:
+            if manifest_changed:
+                self._save_manifest()
 
         result.successful_files = successful_files
-        result.total_bytes = sum(f.stat().st_size for f in successful_files) if successful_files else 0
         return result
 
+    def _convert_batch(self, pdf_files: list[Path]) -> Iterator[tuple[list[Path] | None, int, bool]]:
+        """Convert PDFs, fanning out across worker processes when worthwhile.
+
+        Each PDF is independent and extraction is CPU-bound, so batches are
+        spread over a process pool. Submission is bounded to a small window per
+        worker, so workers keep parsing while earlier results are consumed
+        without queueing the whole batch up front. Worker output is buffered
+        per PDF and printed here in one write, so workers never contend for
+        stdout and each file's messages stay together. PDFs whose output is
+        already up to date are resolved in-process and do not count towards
+        the pool size; if at most one PDF needs extracting (or
+        ``max_workers=1``) everything runs in-process to avoid pool startup cost.
+        Each PDF's output is checked once, here, and the result reused.
+
+        Args:
+            pdf_files: PDF paths to convert
+
+        Yields:
+            Conversion result, bytes its outputs take and whether it was
+            skipped as up to date, for each PDF in input order
+        """
+        up_to_date = [self._up_to_date_outputs(pdf_path) for pdf_path in pdf_files]
+        workers = min(self.max_workers, sum(outputs is None for outputs in up_to_date))
+        if workers <= 1:
+            for pdf_path, existing in zip(pdf_files, up_to_date, strict=True):
+                if existing is None:
+                    yield *self._convert_and_measure(pdf_path), False
+                else:
+                    self._print_skip(pdf_path)
+                    yield *existing, True
+            return
+
+        window = workers * PENDING_CONVERSIONS_PER_WORKER
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            pending: deque[tuple[Future[tuple[list[Path] | None, int, str]], bool]] = deque()
+            for pdf_path, existing in zip(pdf_files, up_to_date, strict=True):
+                if len(pending) >= window:
+                    future, skipped = pending.popleft()
+                    yield *_flush_worker_output(future.result()), skipped
+                if existing is None:
+                    pending.append((executor.submit(_convert_one, pdf_path), False))
+                else:
+                    pending.append((self._skip_in_parent(pdf_path, *existing), True))
+            while pending:
+                future, skipped = pending.popleft()
+                yield *_flush_worker_output(future.result()), skipped
+
+    def _skip_in_parent(
+        self, pdf_path: Path, outputs: list[Path], size: int
+    ) -> Future[tuple[list[Path] | None, int, str]]:
+        """Resolve an up-to-date PDF in this process, buffering its output like a pool worker.
+
+        Queueing the result behind pool results keeps every file's messages
+        in input order.
+
+        Args:
+            pdf_path: Path to the PDF file
+            outputs: Its existing outputs, as found by the up-to-date check
+            size: Total size of those outputs in bytes
+        """
+        future: Future[tuple[list[Path] | None, int, str]] = Future()
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            self._print_skip(pdf_path)
+        future.set_result((outputs, size, buffer.getvalue()))
+        return future
+
+    def _convert_and_measure(self, pdf_path: Path) -> tuple[list[Path] | None, int]:
+        """Convert one stale PDF and report the bytes its output files took."""
+        bytes_before = self.bytes_written
+        converted = self._convert_pdf(pdf_path)
+        return converted, self.bytes_written - bytes_before
+
     def _print_batch_summary(self, result: ConversionResult) -> None:
         """Print batch conversion summary.
 
@@ -676,14 +1097,16 @@ Total words: {len(all_words)}
         """
         self.out.header("\U0001f389 CONVERSION COMPLETE!")
         self.out.success(f"Successfully converted: {result.successful} PDFs")
-        self.out.log("\U0001f4c4", f"Total markdown files: {len(result.successful_files)}")
+        if result.skipped > 0:
+            self.out.log("\u23ed\ufe0f", f"Skipped (already up to date): {result.skipped} PDFs")
+        self.out.log("\U0001f4c4", f"Total output files: {len(result.successful_files)}")
 
         if result.failed > 0:
             self.out.error(f"Failed conversions: {result.failed} files")
             for failed in result.failed_files:
                 self.out.log("", f"   - {failed.name}")
 
-        if result.successful > 0:
+        if result.successful > 0 or result.skipped > 0:
             self._print_results_summary(result)
 
     def _print_results_summary(self, result: ConversionResult) -> None:
@@ -701,13 +1124,130 @@ Total words: {len(all_words)}
         if self.enhanced_mode:
             self.out.action("   Enhanced features: \u2713")
             self.out.log("\U0001f4d1", "   Page chunks: Embedded as sections in single files")
-            self.out.progress("   Word positions: Embedded in footer sections")
+            self.out.progress("   Word positions: Sidecar .words.jsonl files")
+
+
+def prune_cache(
+    cache_dir: str | Path,
+    max_age_days: float = CACHE_MAX_AGE_DAYS,
+    max_bytes: int = CACHE_MAX_BYTES,
+) -> int:
+    """Remove stale and excess entries from the extraction cache.
+
+    Entries unused for more than max_age_days are removed first; if the rest
+    still exceed max_bytes, the least recently used ones are removed until the
+    cache fits. Files that cannot be inspected or removed are skipped.
+
+    Args:
+        cache_dir: Extraction cache directory
+        max_age_days: Maximum age of an entry since it was last used
+        max_bytes: Maximum total size of the remaining entries
+
+    Returns:
+        Number of entries removed
+    """
+    cutoff = time.time() - max_age_days * 86400
+    entries: list[tuple[float, int, Path]] = []
+    removed = 0
+    for path in Path(cache_dir).glob("*.json.z*"):
+        try:
+            st = path.stat()
+            if st.st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+            else:
+                entries.append((st.st_mtime, st.st_size, path))
+        except OSError:
+            continue
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+@cache
+def _extractor_version() -> str:
+    """Installed pymupdf4llm version, so upgrading it invalidates cached extractions."""
+    try:
+        return importlib.metadata.version("pymupdf4llm")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _open_pdf(pdf_source: Path | bytes) -> Any:
+    """Open a PDF from a path or in-memory bytes with PyMuPDF, importing it on first use."""
+    import pymupdf
+
+    if isinstance(pdf_source, bytes):
+        return pymupdf.open(stream=pdf_source, filetype="pdf")
+    return pymupdf.open(pdf_source)
+
+
+def _to_markdown(doc: Any, **kwargs: Any) -> Any:
+    """Run pymupdf4llm.to_markdown, importing it on first use.
+
+    PyMuPDF is a heavy extension module; deferring it keeps ``wellbin --help``,
+    the scraper and tests that never extract a PDF from loading it.
+    """
+    import pymupdf4llm
+
+    return pymupdf4llm.to_markdown(doc, **kwargs)
+
+
+def _timestamp() -> str:
+    """Return the extraction timestamp shown in document headers."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# Converter installed in each batch worker process by _init_worker
+_worker_converter: PDFToMarkdownConverter | None = None
+
+
+def _init_worker(converter: PDFToMarkdownConverter) -> None:
+    """Install the converter used by a batch worker process."""
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_one(pdf_path: Path) -> tuple[list[Path] | None, int, str]:
+    """Convert a single PDF inside a batch worker process, capturing its output."""
+    assert _worker_converter is not None, "Worker converter should be initialized"  # nosec
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        converted, size = _worker_converter._convert_and_measure(pdf_path)
+    return converted, size, buffer.getvalue()
+
+
+def _flush_worker_output(outcome: tuple[list[Path] | None, int, str]) -> tuple[list[Path] | None, int]:
+    """Print a worker's buffered output in one write and return its result."""
+    converted, size, captured = outcome
+    if captured:
+        print(captured, end="", flush=True)
+    return converted, size
 
 
 def convert_structured_directories(
-    input_dir: str, output_dir: str, file_type: str, enhanced_mode: bool = False
+    input_dir: str | Path,
+    output_dir: str | Path,
+    file_type: str,
+    enhanced_mode: bool = False,
+    max_workers: int | None = None,
+    cache_dir: str | Path | None = None,
+    force: bool = False,
 ) -> list[Path]:
-    """Convert PDFs from structured directories maintaining organization"""
+    """Convert PDFs from structured directories maintaining organization.
+
+    Subdirectories are converted one after another; each one's batch uses the
+    full worker budget, so ``max_workers=1`` keeps the whole run sequential.
+    """
     converted_files: list[Path] = []
     input_path = Path(input_dir)
     out = get_output()
@@ -715,10 +1255,10 @@ def convert_structured_directories(
     # Define subdirectory mappings
     type_mapping: dict[str, str] = {"lab_reports": "lab", "imaging_reports": "imaging"}
 
-    for subdir in input_path.iterdir():
-        if not subdir.is_dir():
-            continue
+    with os.scandir(input_path) as entries:
+        subdirs = [Path(e.path) for e in entries if e.is_dir()]
 
+    for subdir in subdirs:
         subdir_name = subdir.name
         report_type = type_mapping.get(subdir_name, "unknown")
 
@@ -733,8 +1273,10 @@ def convert_structured_directories(
         output_subdir = Path(output_dir) / f"{subdir_name}_markdown"
         output_subdir.mkdir(parents=True, exist_ok=True)
 
-        # Convert PDFs in this subdirectory with enhanced mode
-        converter = PDFToMarkdownConverter(str(subdir), str(output_subdir), enhanced_mode)
+        # Convert PDFs in this subdirectory
+        converter = PDFToMarkdownConverter(
+            subdir, output_subdir, enhanced_mode, max_workers=max_workers, cache_dir=cache_dir, force=force
+        )
         subdir_files = converter.convert_all_pdfs()
         converted_files.extend(subdir_files)
 
@@ -43,6 +43,29 @@ MONTH_MAP: Final[dict[str, str]] = {
 # Default fallback date when no date found
 DEFAULT_FALLBACK_DATE: Final[str] = "20240101"
 
+# Every default pattern contains a four-digit year, so text without one can be rejected in a single scan
+_YEAR_RE: Final[re.Pattern[str]] = re.compile(r"\d{4}")
+
+# Timestamp patterns found in study identifiers, in order of preference
+_STUDY_ID_PATTERNS: Final[tuple[re.Pattern[str], ...]] = (
+    re.compile(r"(\d{4})(\d{2})(\d{2})"),  # YYYYMMDD
+    re.compile(r"(\d{4})-(\d{2})-(\d{2})"),  # YYYY-MM-DD
+    re.compile(r"(\d{4})_(\d{2})_(\d{2})"),  # YYYY_MM_DD
+)
+
+
+@lru_cache(maxsize=32)
+def _compile_date_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Compile date patterns once per distinct pattern set.
+
+    Args:
+        patterns: Tuple of regex pattern strings
+
+    Returns:
+        Tuple of case-insensitive compiled patterns, in the same order
+    """
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
 
 @lru_cache(maxsize=1024)
 def is_valid_date(year: int, month: int, day: int) -> bool:
@@ -214,15 +237,16 @@ def parse_date_from_text(
         >>> parse_date_from_text("Generated on 2024/03/15")
         '20240315'
     """
+    if not date_patterns and not _YEAR_RE.search(text):
+        return None
+
     patterns = list(date_patterns) if date_patterns else list(DATE_PATTERNS)
     months = dict(month_map) if month_map else dict(MONTH_MAP)
 
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        for match in matches:
-            # Convert match to tuple if it's not already
-            match_tuple = match if isinstance(match, tuple) else (match,)
-            result = _try_parse_date_match(match_tuple, pattern, patterns, months)
+    for pattern, regex in zip(patterns, _compile_date_patterns(tuple(patterns)), strict=True):
+        # finditer stops scanning as soon as a valid date is found
+        for match in regex.finditer(text):
+            result = _try_parse_date_match(match.groups(""), pattern, patterns, months)
             if result:
                 return result
     return None
@@ -247,14 +271,8 @@ def extract_date_from_study_id(study_id: str) -> str | None:
         '20240315'
     """
     # Look for timestamp patterns in study ID
-    timestamp_patterns = [
-        r"(\d{4})(\d{2})(\d{2})",  # YYYYMMDD
-        r"(\d{4})-(\d{2})-(\d{2})",  # YYYY-MM-DD
-        r"(\d{4})_(\d{2})_(\d{2})",  # YYYY_MM_DD
-    ]
-
-    for pattern in timestamp_patterns:
-        match = re.search(pattern, study_id)
+    for pattern in _STUDY_ID_PATTERNS:
+        match = pattern.search(study_id)
         if match:
             year, month, day = match.groups()
             try:
@@ -31,6 +31,7 @@ class PDFDownloadManager:
         output: Output handler for logging and progress messages
         max_retries: Maximum number of download retry attempts
         chunk_size: Size of chunks for streaming downloads
+        session: HTTP session whose keep-alive connections are reused across downloads
     """
 
     # Mapping of study types to output subdirectories
@@ -46,6 +47,7 @@ class PDFDownloadManager:
         output: "Output",
         max_retries: int = 3,
         chunk_size: int = 8192,
+        session: requests.Session | None = None,
     ) -> None:
         """Initialize the PDFDownloadManager.
 
@@ -54,11 +56,13 @@ class PDFDownloadManager:
             output: Output handler for logging and progress
             max_retries: Maximum retry attempts (default: 3)
             chunk_size: Chunk size for streaming downloads (default: 8192)
+            session: Shared HTTP session (default: a new session owned by this manager)
         """
         self.output_dir = output_dir
         self.output = output
         self.max_retries = max_retries
         self.chunk_size = chunk_size
+        self.session = session or requests.Session()
 
     def generate_filename(
         self,
@@ -113,7 +117,7 @@ class PDFDownloadManager:
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            with requests.get(url, stream=True, timeout=30) as response:
+            with self.session.get(url, stream=True, timeout=30) as response:
                 # Check for HTTP errors
                 if response.status_code == 403:
                     raise S3UrlExpiredError(
@@ -4,6 +4,7 @@ Output utilities for wellbin CLI.
 Provides structured output functions for consistent CLI messaging across the codebase.
 """
 
+import sys
 from enum import Enum
 from typing import Any
 
@@ -66,7 +67,7 @@ def emit(message: str, level: OutputLevel = OutputLevel.INFO, indent: int = 0) -
         indent: Number of spaces to indent
     """
     prefix = " " * indent + EMOJI_PREFIXES.get(level, "")
-    print(f"{prefix} {message}")
+    sys.stdout.write(f"{prefix} {message}\n")
 
 
 def emit_with_emoji(message: str, emoji_key: str, indent: int = 0) -> None:
@@ -79,7 +80,7 @@ def emit_with_emoji(message: str, emoji_key: str, indent: int = 0) -> None:
     """
     emoji = DOMAIN_EMOJIS.get(emoji_key, "•")
     prefix = " " * indent
-    print(f"{prefix}{emoji} {message}")
+    sys.stdout.write(f"{prefix}{emoji} {message}\n")
 
 
 def emit_header(title: str, char: str = "=", width: int = 60) -> None:
@@ -90,8 +91,7 @@ def emit_header(title: str, char: str = "=", width: int = 60) -> None:
         char: Character to use for separator line
         width: Width of separator line
     """
-    print(title)
-    print(char * width)
+    sys.stdout.write(f"{title}\n{char * width}\n")
 
 
 def emit_separator(char: str = "=", width: int = 60) -> None:
@@ -101,7 +101,7 @@ def emit_separator(char: str = "=", width: int = 60) -> None:
         char: Character to use for separator
         width: Width of separator line
     """
-    print(char * width)
+    sys.stdout.write(f"{char * width}\n")
 
 
 def emit_list(items: list[Any], indent: int = 2, numbered: bool = False) -> None:
@@ -113,11 +113,13 @@ def emit_list(items: list[Any], indent: int = 2, numbered: bool = False) -> None
         numbered: Whether to number the items
     """
     prefix = " " * indent
-    for i, item in enumerate(items, 1):
-        if numbered:
-            print(f"{prefix}{i}. {item}")
-        else:
-            print(f"{prefix}• {item}")
+    if numbered:
+        lines = [f"{prefix}{i}. {item}" for i, item in enumerate(items, 1)]
+    else:
+        lines = [f"{prefix}• {item}" for item in items]
+    # One write for the whole list rather than one per item, newline included
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def emit_key_value(data: dict[str, Any], indent: int = 0) -> None:
@@ -127,9 +129,9 @@ def emit_key_value(data: dict[str, Any], indent: int = 0) -> None:
         data: Dictionary to display
         indent: Indentation level
     """
-    prefix = " " * indent
-    for key, value in data.items():
-        print(f"{prefix}{key}: {value}")
+    if data:
+        prefix = " " * indent
+        sys.stdout.write("".join(f"{prefix}{key}: {value}\n" for key, value in data.items()))
 
 
 # Convenience functions for common patterns
@@ -204,6 +206,9 @@ def size_info(message: str, indent: int = 0) -> None:
     emit_with_emoji(message, "size", indent)
 
 
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_bytes(size: int) -> str:
     """Format byte size as human-readable string.
 
@@ -213,12 +218,9 @@ def format_bytes(size: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    float_size: float = float(size)
-    for unit in ["B", "KB", "MB", "GB"]:
-        if abs(float_size) < 1024.0:
-            return f"{float_size:.1f} {unit}"
-        float_size /= 1024.0
-    return f"{float_size:.1f} TB"
+    # Each unit step is 10 bits, so the bit length picks the unit without dividing in a loop
+    exponent = min(max(0, (abs(int(size)).bit_length() - 1) // 10), len(BYTE_UNITS) - 1)
+    return f"{size / (1 << (10 * exponent)):.1f} {BYTE_UNITS[exponent]}"
 
 
 def emit_file_saved(path: str, size: int, indent: int = 0) -> None:
@@ -231,4 +233,4 @@ def emit_file_saved(path: str, size: int, indent: int = 0) -> None:
     """
     prefix = " " * indent
     size_str = format_bytes(size)
-    print(f"{prefix}✅ Saved: {path} ({size_str})")
+    sys.stdout.write(f"{prefix}✅ Saved: {path} ({size_str})\n")
@@ -10,7 +10,7 @@ import sys
 import traceback as tb_module
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, TextIO
 
 
 class LogLevel(Enum):
@@ -45,6 +45,7 @@ class OutputConfig:
     use_emoji: bool = True
     indent_size: int = 2
     line_width: int = 60
+    show_debug: bool = True
 
 
 class Output:
@@ -54,15 +55,21 @@ class Output:
     Supports both console output and Python logging integration.
     """
 
-    def __init__(self, config: OutputConfig | None = None):
+    def __init__(self, config: OutputConfig | None = None, stream: TextIO | None = None):
         """Initialize output handler.
 
         Args:
             config: Output configuration options
+            stream: Stream to write to (default: the current sys.stdout)
         """
         self.config = config or OutputConfig()
+        self.stream = stream
         self._indent_level = 0
         self._logger: logging.Logger | None = None
+        # Strings derived only from the config, built once rather than per line
+        self._indent_str = ""
+        self._prefixes = {level: f"{level.value} " if self.config.use_emoji else "" for level in LogLevel}
+        self._separators: dict[str, str] = {}
 
     def configure_logging(self, name: str = "wellbin", level: int = logging.INFO) -> None:
         """Configure Python logging integration.
@@ -81,35 +88,50 @@ class Output:
             handler.setFormatter(formatter)
             self._logger.addHandler(handler)
 
-    def _get_emoji(self, level: LogLevel) -> str:
-        """Get emoji for log level.
-
-        Args:
-            level: Log level
+    def _indent(self) -> str:
+        """Get current indentation string.
 
         Returns:
-            Emoji string or empty if disabled
+            Indentation string
         """
-        if not self.config.use_emoji:
-            return ""
-        return level.value
+        return self._indent_str
 
-    def _indent(self) -> str:
-        """Get current indentation string.
+    def _separator_line(self, char: str) -> str:
+        """Get a separator line of the configured width.
+
+        Args:
+            char: Character for separator line
 
         Returns:
-            Indentation string
+            Separator string, built once per character
         """
-        return " " * (self._indent_level * self.config.indent_size)
+        sep = self._separators.get(char)
+        if sep is None:
+            sep = self._separators[char] = char * self.config.line_width
+        return sep
 
     def indent(self) -> None:
         """Increase indentation level."""
         self._indent_level += 1
+        self._indent_str = " " * (self._indent_level * self.config.indent_size)
 
     def dedent(self) -> None:
         """Decrease indentation level."""
         if self._indent_level > 0:
             self._indent_level -= 1
+            self._indent_str = " " * (self._indent_level * self.config.indent_size)
+
+    def _write(self, text: str) -> None:
+        """Write one or more complete lines to the output stream in a single call.
+
+        The stream is resolved per call so redirected or patched stdout is honored.
+
+        Args:
+            text: Text to write, including trailing newline(s)
+        """
+        stream = self.stream if self.stream is not None else sys.stdout
+        if stream is not None:
+            stream.write(text)
 
     def _log_to_logger(self, level: LogLevel, text: str) -> None:
         """Log a message to the Python logger if configured.
@@ -118,8 +140,11 @@ class Output:
             level: Log level for determining Python logging level
             text: Message text to log
         """
-        if self._logger:
-            py_level = _LOG_LEVEL_MAP.get(level, logging.INFO)
+        if self._logger is None:
+            return
+        py_level = _LOG_LEVEL_MAP.get(level, logging.INFO)
+        # isEnabledFor is cached per logger; skip the log() call entirely below the threshold
+        if self._logger.isEnabledFor(py_level):
             self._logger.log(py_level, text)
 
     def message(self, level: LogLevel, text: str, **kwargs: Any) -> None:
@@ -130,12 +155,10 @@ class Output:
             text: Message text
             **kwargs: Additional format arguments
         """
-        emoji = self._get_emoji(level)
-        formatted = text.format(**kwargs) if kwargs else text
-        prefix = f"{emoji} " if emoji else ""
-        output = f"{self._indent()}{prefix}{formatted}".strip()
+        formatted = text.format_map(kwargs) if kwargs else text
+        output = f"{self._indent_str}{self._prefixes[level]}{formatted}".strip()
 
-        print(output)
+        self._write(f"{output}\n")
         self._log_to_logger(level, output)
 
     def log(self, emoji: str, text: str, **kwargs: Any) -> None:
@@ -149,13 +172,13 @@ class Output:
             text: Message text
             **kwargs: Additional format arguments
         """
-        formatted = text.format(**kwargs) if kwargs else text
+        formatted = text.format_map(kwargs) if kwargs else text
         if self.config.use_emoji and emoji:
-            output = f"{self._indent()}{emoji} {formatted}".strip()
+            output = f"{self._indent_str}{emoji} {formatted}".strip()
         else:
-            output = f"{self._indent()}{formatted}".strip()
+            output = f"{self._indent_str}{formatted}".strip()
 
-        print(output)
+        self._write(f"{output}\n")
         self._log_to_logger(LogLevel.INFO, output)
 
     def step(self, current: int, total: int, emoji: str, text: str) -> None:
@@ -170,19 +193,18 @@ class Output:
             text: Step description
         """
         if self.config.use_emoji and emoji:
-            output = f"{self._indent()}[{current}/{total}] {emoji} {text}"
+            output = f"{self._indent_str}[{current}/{total}] {emoji} {text}"
         else:
-            output = f"{self._indent()}[{current}/{total}] {text}"
+            output = f"{self._indent_str}[{current}/{total}] {text}"
 
-        print(output)
+        self._write(f"{output}\n")
         self._log_to_logger(LogLevel.INFO, output)
 
     def traceback(self) -> None:
         """Print the current exception traceback."""
         tb_text = tb_module.format_exc()
-        print(tb_text)
-        if self._logger:
-            self._logger.error(tb_text)
+        self._write(f"{tb_text}\n")
+        self._log_to_logger(LogLevel.ERROR, tb_text)
 
     def info(self, text: str, **kwargs: Any) -> None:
         """Print info message."""
@@ -201,8 +223,9 @@ class Output:
         self.message(LogLevel.ERROR, text, **kwargs)
 
     def debug(self, text: str, **kwargs: Any) -> None:
-        """Print debug message."""
-        self.message(LogLevel.DEBUG, text, **kwargs)
+        """Print debug message (suppressed unless show_debug is enabled)."""
+        if self.config.show_debug:
+            self.message(LogLevel.DEBUG, text, **kwargs)
 
     def progress(self, text: str, **kwargs: Any) -> None:
         """Print progress message."""
@@ -219,13 +242,9 @@ class Output:
             text: Header text
             char: Character for separator line
         """
-        sep = char * self.config.line_width
-        print(f"\n{sep}")
-        print(text)
-        print(sep)
-
-        if self._logger:
-            self._logger.info(text)
+        sep = self._separator_line(char)
+        self._write(f"\n{sep}\n{text}\n{sep}\n")
+        self._log_to_logger(LogLevel.INFO, text)
 
     def separator(self, char: str = "=") -> None:
         """Print a separator line.
@@ -233,15 +252,13 @@ class Output:
         Args:
             char: Character for separator
         """
-        sep = char * self.config.line_width
-        print(sep)
-
-        if self._logger:
-            self._logger.info(sep)
+        sep = self._separator_line(char)
+        self._write(f"{sep}\n")
+        self._log_to_logger(LogLevel.INFO, sep)
 
     def blank(self) -> None:
         """Print blank line."""
-        print()
+        self._write("\n")
 
     def section(self, title: str) -> None:
         """Print section header.
@@ -260,11 +277,11 @@ class Output:
             index: Optional item number
             **kwargs: Additional format arguments
         """
-        formatted = text.format(**kwargs) if kwargs else text
+        formatted = text.format_map(kwargs) if kwargs else text
         if index is not None:
-            print(f"{self._indent()}  {index}. {formatted}")
+            self._write(f"{self._indent_str}  {index}. {formatted}\n")
         else:
-            print(f"{self._indent()}  \u2022 {formatted}")
+            self._write(f"{self._indent_str}  \u2022 {formatted}\n")
 
     def subitem(self, text: str, **kwargs: Any) -> None:
         """Print sub-item (additional indented item).
@@ -273,8 +290,8 @@ class Output:
             text: Sub-item text
             **kwargs: Additional format arguments
         """
-        formatted = text.format(**kwargs) if kwargs else text
-        print(f"{self._indent()}     {formatted}")
+        formatted = text.format_map(kwargs) if kwargs else text
+        self._write(f"{self._indent_str}     {formatted}\n")
 
 
 # Global output instance
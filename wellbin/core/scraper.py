@@ -3,21 +3,33 @@ Wellbin Medical Data Downloader Core Module
 
 Contains the main WellbinMedicalDownloader class for downloading medical data
 from the Wellbin platform with support for FhirStudy and DicomStudy types.
+
+Waiting rule: the driver never sets an implicit wait. Every lookup that may
+race page rendering goes through an explicit WebDriverWait, because an implicit
+wait stacks on each poll of an explicit one and stalls lookups that
+legitimately match nothing.
 """
 
+import contextlib
+import hashlib
+import io
+import json
 import os
 import re
+import sys
 import time
 import traceback
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from tenacity import (
@@ -42,7 +54,7 @@ from .exceptions import (
 from .logging import Output, get_output
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFDownloadInfo:
     """Structured data for PDF download information."""
 
@@ -53,8 +65,13 @@ class PDFDownloadInfo:
     study_date: str
     study_index: int = 0
 
+    def __post_init__(self) -> None:
+        # Thousands of links share a handful of types and dates; keep one copy each
+        self.study_type = sys.intern(self.study_type)
+        self.study_date = sys.intern(self.study_date)
+
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """Result of a successful PDF download."""
 
@@ -66,6 +83,10 @@ class DownloadResult:
     description: str
     study_index: int = 0
 
+    def __post_init__(self) -> None:
+        self.study_type = sys.intern(self.study_type)
+        self.study_date = sys.intern(self.study_date)
+
 
 class WellbinMedicalDownloader:
     def __init__(
@@ -76,6 +97,7 @@ class WellbinMedicalDownloader:
         limit_studies: int | None = None,
         study_types: list[str] | None = None,
         output_dir: str = "downloads",
+        max_downloads: int = 1,
     ) -> None:
         self.email = email
         self.password = password
@@ -83,14 +105,18 @@ class WellbinMedicalDownloader:
         self.login_url = "https://wellbin.co/login"
         self.explorer_url = "https://wellbin.co/explorer"
         self.session = requests.Session()
+        self.max_downloads = max(1, max_downloads)
+        # One pooled connection per concurrent download so threads never queue on the pool
+        adapter = HTTPAdapter(pool_connections=self.max_downloads, pool_maxsize=self.max_downloads)
+        self.session.mount("https://", adapter)
         self.driver: webdriver.Chrome | None = None
-        self.wait: WebDriverWait[webdriver.Chrome] | None = None
         self.headless = headless
         self.limit_studies = limit_studies  # None = all studies, number = limit to that many
         self.study_types = study_types or ["FhirStudy"]  # Default to FhirStudy only
         self.output_dir = output_dir
         self.study_dates: dict[str, str] = {}  # Map study URLs to dates
         self.date_counters: defaultdict[str, int] = defaultdict(int)  # For deduplication per study type
+        self.manifest: dict[str, dict[str, str]] = {}  # Study URL -> validators of its last download
         self.out: Output = get_output()
 
         # Study type configuration
@@ -111,60 +137,77 @@ class WellbinMedicalDownloader:
 
     # Class-specific constants (date handling uses module-level from date_parser)
     KNOWN_STUDY_TYPES: tuple[str, ...] = ("FhirStudy", "DicomStudy")
+    KNOWN_STUDY_TYPE_PARAMS: tuple[str, ...] = tuple(f"type={st}" for st in KNOWN_STUDY_TYPES)
+    _STUDY_ID_RE = re.compile(r"/study/([^?]+)")
+    _STUDY_TYPE_RE = re.compile(r"type=([^&]+)")
+    DOWNLOAD_CHUNK_SIZE: int = 256 * 1024
+    SINGLE_READ_LIMIT: int = 10 * 1024 * 1024  # bodies up to this size are read in one call
+    DOWNLOAD_DELAY: float = 0.2  # seconds between downloads, per worker
+    MANIFEST_FILENAME: str = ".manifest.json"
+    HEADLESS_CHROME_PREFS: dict[str, int] = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    }
     USER_AGENT: str = (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
     )
-    PARENT_CONTAINER_XPATH: str = (
-        "./ancestor::*[contains(@class, 'study') or "
-        "contains(@class, 'card') or "
-        "contains(@class, 'item') or "
-        "contains(@class, 'row')][1]"
+    STUDY_LINK_SELECTOR: str = "a[href*='/study/']"
+    STUDY_CONTAINER_SELECTOR: str = "[class*='study'], [class*='card'], [class*='item'], [class*='row']"
+    LOGIN_ERROR_SELECTOR: str = ".login-error, [role='alert']"
+    # Read link data in the browser with one WebDriver round-trip instead of one per element
+    LINK_HREFS_SCRIPT: str = "return Array.from(document.querySelectorAll('a'), a => a.href);"
+    S3_LINKS_SCRIPT: str = (
+        "return Array.from(document.querySelectorAll(\"a[href*='wellbin-uploads.s3']\"), "
+        "a => [a.innerText.trim(), a.href]);"
+    )
+    LINK_SUMMARY_SCRIPT: str = (
+        "return Array.from(document.querySelectorAll('a'), a => [a.innerText.trim(), a.href]).slice(0, arguments[0]);"
+    )
+    STUDY_TEXTS_SCRIPT: str = (
+        "return Array.from(document.querySelectorAll(arguments[0]), a => {"
+        " const box = a.closest(arguments[1]) || a;"
+        " const parent = a.parentElement ? a.parentElement.innerText : '';"
+        " return [a.href, box.innerText + ' ' + parent]; });"
     )
 
-    @staticmethod
-    def _sanitize_xpath_string(s: str) -> str:
-        """Sanitize string for safe use in XPath expressions."""
-        if "'" not in s:
-            return f"'{s}'"
-        if '"' not in s:
-            return f'"{s}"'
-        # For strings with both quotes, use concat() function
-        parts = s.split("'")
-        return "concat('" + "', \"'\", '".join(parts) + "')"
-
-    def _matches_study_type(self, href: str, study_types: list[str]) -> bool:
-        """Check if a URL matches any of the specified study types.
+    def _study_type_needles(self, study_types: list[str]) -> tuple[str, ...]:
+        """Build the "type=..." substrings that identify the requested study types.
 
         Args:
-            href: URL to check
             study_types: List of study types to match (e.g., ["FhirStudy"], ["all"])
 
         Returns:
-            True if URL matches any study type filter
+            Tuple of query-string needles to look for in study URLs
         """
         if "all" in study_types:
-            # Check if it's any of the known study types
-            return any(f"type={st}" in href for st in self.KNOWN_STUDY_TYPES)
-
-        return any(f"type={study_type}" in href for study_type in study_types)
+            # Any of the known study types
+            return self.KNOWN_STUDY_TYPE_PARAMS
+        return tuple(f"type={study_type}" for study_type in study_types)
 
     def setup_driver(self) -> None:
         """Setup Chrome driver with appropriate options"""
         chrome_options = Options()
+        # Every navigation is followed by an explicit wait, so get() can return at DOMContentLoaded
+        chrome_options.page_load_strategy = "eager"
         if self.headless:
-            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--headless=new")
+            # Nobody is watching a headless run, so skip image and notification traffic
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", self.HEADLESS_CHROME_PREFS)
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument(f"--user-agent={self.USER_AGENT}")
 
         self.out.log("\U0001f527", "Setting up Chrome driver...")
         self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.implicitly_wait(10)
-        self.wait = WebDriverWait(self.driver, 15)
+        # Explicit waits only: an implicit wait would stack on top of them and
+        # stall every find_elements() call that legitimately matches nothing.
         self.out.success("Chrome driver ready")
 
     def login(self) -> bool:
@@ -196,17 +239,20 @@ class WellbinMedicalDownloader:
             submit_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             submit_button.click()
 
-            # Wait for redirect to dashboard (login success indicator)
+            # Wait for redirect to dashboard (success) or an error banner (failure)
             try:
-                wait.until(EC.url_contains("dashboard"))
-                current_url = self.driver.current_url
+                wait.until(self._login_settled)
+            except TimeoutException:
+                pass
+
+            current_url = self.driver.current_url
+            if "dashboard" in current_url.lower():
                 self.out.log("\U0001f4cd", f"After login, current URL: {current_url}")
                 self.out.success("Login successful!")
                 return True
-            except TimeoutException:
-                current_url = self.driver.current_url
-                self.out.error(f"Login failed. Expected dashboard URL, got: {current_url}")
-                return False
+
+            self.out.error(f"Login failed. Expected dashboard URL, got: {current_url}")
+            return False
 
         except NoSuchElementException as e:
             self.out.error(f"Login form element not found: {e}")
@@ -220,6 +266,12 @@ class WellbinMedicalDownloader:
             self.out.traceback()
             return False
 
+    def _login_settled(self, driver: webdriver.Chrome) -> bool:
+        """Wait condition: the dashboard has loaded or the login form shows an error."""
+        return "dashboard" in driver.current_url.lower() or bool(
+            driver.find_elements(By.CSS_SELECTOR, self.LOGIN_ERROR_SELECTOR)
+        )
+
     def extract_study_dates_from_explorer(self) -> bool:
         """Extract study dates from the explorer page with explicit waits."""
         try:
@@ -229,13 +281,13 @@ class WellbinMedicalDownloader:
 
             # Wait for study links to be present
             wait = WebDriverWait(self.driver, 15)
-            wait.until(EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/study/')]")))
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.STUDY_LINK_SELECTOR)))
 
-            study_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/study/')]")
-            self.out.debug(f"Found {len(study_elements)} study elements, extracting dates...")
+            study_texts = self._snapshot_study_texts()
+            self.out.debug(f"Found {len(study_texts)} study elements, extracting dates...")
 
-            for element in study_elements:
-                self._extract_date_from_study_element(element)
+            for href, container_text in study_texts.items():
+                self._record_study_date(href, container_text)
 
             self.out.progress(f"Extracted dates for {len(self.study_dates)} studies")
             return True
@@ -248,55 +300,36 @@ class WellbinMedicalDownloader:
             self.out.log("\U0001f50d", f"Traceback: {traceback.format_exc()}")
             return False
 
-    def _extract_date_from_study_element(self, element: WebElement) -> None:
-        """Extract date from a single study element.
+    def _snapshot_study_texts(self) -> dict[str, str]:
+        """Read every study link's surrounding text from the current page in one query.
 
-        Args:
-            element: Selenium WebElement for the study link
+        Returns:
+            Mapping of study URL to the text of its container and parent element
         """
-        try:
-            href = element.get_attribute("href")
-            if not href or "study/" not in href:
-                return
-
-            container_text = self._get_study_container_text(element, href)
-
-            # Try to parse date from container text
-            study_date = self.parse_date_from_text_wrapper(container_text)
-
-            if not study_date:
-                # Fallback to ID extraction or default
-                study_date = self._get_fallback_date(href)
-
-            self.study_dates[href] = study_date
-            self._log_date_extraction(href, study_date)
-
-        except Exception as e:
-            self.out.error(f"  Error extracting date for element: {type(e).__name__}: {e}")
+        assert self.driver is not None, "Driver should be initialized"  # nosec
+        rows: list[list[str]] = self.driver.execute_script(
+            self.STUDY_TEXTS_SCRIPT, self.STUDY_LINK_SELECTOR, self.STUDY_CONTAINER_SELECTOR
+        )
+        study_texts: dict[str, str] = {}
+        for href, text in rows or []:
+            study_texts[href] = f"{study_texts[href]} {text}" if href in study_texts else text
+        return study_texts
 
-    def _get_study_container_text(self, element: WebElement, href: str) -> str:
-        """Get container text for a study element.
+    def _record_study_date(self, href: str, container_text: str) -> str:
+        """Parse, store and log the date for a study from its container text.
 
         Args:
-            element: Selenium WebElement
             href: Study URL
+            container_text: Text surrounding the study link
 
         Returns:
-            Combined text from container and nearby elements
+            Date string in YYYYMMDD format
         """
-        try:
-            parent = element.find_element(By.XPATH, self.PARENT_CONTAINER_XPATH)
-            container_text = parent.text if parent else element.text
-
-            # Add nearby date text
-            href_xpath = self._sanitize_xpath_string(href)
-            container_text += self._collect_nearby_date_text(href_xpath)
-
-            return container_text
-
-        except Exception as e:  # noqa: S110
-            self.out.warning(f"  Could not extract nearby date elements: {type(e).__name__}")
-            return element.text if element else ""
+        # Fallback to ID extraction or default
+        study_date = self.parse_date_from_text_wrapper(container_text) or self._get_fallback_date(href)
+        self.study_dates[href] = study_date
+        self._log_date_extraction(href, study_date)
+        return study_date
 
     def parse_date_from_text_wrapper(
         self,
@@ -326,128 +359,16 @@ class WellbinMedicalDownloader:
     def extract_dates_for_studies(self, study_links: list[str]) -> None:
         """Extract dates only for specific study links."""
         try:
-            assert self.driver is not None, "Driver should be initialized"  # nosec
+            study_texts = self._snapshot_study_texts()
 
             for href in study_links:
-                date = self._extract_date_for_single_study(href)
-                self.study_dates[href] = date
-                self._log_date_extraction(href, date)
+                self._record_study_date(href, study_texts.get(href, ""))
 
             self.out.progress(f"Extracted dates for {len(self.study_dates)} studies")
 
         except Exception as e:
             self.out.error(f"Error extracting study dates: {e}")
 
-    def _extract_date_for_single_study(self, href: str) -> str:
-        """Extract date for a single study URL.
-
-        Args:
-            href: Study URL to extract date from
-
-        Returns:
-            Date string in YYYYMMDD format
-        """
-        try:
-            assert self.driver is not None, "Driver should be initialized"  # nosec
-            href_xpath = self._sanitize_xpath_string(href)
-            study_elements = self.driver.find_elements(By.XPATH, f"//a[@href={href_xpath}]")
-
-            for element in study_elements:
-                container_text = self._extract_container_text(element, href_xpath)
-                study_date = self.parse_date_from_text_wrapper(container_text)
-
-                if study_date:
-                    return study_date
-
-            # Try fallback extraction
-            return self._get_fallback_date(href)
-
-        except Exception as e:
-            self.out.error(f"  Error extracting date for {href}: {e}")
-            return get_fallback_date()
-
-    def _extract_container_text(self, element: WebElement, href_xpath: str) -> str:
-        """Extract all relevant text from an element's container.
-
-        Args:
-            element: Selenium WebElement
-            href_xpath: Sanitized XPath for the href
-
-        Returns:
-            Combined text from container and nearby elements
-        """
-        try:
-            parent = element.find_element(By.XPATH, self.PARENT_CONTAINER_XPATH)
-            container_text = parent.text if parent else element.text
-
-            # Add text from child elements that might contain dates
-            container_text += self._collect_date_like_text(parent)
-            container_text += self._collect_nearby_date_text(href_xpath)
-
-            return container_text
-
-        except Exception as e:
-            self.out.warning(f"    Could not extract container text: {type(e).__name__}")
-            return element.text if element else ""
-
-    def _collect_date_like_text(self, parent: WebElement) -> str:
-        """Collect text from child elements that look like dates.
-
-        Args:
-            parent: Parent Selenium WebElement
-
-        Returns:
-            Combined text that might contain date information
-        """
-        additional_text = ""
-        try:
-            date_elements = parent.find_elements(By.XPATH, ".//*")
-            for date_elem in date_elements:
-                elem_text = date_elem.text.strip()
-                if elem_text and self._looks_like_date_text(elem_text):
-                    additional_text += " " + elem_text
-        except Exception as e:  # noqa: S110
-            self.out.warning(f"    Could not extract date patterns from parent: {type(e).__name__}")
-        return additional_text
-
-    def _collect_nearby_date_text(self, href_xpath: str) -> str:
-        """Collect text from nearby elements that might contain dates.
-
-        Args:
-            href_xpath: Sanitized XPath for the href
-
-        Returns:
-            Combined text from nearby elements
-        """
-        additional_text = ""
-        try:
-            nearby_xpath = (
-                f"//a[@href={href_xpath}]/ancestor::*[1]//*["
-                "contains(text(), '202') or "
-                "contains(text(), '201') or "
-                "contains(text(), '/')]"
-            )
-            assert self.driver is not None, "Driver should be initialized"  # nosec
-            nearby_elements = self.driver.find_elements(By.XPATH, nearby_xpath)
-            for nearby in nearby_elements:
-                if nearby.text.strip():
-                    additional_text += " " + nearby.text
-        except Exception:  # noqa: S110
-            pass
-        return additional_text
-
-    @staticmethod
-    def _looks_like_date_text(text: str) -> bool:
-        """Check if text looks like it might contain a date.
-
-        Args:
-            text: Text to check
-
-        Returns:
-            True if text might contain date information
-        """
-        return "/" in text or any(char.isdigit() for char in text)
-
     def _get_fallback_date(self, href: str) -> str:
         """Get a fallback date from URL or use default.
 
@@ -457,7 +378,7 @@ class WellbinMedicalDownloader:
         Returns:
             Date string in YYYYMMDD format
         """
-        study_id_match = re.search(r"/study/([^?]+)", href)
+        study_id_match = self._STUDY_ID_RE.search(href)
         if study_id_match:
             study_id = study_id_match.group(1)
             fallback_date = self.extract_date_from_study_id_wrapper(study_id)
@@ -482,7 +403,8 @@ class WellbinMedicalDownloader:
         """Extract date from the study page using the item-value report-date class"""
         try:
             assert self.driver is not None, "Driver should be initialized"  # nosec
-            date_element = self.driver.find_element(By.CSS_SELECTOR, "div.item-value.report-date")
+            wait = WebDriverWait(self.driver, 10)
+            date_element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.item-value.report-date")))
             date_text = date_element.text.strip()
 
             if date_text:
@@ -500,7 +422,7 @@ class WellbinMedicalDownloader:
             self.out.warning("    No date found, using default")
             return get_fallback_date()
 
-        except NoSuchElementException:
+        except (NoSuchElementException, TimeoutException):
             self.out.error("    Could not find div.item-value.report-date element")
             return get_fallback_date()
         except Exception as e:
@@ -529,38 +451,28 @@ class WellbinMedicalDownloader:
 
         # Wait for study links to be present on the page
         wait = WebDriverWait(self.driver, 15)
-        wait.until(EC.presence_of_element_located((By.XPATH, "//a[contains(@href, '/study/')]")))
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.STUDY_LINK_SELECTOR)))
         self.out.log("\U0001f4cd", f"Explorer page URL: {self.driver.current_url}")
 
     def _collect_study_links(self) -> list[str]:
         """Collect and filter study links from the current page."""
         self.out.log("\U0001f50e", "Searching for study links...")
         assert self.driver is not None, "Driver should be initialized"  # nosec
-        all_links = self.driver.find_elements(By.TAG_NAME, "a")
-        self.out.progress(f"Found {len(all_links)} total links on page")
+        all_hrefs: list[str] = self.driver.execute_script(self.LINK_HREFS_SCRIPT) or []
+        self.out.progress(f"Found {len(all_hrefs)} total links on page")
 
         self.out.action(f"Filtering for study types: {', '.join(self.study_types)}")
 
+        needles = self._study_type_needles(self.study_types)
         study_links: list[str] = []
-        for link in all_links:
-            href = self._extract_valid_study_link(link)
-            if href and self._matches_study_type(href, self.study_types):
+        for href in all_hrefs:
+            if href and "study/" in href and any(needle in href for needle in needles):
                 study_links.append(href)
                 self.out.success(f"  Found: {href}")
 
         self.out.progress(f"Found {len(study_links)} matching study links")
         return study_links
 
-    def _extract_valid_study_link(self, link: WebElement) -> str | None:
-        """Extract href from a link element if it's a valid study link."""
-        try:
-            href = link.get_attribute("href")
-            if href and "study/" in href:
-                return href
-        except Exception as e:
-            self.out.error(f"  Error processing link: {e}")
-        return None
-
     def _apply_study_limit(self, study_links: list[str]) -> list[str]:
         """Apply study limit if configured."""
         if self.limit_studies and len(study_links) > self.limit_studies:
@@ -601,7 +513,7 @@ class WellbinMedicalDownloader:
         Returns:
             Study type string (e.g., "FhirStudy", "DicomStudy")
         """
-        type_match = re.search(r"type=([^&]+)", study_url)
+        type_match = self._STUDY_TYPE_RE.search(study_url)
         return type_match.group(1) if type_match else "Unknown"
 
     def _print_study_progress(self, study_url: str, index: int, total: int, study_type: str) -> None:
@@ -658,12 +570,15 @@ class WellbinMedicalDownloader:
         self.out.debug("  Looking for 'Descargar estudio' button...")
 
         try:
-            elements = self._find_s3_download_elements()
+            links = self._find_s3_download_links()
 
-            if elements:
-                return self._process_download_element(elements[0], study_url, study_type, study_date)
+            if links:
+                text, href = links[0]
+                return self._process_download_link(text, href, study_url, study_type, study_date)
 
-            self._print_available_links()
+            # Listing the page's links costs a browser round-trip; only pay for it when debugging
+            if self.out.config.show_debug:
+                self._print_available_links()
             self.out.error("  No S3 download link found")
             return []
 
@@ -671,29 +586,34 @@ class WellbinMedicalDownloader:
             self.out.error(f"  Error finding download link: {e}")
             return []
 
-    def _find_s3_download_elements(self) -> list[WebElement]:
-        """Find S3 download link elements on page.
+    def _find_s3_download_links(self) -> list[list[str]]:
+        """Find S3 download links on page.
+
+        Each poll is a single in-browser query that returns the link data
+        directly, so no per-element round-trips follow the wait.
 
         Returns:
-            List of Selenium WebElement objects
+            List of [text, href] pairs
         """
         assert self.driver is not None, "Driver should be initialized"  # nosec
-        elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, 'wellbin-uploads.s3')]")
-
-        if elements:
-            href = elements[0].get_attribute("href")
-            text = elements[0].text.strip()
-            self.out.success(f"  Found S3 download link: '{text}' -> {href and href[:100]}...")
+        try:
+            wait = WebDriverWait(self.driver, 10)
+            links: list[list[str]] = wait.until(lambda driver: driver.execute_script(self.S3_LINKS_SCRIPT))
+        except TimeoutException:
+            return []
 
-        return elements
+        text, href = links[0]
+        self.out.success(f"  Found S3 download link: '{text}' -> {href[:100]}...")
+        return links
 
-    def _process_download_element(
-        self, element: WebElement, study_url: str, study_type: str, study_date: str
+    def _process_download_link(
+        self, text: str, href: str, study_url: str, study_type: str, study_date: str
     ) -> list[PDFDownloadInfo]:
-        """Process a download element and return PDF info.
+        """Build PDF info for a download link.
 
         Args:
-            element: Selenium WebElement for download link
+            text: Link text
+            href: Link URL
             study_url: Study page URL
             study_type: Type of study
             study_date: Study date string
@@ -701,8 +621,7 @@ class WellbinMedicalDownloader:
         Returns:
             List containing single PDFDownloadInfo
         """
-        href = element.get_attribute("href") or ""
-        text = element.text.strip() or "Download"
+        text = text or "Download"
 
         self.out.success(f"  Found download link: {href[:100]}...")
 
@@ -720,11 +639,9 @@ class WellbinMedicalDownloader:
         """Print available links on page for debugging."""
         self.out.debug("  All links on page:")
         assert self.driver is not None, "Driver should be initialized"  # nosec
-        all_links = self.driver.find_elements(By.TAG_NAME, "a")[:10]
+        all_links: list[list[str]] = self.driver.execute_script(self.LINK_SUMMARY_SCRIPT, 10) or []
 
-        for i, link in enumerate(all_links, 1):
-            href = link.get_attribute("href")
-            text = link.text.strip()
+        for i, (text, href) in enumerate(all_links, 1):
             self.out.log("", f"    {i}. '{text}' -> {href[:80] if href else 'No href'}...")
 
     def generate_filename(self, study_date: str, study_type: str) -> str:
@@ -755,7 +672,11 @@ class WellbinMedicalDownloader:
     def _download_with_retry(self, url: str, headers: dict[str, str]) -> requests.Response:
         """Internal method with retry logic for network requests."""
         response = self.session.get(url, headers=headers, stream=True, timeout=30)
-        response.raise_for_status()
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()  # Hand the streamed connection back to the pool
+            raise
         return response
 
     def download_pdf(
@@ -763,24 +684,38 @@ class WellbinMedicalDownloader:
         pdf_info: PDFDownloadInfo,
         download_index: int = 1,
         total_downloads: int = 1,
+        filename: str | None = None,
+        out: Output | None = None,
     ) -> str | None:
-        """Download a PDF file with retry logic and proper error handling."""
+        """Download a PDF file with retry logic and proper error handling.
+
+        Args:
+            pdf_info: PDF download information
+            download_index: Current download index (for progress display)
+            total_downloads: Total number of downloads (for progress display)
+            filename: Pre-assigned filename (generated from the study date if None)
+            out: Output handler for this download (defaults to the shared one)
+
+        Returns:
+            Local file path, or None if the download failed
+        """
+        out = out or self.out
         try:
-            self.out.blank()
+            out.blank()
             desc = f"Downloading {pdf_info.study_type} PDF ({pdf_info.study_date}):"
-            self.out.step(download_index, total_downloads, "\U0001f4e5", desc)
-            self.out.log("\U0001f4dd", f"  Description: {pdf_info.text}")
+            out.step(download_index, total_downloads, "\U0001f4e5", desc)
+            out.log("\U0001f4dd", f"  Description: {pdf_info.text}")
             # Redact sensitive query params from URL in logs
             safe_url = pdf_info.url.split("?")[0] + "..." if "?" in pdf_info.url else pdf_info.url[:100]
-            self.out.log("\U0001f517", f"  URL: {safe_url}")
+            out.log("\U0001f517", f"  URL: {safe_url}")
 
             # S3 URLs are pre-signed, no authentication needed
-            headers = {"User-Agent": self.USER_AGENT}
+            headers = {"User-Agent": self.USER_AGENT, **self._conditional_headers(pdf_info.study_url)}
 
-            self.out.log("\U0001f310", "  Making download request...")
+            out.log("\U0001f310", "  Making download request...")
             try:
                 response = self._download_with_retry(pdf_info.url, headers)
-                self.out.progress(f"  Response status: {response.status_code}")
+                out.progress(f"  Response status: {response.status_code}")
             except requests.Timeout as e:
                 raise ConnectionTimeoutError("Download request timed out", f"URL: {safe_url}, Error: {e}") from e
             except requests.ConnectionError as e:
@@ -791,41 +726,79 @@ class WellbinMedicalDownloader:
                     raise S3UrlExpiredError("S3 pre-signed URL has expired", "Please retry the scraping process") from e
                 raise DownloadError(f"HTTP error during download: {status_code}", str(e)) from e
 
-            # Generate filename based on study date and type
-            filename = self.generate_filename(pdf_info.study_date, pdf_info.study_type)
-            self.out.log("\U0001f4c1", f"  Generated filename: {filename}")
-
-            # Create output directories
-            config = self.study_config.get(pdf_info.study_type, {"subdir": "unknown"})
-            output_subdir = os.path.join(self.output_dir, config["subdir"])
-            os.makedirs(output_subdir, exist_ok=True)
-            filepath = os.path.join(output_subdir, filename)
-
-            # Download file
-            self.out.log("\U0001f4be", f"  Saving to: {filepath}")
-            file_size = 0
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        file_size += len(chunk)
-
-            self.out.success("  Downloaded successfully!")
-            self.out.log("\U0001f4cf", f"  File size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
-            return filepath
+            # Streamed: release the pooled connection on every path, including 304 and errors
+            try:
+                if response.status_code == 304:
+                    filepath = self.manifest[pdf_info.study_url]["path"]
+                    out.success(f"  Unchanged since last download, keeping {filepath}")
+                    return filepath
+
+                # Generate filename based on study date and type
+                if filename is None:
+                    filename = self.generate_filename(pdf_info.study_date, pdf_info.study_type)
+                out.log("\U0001f4c1", f"  Generated filename: {filename}")
+
+                # Create output directories
+                config = self.study_config.get(pdf_info.study_type, {"subdir": "unknown"})
+                output_subdir = os.path.join(self.output_dir, config["subdir"])
+                os.makedirs(output_subdir, exist_ok=True)
+                filepath = os.path.join(output_subdir, filename)
+
+                # Download to a temporary file, hashing as the chunks arrive
+                out.log("\U0001f4be", f"  Saving to: {filepath}")
+                tmp_path = f"{filepath}.part"
+                file_size = 0
+                digest = hashlib.sha256()
+                try:
+                    with open(tmp_path, "wb") as f:
+                        for chunk in self._iter_response_body(response):
+                            if chunk:
+                                f.write(chunk)
+                                digest.update(chunk)
+                                file_size += len(chunk)
+
+                    sha256 = digest.hexdigest()
+                    previous = self.manifest.get(pdf_info.study_url, {})
+                    if (
+                        previous.get("sha256") == sha256
+                        and previous.get("path") == filepath
+                        and os.path.exists(filepath)
+                    ):
+                        # Same bytes as last time: leave the existing file (and its mtime) alone
+                        os.remove(tmp_path)
+                        out.success("  Content unchanged since last download")
+                    else:
+                        os.replace(tmp_path, filepath)
+                        out.success("  Downloaded successfully!")
+                except BaseException:
+                    # Never leave a partial download behind in the output tree
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(tmp_path)
+                    raise
+
+                self.manifest[pdf_info.study_url] = {
+                    "path": filepath,
+                    "sha256": sha256,
+                    "etag": response.headers.get("ETag", ""),
+                    "last_modified": response.headers.get("Last-Modified", ""),
+                }
+                out.log("\U0001f4cf", f"  File size: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)")
+                return filepath
+            finally:
+                response.close()
 
         except MaxRetriesExceededError as e:
-            self.out.error(f"  Max retries exceeded: {e}")
-            self.out.log("\U0001f504", "  Tip: Check your network connection and try again")
+            out.error(f"  Max retries exceeded: {e}")
+            out.log("\U0001f504", "  Tip: Check your network connection and try again")
             return None
         except (S3UrlExpiredError, ConnectionTimeoutError, S3DownloadError, DownloadError) as e:
-            self.out.error(f"  Download failed: {e.message}")
+            out.error(f"  Download failed: {e.message}")
             if e.details:
-                self.out.log("\U0001f50d", f"  Details: {e.details}")
+                out.log("\U0001f50d", f"  Details: {e.details}")
             return None
         except Exception as e:
-            self.out.error(f"  Failed to download PDF: {e}")
-            self.out.log("\U0001f50d", f"  Traceback: {traceback.format_exc()}")
+            out.error(f"  Failed to download PDF: {e}")
+            out.log("\U0001f50d", f"  Traceback: {traceback.format_exc()}")
             return None
 
     def scrape_studies(self) -> list[DownloadResult]:
@@ -845,6 +818,11 @@ class WellbinMedicalDownloader:
             self.out.action(f"Processing {len(study_links)} studies...")
 
             all_pdf_links = self._collect_all_pdf_links(study_links)
+
+            # Everything past this point is plain HTTP, so release Chrome before downloading
+            self._bootstrap_session()
+            self._close_browser()
+
             if not all_pdf_links:
                 self.out.error("No PDF links found in any studies")
                 return downloaded_files
@@ -907,38 +885,166 @@ class WellbinMedicalDownloader:
         Returns:
             List of DownloadResult objects
         """
-        downloaded_files: list[DownloadResult] = []
+        self._load_manifest()
+        try:
+            if self.max_downloads > 1 and len(pdf_links) > 1:
+                return self._download_all_pdfs_concurrently(pdf_links)
+
+            downloaded_files: list[DownloadResult] = []
+            total_pdfs = len(pdf_links)
+
+            for i, pdf_info in enumerate(pdf_links, 1):
+                filepath = self.download_pdf(pdf_info, i, total_pdfs)
+                if filepath:
+                    downloaded_files.append(self._build_download_result(filepath, pdf_info))
+
+                # Intentional rate limiting delay between downloads
+                if i < total_pdfs:
+                    time.sleep(self.DOWNLOAD_DELAY)
+
+            return downloaded_files
+        finally:
+            self._save_manifest()
+
+    def _download_all_pdfs_concurrently(self, pdf_links: list[PDFDownloadInfo]) -> list[DownloadResult]:
+        """Download PDFs from a thread pool, replaying each one's output in order.
+
+        Filenames are assigned up front so deduplication counters stay
+        deterministic regardless of which download finishes first. Each
+        worker keeps the sequential path's delay between its own downloads,
+        so request rate grows only with the configured worker count.
+
+        Args:
+            pdf_links: List of PDF download information
+
+        Returns:
+            List of DownloadResult objects, in the order of pdf_links
+        """
         total_pdfs = len(pdf_links)
+        filenames = [self.generate_filename(pdf.study_date, pdf.study_type) for pdf in pdf_links]
 
-        for i, pdf_info in enumerate(pdf_links, 1):
-            filepath = self.download_pdf(pdf_info, i, total_pdfs)
-            if filepath:
-                result = DownloadResult(
-                    local_path=filepath,
-                    original_url=pdf_info.url,
-                    study_url=pdf_info.study_url,
-                    study_type=pdf_info.study_type,
-                    study_date=pdf_info.study_date,
-                    description=pdf_info.text,
-                    study_index=pdf_info.study_index,
-                )
-                downloaded_files.append(result)
-
-            # Intentional rate limiting delay between downloads
-            if i < total_pdfs:
-                time.sleep(0.2)
+        def download_one(index: int) -> tuple[str | None, str]:
+            buffer = io.StringIO()
+            out = Output(self.out.config, stream=buffer)
+            filepath = self.download_pdf(pdf_links[index], index + 1, total_pdfs, filenames[index], out)
+            time.sleep(self.DOWNLOAD_DELAY)  # Rate limit each worker like the sequential loop
+            return filepath, buffer.getvalue()
+
+        downloaded_files: list[DownloadResult] = []
+        with ThreadPoolExecutor(max_workers=min(self.max_downloads, total_pdfs)) as executor:
+            results = executor.map(download_one, range(total_pdfs))
+            for pdf_info, (filepath, output) in zip(pdf_links, results, strict=True):
+                print(output, end="", file=self.out.stream)
+                if filepath:
+                    downloaded_files.append(self._build_download_result(filepath, pdf_info))
 
         return downloaded_files
 
-    def _cleanup_resources(self) -> None:
-        """Clean up browser and session resources."""
+    def _iter_response_body(self, response: requests.Response) -> Iterator[bytes]:
+        """Yield a streamed response body, in a single read when it is small.
+
+        Args:
+            response: Streamed download response
+
+        Yields:
+            The whole body as one block if Content-Length is known and at most
+            SINGLE_READ_LIMIT, otherwise DOWNLOAD_CHUNK_SIZE chunks
+        """
         try:
-            if self.driver:
+            length = int(response.headers.get("Content-Length", 0))
+        except (TypeError, ValueError):
+            length = 0
+
+        if 0 < length <= self.SINGLE_READ_LIMIT:
+            yield response.raw.read(decode_content=True)
+        else:
+            yield from response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE)
+
+    def _conditional_headers(self, study_url: str) -> dict[str, str]:
+        """Build conditional GET headers from a study's previous download.
+
+        Args:
+            study_url: Study page URL (stable, unlike the pre-signed S3 URL)
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, or {} if the file is not on disk
+        """
+        previous = self.manifest.get(study_url)
+        if not previous or not os.path.exists(previous["path"]):
+            return {}
+
+        headers: dict[str, str] = {}
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+        return headers
+
+    def _manifest_path(self) -> str:
+        """Path of the download manifest inside the output directory."""
+        return os.path.join(self.output_dir, self.MANIFEST_FILENAME)
+
+    def _load_manifest(self) -> None:
+        """Load validators of previous downloads, ignoring a missing or corrupt manifest."""
+        try:
+            with open(self._manifest_path(), encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {}
+
+    def _save_manifest(self) -> None:
+        """Atomically write the download manifest."""
+        path = self._manifest_path()
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.out.warning(f"Could not save download manifest: {e}")
+
+    @staticmethod
+    def _build_download_result(filepath: str, pdf_info: PDFDownloadInfo) -> DownloadResult:
+        """Build the result record for a downloaded PDF."""
+        return DownloadResult(
+            local_path=filepath,
+            original_url=pdf_info.url,
+            study_url=pdf_info.study_url,
+            study_type=pdf_info.study_type,
+            study_date=pdf_info.study_date,
+            description=pdf_info.text,
+            study_index=pdf_info.study_index,
+        )
+
+    def _bootstrap_session(self) -> None:
+        """Copy the browser's authenticated cookies into the requests session."""
+        if not self.driver:
+            return
+
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+        self.session.headers.update({"User-Agent": self.USER_AGENT, "Accept-Language": "en-US"})
+
+    def _close_browser(self) -> None:
+        """Quit the browser, if running, to free Chrome's memory."""
+        driver, self.driver = self.driver, None
+        try:
+            if driver:
                 self.out.log("\U0001f512", "Closing browser...")
-                self.driver.quit()
+                driver.quit()
         except Exception as e:
             self.out.warning(f"Error closing browser: {type(e).__name__}: {e}")
 
+    def _cleanup_resources(self) -> None:
+        """Clean up browser and session resources."""
+        self._close_browser()
+
         try:
             if self.session:
                 self.session.close()
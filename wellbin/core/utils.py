@@ -96,6 +96,17 @@ WELLBIN_STUDY_TYPES=FhirStudy
 # Default: true
 WELLBIN_HEADLESS=true
 
+# PDFs to download concurrently once the study pages have been scanned
+# Options: 1 (sequential), or any positive integer
+# Each worker waits 0.2s between its downloads; more workers means more load on the server
+# Default: 1
+WELLBIN_DOWNLOAD_WORKERS=1
+
+# Show debug output while scraping (e.g. page link listings)
+# Options: true (verbose), false (quiet)
+# Default: false
+WELLBIN_DEBUG=false
+
 # =============================================================================
 # CONVERTER CONFIGURATION - Optional overrides for PDF to Markdown conversion
 # =============================================================================
@@ -122,6 +133,24 @@ WELLBIN_FILE_TYPE=all
 # Options: true (enhanced features), false (standard mode)
 # Default: false
 WELLBIN_ENHANCED_MODE=false
+
+# Worker processes used to convert PDFs in parallel
+# Options: 0 (one per CPU core), or any positive integer (1 = sequential)
+# Default: 0
+WELLBIN_CONVERT_WORKERS=0
+
+# Reuse cached extraction results for PDFs whose content has not changed
+# Cache location: $XDG_CACHE_HOME/wellbin (default ~/.cache/wellbin)
+# The cache holds extracted report text; entries unused for 30 days are
+# removed, and the least recently used ones once it exceeds 512 MB
+# Options: true (use cache), false (always re-extract)
+# Default: false
+WELLBIN_CONVERT_CACHE=false
+
+# Re-convert PDFs even when their markdown output is newer than the PDF
+# Options: true (always re-convert), false (skip up-to-date PDFs)
+# Default: false
+WELLBIN_CONVERT_FORCE=false
 """
 
     try: